@@ -1,11 +1,13 @@
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Query, status
 from typing import Dict, Iterable, Set, Union
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from app.core.cache import principal_cache, token_version_cache
 from app.core.security import verify_token
+from app.models.auth import EVENT_STREAM_PURPOSE, TokenClaims
 from app.models.enums import UserRole
 from app.models.user import User
-from app.models.enums import UserRole
 from app.services.auth_service import auth_service
+from app.services.org_service import org_service
 from app.core.config import settings
 
 security = HTTPBearer()
@@ -28,12 +30,18 @@ async def get_org_id(x_org_id: str | None = Header(None, alias="X-Org-Id")) -> s
 
     If the header is missing, fall back to the configured database name so
     unauthenticated flows (e.g., login/register) still work in local/dev setups.
+    Deactivated orgs are rejected; the check is served from the org cache.
     """
     if isinstance(x_org_id, str) and x_org_id.strip():
-        return x_org_id.strip()
+        org_id = x_org_id.strip()
+    else:
+        # Fallback to a sensible default (DB name) when header not provided.
+        org_id = settings.DB_NAME
 
-    # Fallback to a sensible default (DB name) when header not provided.
-    return settings.DB_NAME
+    org = await org_service.get_org_settings(org_id)
+    if not org.is_active:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Organization is inactive")
+    return org_id
 
 def _normalize_role(role: Union[UserRole, str]) -> UserRole:
     if isinstance(role, UserRole):
@@ -52,7 +60,14 @@ def _normalize_role(role: Union[UserRole, str]) -> UserRole:
 
     return UserRole.EMPLOYEE
 
-def _ensure_role_membership(user: User, allowed_roles: Iterable[UserRole]) -> User:
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+def _ensure_role_membership(user: Union[User, TokenClaims], allowed_roles: Iterable[UserRole]) -> Union[User, TokenClaims]:
     user_role = _normalize_role(user.role)
     allowed_set = {_normalize_role(role) for role in allowed_roles}
     if user_role not in allowed_set:
@@ -62,24 +77,97 @@ def _ensure_role_membership(user: User, allowed_roles: Iterable[UserRole]) -> Us
         )
     return user
 
+def _verify_access_token(token: str) -> dict:
+    payload = verify_token(token)
+    # Purpose-bound tokens (the event stream's) are not access tokens
+    if "purpose" in payload:
+        raise _credentials_exception()
+    return payload
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     org_id: str = Depends(get_org_id),
 ) -> User:
     """Get current authenticated user"""
-    payload = verify_token(credentials.credentials)
+    payload = _verify_access_token(credentials.credentials)
     user_id: str = payload.get("sub")
     if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_exception()
     
-    user = await auth_service.get_user_by_id(user_id, org_id=org_id)
+    # Single-flight, and a load racing `invalidate_principal` is not cached
+    cached_user = await principal_cache.get_or_load(
+        (org_id, user_id), lambda: auth_service.get_user_by_id(user_id, org_id=org_id)
+    )
+
+    # Hand each request its own copy so handlers can't mutate the cached entry.
+    user = cached_user.model_copy(deep=True)
     user.org_id = org_id
+    if "ver" in payload and payload["ver"] != user.token_version:
+        raise _credentials_exception()
     return user
 
+async def _ensure_current_token_version(user_id: str, org_id: str, token_version: int) -> None:
+    current_version = await token_version_cache.get_or_load(
+        (org_id, user_id), lambda: auth_service.get_token_version(user_id, org_id=org_id)
+    )
+    if current_version < 0 or current_version != token_version:
+        raise _credentials_exception()
+
+async def get_current_claims(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    org_id: str = Depends(get_org_id),
+) -> TokenClaims:
+    """Resolve the caller's role and org without loading the user document.
+
+    Claim-bearing tokens only need a (cached) token-version check; tokens that
+    carry just `sub` fall back to the full user lookup.
+    """
+    payload = _verify_access_token(credentials.credentials)
+    user_id = payload.get("sub")
+    if user_id is None:
+        raise _credentials_exception()
+
+    if "role" not in payload or "ver" not in payload:
+        user = await get_current_user(credentials, org_id=org_id)
+        return TokenClaims(
+            id=user.id,
+            org_id=user.org_id,
+            role=_normalize_role(user.role),
+            manager_id=user.manager_id,
+            token_version=user.token_version,
+        )
+
+    if payload.get("org_id") != org_id:
+        raise _credentials_exception()
+    await _ensure_current_token_version(user_id, org_id, payload["ver"])
+    return TokenClaims(
+        id=user_id,
+        org_id=org_id,
+        role=_normalize_role(payload["role"]),
+        manager_id=payload.get("manager_id"),
+        token_version=payload["ver"],
+    )
+
+async def get_stream_claims(token: str = Query(..., min_length=1)) -> TokenClaims:
+    """Authorize the feed event stream from the token in its URL.
+
+    The org comes from the token rather than `X-Org-Id`; revocation and org
+    deactivation are still checked when the stream connects.
+    """
+    payload = verify_token(token)
+    user_id, org_id = payload.get("sub"), payload.get("org_id")
+    if payload.get("purpose") != EVENT_STREAM_PURPOSE or not user_id or not org_id or "ver" not in payload:
+        raise _credentials_exception()
+    await get_org_id(org_id)
+    await _ensure_current_token_version(user_id, org_id, payload["ver"])
+    return TokenClaims(
+        id=user_id,
+        org_id=org_id,
+        role=_normalize_role(payload.get("role", UserRole.EMPLOYEE)),
+        manager_id=payload.get("manager_id"),
+        token_version=payload["ver"],
+    )
+
 async def get_current_admin_user(current_user: User = Depends(get_current_user)) -> User:
     """Get current user and verify admin role"""
     return _ensure_role_membership(current_user, PRIVILEGED_ROLES)
@@ -88,7 +176,15 @@ async def get_current_hr_admin_user(current_user: User = Depends(get_current_use
     """Get current user and verify HR admin role"""
     return _ensure_role_membership(current_user, {UserRole.HR_ADMIN})
 
-async def get_giver_scopes(current_user: User = Depends(get_current_user)) -> Dict[str, Set[UserRole]]:
+async def get_current_admin_claims(claims: TokenClaims = Depends(get_current_claims)) -> TokenClaims:
+    """Authorize a privileged caller from token claims alone"""
+    return _ensure_role_membership(claims, PRIVILEGED_ROLES)
+
+async def get_current_hr_admin_claims(claims: TokenClaims = Depends(get_current_claims)) -> TokenClaims:
+    """Authorize an HR admin caller from token claims alone"""
+    return _ensure_role_membership(claims, {UserRole.HR_ADMIN})
+
+async def get_giver_scopes(current_user: TokenClaims = Depends(get_current_claims)) -> Dict[str, Set[UserRole]]:
     """Derive the recognition giver scopes available to the caller."""
     user_role = _normalize_role(current_user.role)
     scopes: Dict[str, Set[UserRole]] = {
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1 import admin_analytics, admin_audit_logs, admin_redemptions, auth, users, rewards, recommendations, preferences, recognitions, orgs, points, settings
+from app.api.v1 import admin_analytics, admin_audit_logs, admin_metrics, admin_redemptions, auth, users, rewards, recommendations, preferences, recognitions, orgs, points, settings
 
 api_router = APIRouter()
 
@@ -14,4 +14,5 @@ api_router.include_router(points.router, prefix="/points", tags=["points"])
 api_router.include_router(admin_redemptions.router, prefix="/admin", tags=["admin-redemptions"])
 api_router.include_router(admin_analytics.router, prefix="/admin", tags=["admin-analytics"])
 api_router.include_router(admin_audit_logs.router, prefix="/admin", tags=["admin-audit-logs"])
+api_router.include_router(admin_metrics.router, prefix="/admin", tags=["admin-metrics"])
 api_router.include_router(orgs.router, prefix="/orgs", tags=["orgs"])
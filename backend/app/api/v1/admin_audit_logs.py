@@ -1,25 +1,31 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
 
-from app.api.dependencies import get_current_hr_admin_user
+from app.api.dependencies import get_current_hr_admin_claims
+from app.core.pagination import apply_keyset, decode_cursor, next_cursor
 from app.database.connection import get_database
 from app.models.audit_log import AuditLog
+from app.models.pagination import Page
 
 router = APIRouter()
 
+AUDIT_LOG_CURSOR = "audit_logs"
+AUDIT_LOG_SORT = (("timestamp", -1), ("id", -1))
 
-@router.get("/audit-logs", response_model=List[AuditLog], dependencies=[Depends(get_current_hr_admin_user)])
+
+@router.get("/audit-logs", response_model=Page[AuditLog], dependencies=[Depends(get_current_hr_admin_claims)])
 async def list_audit_logs(
     limit: int = Query(50, ge=1, le=200),
-    skip: int = Query(0, ge=0),
+    skip: int = Query(0, ge=0, deprecated=True, description="Use cursor; skip costs O(skip) on the server"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     actor_id: Optional[str] = Query(None),
     action: Optional[str] = Query(None),
     entity_type: Optional[str] = Query(None),
-    current_user=Depends(get_current_hr_admin_user),
-) -> List[AuditLog]:
+    current_user=Depends(get_current_hr_admin_claims),
+) -> Page[AuditLog]:
     db = await get_database()
     query = {"org_id": current_user.org_id}
     if actor_id:
@@ -28,7 +34,15 @@ async def list_audit_logs(
         query["action"] = action
     if entity_type:
         query["entity_type"] = entity_type
+    if cursor:
+        apply_keyset(query, AUDIT_LOG_SORT, decode_cursor(cursor, AUDIT_LOG_CURSOR, 2))
 
-    cursor = db.audit_logs.find(query).sort("timestamp", -1).skip(skip).limit(limit)
-    entries = await cursor.to_list(limit)
-    return [AuditLog(**entry) for entry in entries]
+    db_cursor = db.audit_logs.find(query).sort(list(AUDIT_LOG_SORT))
+    if not cursor and skip:
+        db_cursor = db_cursor.skip(skip)
+    entries = await db_cursor.limit(limit).to_list(limit)
+    items = [AuditLog(**entry) for entry in entries]
+    return Page(
+        items=items,
+        next_cursor=next_cursor(AUDIT_LOG_CURSOR, items, limit, lambda item: (item.timestamp, item.id)),
+    )
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies import get_current_hr_admin_claims
+from app.core.cache import (
+    feed_cache,
+    org_cache,
+    org_chart_cache,
+    principal_cache,
+    token_version_cache,
+    unknown_org_cache,
+)
+from app.core.events import event_broker
+from app.core.security import password_hash_pool
+from app.database.connection import pool_metrics
+from app.database.transactions import transaction_support
+from app.services.notification_outbox import notification_outbox
+from app.services.webhook_service import webhook_notifier
+
+router = APIRouter()
+
+
+@router.get("/metrics", dependencies=[Depends(get_current_hr_admin_claims)])
+async def get_runtime_metrics() -> Dict[str, Any]:
+    """Per-process runtime counters for caches, worker pools and the MongoDB connection pool."""
+    return {
+        "principal_cache": principal_cache.stats(),
+        "token_version_cache": token_version_cache.stats(),
+        "org_chart_cache": org_chart_cache.stats(),
+        "feed_cache": feed_cache.stats(),
+        "org_cache": org_cache.stats(),
+        "unknown_org_cache": unknown_org_cache.stats(),
+        "event_broker": event_broker.stats(),
+        "notification_outbox": notification_outbox.stats(),
+        "webhooks": webhook_notifier.stats(),
+        "password_hash_pool": password_hash_pool.stats(),
+        "mongo_pool": pool_metrics.stats(),
+        "transactions": transaction_support.stats(),
+    }
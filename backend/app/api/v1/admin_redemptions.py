@@ -11,6 +11,7 @@ from app.database.connection import get_database
 from app.models.recognition import RewardRedemption
 from app.models.enums import RedemptionStatus
 from app.services.email_service import email_notification_service
+from app.services.notification_outbox import EMAIL_SEND, notification_outbox, outbox_message
 from app.services.audit_log_service import audit_log_service
 
 router = APIRouter()
@@ -105,10 +106,13 @@ async def update_redemption(
             diff_summary={"status": {"from": previous_status, "to": updated.get("status")}},
         )
         recipient = await db.users.find_one({"id": updated["user_id"], "org_id": current_user.org_id}) or {}
-        email_notification_service.queue_redemption_status_change(
+        email = email_notification_service.redemption_status_change_payload(
             redemption=RewardRedemption(**updated),
             recipient=recipient,
             previous_status=previous_status,
         )
+        if email:
+            await notification_outbox.enqueue(db, [outbox_message(EMAIL_SEND, email, org_id=current_user.org_id)])
+            notification_outbox.wake()
 
     return RewardRedemption(**updated)
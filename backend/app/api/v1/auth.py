@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, status
 
-from app.models.auth import PasswordResetConfirm, PasswordResetRequest, PasswordResetResponse
+from app.models.auth import PasswordResetConfirm, PasswordResetRequest, PasswordResetResponse, RefreshTokenRequest
 from app.models.user import Token, UserCreate, UserLogin, UserResponse
 from app.services.auth_service import auth_service
 from app.api.dependencies import get_org_id
@@ -19,6 +19,18 @@ async def login(login_data: UserLogin, org_id: str = Depends(get_org_id)):
     return await auth_service.authenticate_user(login_data, org_id=org_id)
 
 
+@router.post("/refresh", response_model=Token)
+async def refresh(payload: RefreshTokenRequest):
+    """Exchange a refresh token for a new access token and rotated refresh token."""
+    return await auth_service.refresh_access_token(payload.refresh_token)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(payload: RefreshTokenRequest):
+    """Revoke a refresh token and every token rotated from it."""
+    await auth_service.revoke_refresh_token(payload.refresh_token)
+
+
 @router.post("/forgot-password", response_model=PasswordResetResponse)
 async def forgot_password(request: PasswordResetRequest, org_id: str = Depends(get_org_id)):
     """Initiate the password reset process for an email."""
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, status
 
-from app.models.org import OrgBootstrapRequest, OrgBootstrapResponse
+from app.api.dependencies import get_current_hr_admin_claims
+from app.models.auth import TokenClaims
+from app.models.org import OrgBootstrapRequest, OrgBootstrapResponse, OrgSettings, OrgSettingsUpdate
 from app.services.org_service import org_service
 
 router = APIRouter()
@@ -9,3 +11,16 @@ router = APIRouter()
 @router.post("/bootstrap", response_model=OrgBootstrapResponse, status_code=status.HTTP_201_CREATED)
 async def bootstrap_org(payload: OrgBootstrapRequest) -> OrgBootstrapResponse:
     return await org_service.bootstrap_org(payload)
+
+
+@router.get("/settings", response_model=OrgSettings, response_model_exclude={"exists"})
+async def get_org_settings(current_user: TokenClaims = Depends(get_current_hr_admin_claims)) -> OrgSettings:
+    return await org_service.get_org_settings(current_user.org_id)
+
+
+@router.patch("/settings", response_model=OrgSettings, response_model_exclude={"exists"})
+async def update_org_settings(
+    payload: OrgSettingsUpdate,
+    current_user: TokenClaims = Depends(get_current_hr_admin_claims),
+) -> OrgSettings:
+    return await org_service.update_org_settings(current_user.org_id, payload)
@@ -1,22 +1,32 @@
-from typing import List
+from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
 
 from app.api.dependencies import get_current_user
+from app.core.pagination import NEWEST_FIRST, apply_keyset, decode_cursor, next_cursor
+from app.models.pagination import Page
 from app.models.points_ledger import PointsLedgerEntry
 from app.models.user import User
 from app.database.connection import get_database
 
 router = APIRouter()
 
+LEDGER_CURSOR = "ledger"
 
-@router.get("/ledger/me", response_model=List[PointsLedgerEntry])
+
+@router.get("/ledger/me", response_model=Page[PointsLedgerEntry])
 async def get_my_points_ledger(
     limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     current_user: User = Depends(get_current_user),
-) -> List[PointsLedgerEntry]:
+) -> Page[PointsLedgerEntry]:
     db = await get_database()
-    records = await db.points_ledger.find(
-        {"org_id": current_user.org_id, "user_id": current_user.id}
-    ).sort("created_at", -1).limit(limit).to_list(limit)
-    return [PointsLedgerEntry(**record) for record in records]
+    query = {"org_id": current_user.org_id, "user_id": current_user.id}
+    if cursor:
+        apply_keyset(query, NEWEST_FIRST, decode_cursor(cursor, LEDGER_CURSOR, 2))
+    records = await db.points_ledger.find(query).sort(list(NEWEST_FIRST)).limit(limit).to_list(limit)
+    items = [PointsLedgerEntry(**record) for record in records]
+    return Page(
+        items=items,
+        next_cursor=next_cursor(LEDGER_CURSOR, items, limit, lambda item: (item.created_at, item.id)),
+    )
@@ -2,13 +2,18 @@ from collections import defaultdict, deque
 from time import monotonic
 from typing import Deque, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from app.api.dependencies import get_current_hr_admin_user, get_current_user
+from app.api.dependencies import get_current_claims, get_current_hr_admin_user, get_current_user, get_stream_claims
+from app.core.events import event_broker, format_sse
+from app.models.auth import StreamToken, TokenClaims
 from app.models.enums import RecognitionType
+from app.models.pagination import Page
 from app.models.recognition import (
     Recognition,
+    RecognitionBulkDecisionRequest,
+    RecognitionBulkDecisionResponse,
     RecognitionCreate,
     RecognitionEligibilityEntry,
     RecognitionEligibilityRequest,
@@ -17,9 +22,12 @@ from app.models.recognition import (
     RecognitionMessageAssistRequest,
     RecognitionMessageAssistResponse,
     RecognitionReactionToggleRequest,
+    RecognitionReactionToggleResponse,
+    RecognitionRecipientSearchResponse,
 )
 from app.models.user import User
 from app.core.config import settings
+from app.services.auth_service import auth_service
 from app.services.gemini_service import gemini_service
 from app.services.recognition_service import recognition_service
 
@@ -41,11 +49,22 @@ def _is_rate_limited(user_id: str) -> bool:
     return False
 
 
-@router.get("/recipients")
+@router.get("/recipients", deprecated=True)
 async def list_recipients(current_user: User = Depends(get_current_user)) -> dict:
+    """Superseded by /recipients/search; returns at most 500 teammates."""
     return await recognition_service.get_allowed_recipients(current_user)
 
 
+@router.get("/recipients/search", response_model=RecognitionRecipientSearchResponse)
+async def search_recipients(
+    q: str = Query(..., min_length=1, max_length=100, description="Name, email or department prefix"),
+    limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    current_user: User = Depends(get_current_user),
+) -> RecognitionRecipientSearchResponse:
+    return await recognition_service.search_recipients(current_user, q, limit=limit, cursor=cursor)
+
+
 @router.post("/eligibility", response_model=List[RecognitionEligibilityEntry])
 async def get_recipient_eligibility(
     payload: RecognitionEligibilityRequest,
@@ -62,12 +81,29 @@ async def send_recognition(
     return await recognition_service.create_recognition(current_user, payload)
 
 
-@router.get("/pending", response_model=List[Recognition])
+@router.get("/pending", response_model=Page[Recognition])
 async def list_pending_recognitions(
     limit: int = Query(100, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    current_user: User = Depends(get_current_hr_admin_user),
+) -> Page[Recognition]:
+    return await recognition_service.get_pending_recognitions(current_user, limit=limit, cursor=cursor)
+
+
+@router.post("/bulk-approve", response_model=RecognitionBulkDecisionResponse)
+async def bulk_approve_recognitions(
+    payload: RecognitionBulkDecisionRequest,
     current_user: User = Depends(get_current_hr_admin_user),
-) -> List[Recognition]:
-    return await recognition_service.get_pending_recognitions(current_user, limit=limit)
+) -> RecognitionBulkDecisionResponse:
+    return await recognition_service.bulk_approve_recognitions(payload.recognition_ids, current_user)
+
+
+@router.post("/bulk-reject", response_model=RecognitionBulkDecisionResponse)
+async def bulk_reject_recognitions(
+    payload: RecognitionBulkDecisionRequest,
+    current_user: User = Depends(get_current_hr_admin_user),
+) -> RecognitionBulkDecisionResponse:
+    return await recognition_service.bulk_reject_recognitions(payload.recognition_ids, current_user)
 
 
 @router.post("/{recognition_id}/approve", response_model=Recognition)
@@ -86,16 +122,16 @@ async def reject_recognition(
     return await recognition_service.reject_recognition(recognition_id, current_user)
 
 
-@router.post("/{recognition_id}/react", response_model=Recognition)
+@router.post("/{recognition_id}/react", response_model=RecognitionReactionToggleResponse)
 async def toggle_reaction(
     recognition_id: str,
     payload: RecognitionReactionToggleRequest,
     current_user: User = Depends(get_current_user),
-) -> Recognition:
+) -> RecognitionReactionToggleResponse:
     return await recognition_service.toggle_reaction(recognition_id, payload.emoji, current_user)
 
 
-@router.get("", response_model=List[RecognitionHistoryEntry])
+@router.get("", response_model=Page[RecognitionHistoryEntry])
 async def get_history(
     direction: Optional[str] = Query(
         "received", description="Filter by sent, received, or all recognitions"
@@ -104,25 +140,31 @@ async def get_history(
         None, description="Filter by recognition type"
     ),
     limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     current_user: User = Depends(get_current_user),
-) -> List[RecognitionHistoryEntry]:
+) -> Page[RecognitionHistoryEntry]:
     return await recognition_service.get_history(
         current_user,
         direction=direction,
         recognition_type=recognition_type,
         limit=limit,
+        cursor=cursor,
     )
 
 
-@router.get("/feed", response_model=List[RecognitionFeedEntry])
+@router.get("/feed", response_model=Page[RecognitionFeedEntry])
 async def get_public_feed(
-    search: Optional[str] = Query(None, description="Search recognitions by message or participant"),
+    search: Optional[str] = Query(
+        None,
+        max_length=200,
+        description="Full-text search over message, values tags and participant names, ranked by relevance",
+    ),
     value_tag: Optional[str] = Query(None, description="Filter by a values tag"),
     limit: int = Query(50, ge=1, le=50),
-    cursor: Optional[str] = Query(None, description="Pagination cursor in '<created_at>|<id>' format"),
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    skip: int = Query(0, ge=0, deprecated=True, description="Use cursor; skip costs O(skip) on the server"),
     current_user: User = Depends(get_current_user),
-) -> List[RecognitionFeedEntry]:
+) -> Page[RecognitionFeedEntry]:
     return await recognition_service.get_public_feed(
         current_user,
         search=search,
@@ -133,6 +175,44 @@ async def get_public_feed(
     )
 
 
+@router.post("/stream-token", response_model=StreamToken)
+async def create_stream_token(claims: TokenClaims = Depends(get_current_claims)) -> StreamToken:
+    """Short-lived token for `GET /stream?token=...` (EventSource cannot send headers)."""
+    return auth_service.issue_stream_token(claims)
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_feed_events(
+    request: Request,
+    claims: TokenClaims = Depends(get_stream_claims),
+) -> StreamingResponse:
+    """Server-sent events for the caller's org feed.
+
+    Authenticated by a token from `POST /stream-token`, passed as `?token=`;
+    a client that gets a 401 on reconnect should fetch a fresh one.
+
+    Events: `recognition.created` (a feed entry), `recognition.updated` (points
+    status after approval or rejection), `reaction.updated` (emoji count and
+    delta) and `resync` when the client fell behind and should refetch the feed.
+    """
+
+    async def events():
+        subscription = event_broker.subscribe(claims.org_id)
+        try:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                message = await subscription.get(timeout=settings.EVENT_STREAM_HEARTBEAT_SECONDS)
+                yield format_sse(message) if message is not None else ": keep-alive\n\n"
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/assist-message", response_model=RecognitionMessageAssistResponse)
 async def assist_message(
     payload: RecognitionMessageAssistRequest,
@@ -2,13 +2,16 @@ import csv
 import io
 import secrets
 from datetime import datetime
+from typing import Dict, Optional
 from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 
+from app.core.cache import invalidate_principal
+from app.core.search import user_search_fields
 from app.models.enums import UserRole
-from app.models.user import User, UserReportingUpdate, UserResponse, UserUpdate, UserCreate, OrgChartNode
-from app.models.auth import InviteResponse
+from app.models.user import User, UserReportingUpdate, UserResponse, UserUpdate, UserCreate, OrgChartNode, OrgChartSubtree
+from app.models.auth import BulkInviteEntry, BulkInviteRequest, BulkInviteResponse, InviteResponse
 from app.services.user_service import user_service
 from app.api.dependencies import ROLE_FALLBACKS, get_current_user, get_current_admin_user, get_current_hr_admin_user
 from app.services.auth_service import auth_service
@@ -30,6 +33,9 @@ def _parse_role(value: str | None) -> UserRole | None:
         return fallback
     return UserRole(normalized)
 
+def _build_invite_url(token: str, email: str) -> str:
+    return f"/accept-invite?token={quote(token)}&email={quote(email)}"
+
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(current_user: User = Depends(get_current_user)):
     """Get current user information"""
@@ -64,6 +70,24 @@ async def get_org_chart(current_user: User = Depends(get_current_hr_admin_user))
     return await user_service.get_org_chart(current_user.org_id)
 
 
+@router.get("/org-chart/subtree", response_model=OrgChartSubtree)
+async def get_org_chart_subtree(
+    root_id: Optional[str] = Query(None, description="Expand this user's reports; omit for top-level users"),
+    depth: int = Query(1, ge=1, le=5),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    current_user: User = Depends(get_current_hr_admin_user),
+):
+    """Get one page of an org chart subtree with child counts (HR admin only)."""
+    return await user_service.get_org_chart_subtree(
+        current_user.org_id,
+        root_id=root_id,
+        depth=depth,
+        limit=limit,
+        offset=offset,
+    )
+
+
 @router.post("/provision", response_model=UserResponse)
 async def provision_user(
     user_data: UserCreate,
@@ -101,9 +125,32 @@ async def invite_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
-    token, _expires_at = await auth_service.create_invite_token(user_id)
-    invite_url = f"/accept-invite?token={quote(token)}&email={quote(user_data['email'])}"
-    return InviteResponse(invite_url=invite_url)
+    token, _expires_at = await auth_service.create_invite_token(user_id, org_id=current_user.org_id)
+    return InviteResponse(invite_url=_build_invite_url(token, user_data["email"]))
+
+
+@router.post("/invites", response_model=BulkInviteResponse)
+async def invite_users(
+    payload: BulkInviteRequest,
+    current_user: User = Depends(get_current_admin_user),
+):
+    """Create invite links for many users at once, e.g. after a CSV import (admin only)."""
+    db = await get_database()
+    requested_ids = list(dict.fromkeys(payload.user_ids))
+    users = await db.users.find(
+        {"id": {"$in": requested_ids}, "org_id": current_user.org_id},
+        {"_id": 0, "id": 1, "email": 1},
+    ).to_list(len(requested_ids))
+    emails = {user["id"]: user["email"] for user in users}
+
+    tokens = await auth_service.create_invite_tokens(list(emails), org_id=current_user.org_id)
+    return BulkInviteResponse(
+        invites=[
+            BulkInviteEntry(user_id=user_id, email=emails[user_id], invite_url=_build_invite_url(token, emails[user_id]))
+            for user_id, (token, _expires_at) in tokens.items()
+        ],
+        not_found=[user_id for user_id in requested_ids if user_id not in emails],
+    )
 
 
 @router.put("/{user_id}/reporting", response_model=UserResponse)
@@ -243,13 +290,21 @@ async def import_users(
                     "department": department,
                     "manager_id": manager_id,
                     "updated_at": datetime.utcnow(),
+                    **user_search_fields(first_name, last_name, email, department),
                 }
                 if role is not None:
                     update_payload["role"] = role
-                await db.users.update_one(
-                    {"id": existing["id"], "org_id": current_user.org_id},
-                    {"$set": update_payload},
-                )
+                update: Dict[str, Dict[str, object]] = {"$set": update_payload}
+                # Role and manager are signed into claim-bearing access tokens;
+                # bumping the version revokes tokens issued before the change
+                # in every worker, not just this one.
+                if any(
+                    key in update_payload and existing.get(key) != update_payload[key]
+                    for key in ("role", "manager_id")
+                ):
+                    update["$inc"] = {"token_version": 1}
+                await db.users.update_one({"id": existing["id"], "org_id": current_user.org_id}, update)
+                invalidate_principal(current_user.org_id, existing["id"])
                 summary["updated"] += 1
             else:
                 password = secrets.token_urlsafe(12)
@@ -277,4 +332,9 @@ async def import_users(
                 }
             )
 
+    # Rows may arrive before their managers, so ancestry is recomputed once
+    # for the whole org instead of per row.
+    if summary["created"] or summary["updated"]:
+        await user_service.rebuild_manager_chains(current_user.org_id)
+
     return summary
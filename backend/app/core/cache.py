@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Optional, Set, Tuple, TypeVar
+
+from app.core.config import settings
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """In-process LRU cache with per-entry expiry and hit/miss counters.
+
+    The cache is only ever touched from the event loop thread, so no locking is
+    needed. A non-positive ``ttl_seconds`` or ``max_entries`` disables caching.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._loading: Dict[Hashable, "asyncio.Future[V]"] = {}
+        self._stale_loads: Set[Hashable] = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.coalesced = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0 and self._ttl_seconds > 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key: Hashable) -> Optional[V]:
+        """Return a live entry without touching LRU order or hit/miss counters."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self._clock():
+            return None
+        return entry[1]
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[V]],
+        *,
+        store_if: Optional[Callable[[V], bool]] = None,
+    ) -> V:
+        """Return the cached value, loading it once for all concurrent misses.
+
+        Callers that miss while a load for the same key is in flight await that
+        load instead of starting their own. A load that races `invalidate`, or
+        that `store_if` rejects, is still returned to its callers but is not
+        stored.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        pending = self._loading.get(key)
+        if pending is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The loading request was cancelled, not this one: load again.
+                return await self.get_or_load(key, loader, store_if=store_if)
+
+        future: "asyncio.Future[V]" = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark the exception retrieved when no other caller was waiting.
+            future.exception()
+            raise
+        else:
+            if key not in self._stale_loads and (store_if is None or store_if(value)):
+                self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            self._loading.pop(key, None)
+            self._stale_loads.discard(key)
+
+    def set(self, key: Hashable, value: V) -> None:
+        if not self.enabled:
+            return
+        self._entries[key] = (self._clock() + self._ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        if key in self._loading:
+            self._stale_loads.add(key)
+        if self._entries.pop(key, None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self._stale_loads.update(self._loading)
+        self._entries.clear()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.coalesced = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "coalesced": self.coalesced,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Authenticated principals keyed by (org_id, user_id). Every service that writes
+# to a user document must call `invalidate_principal`, but that only clears this
+# process: other workers may serve a copy up to PRINCIPAL_CACHE_TTL_SECONDS old.
+# Limits on mutable fields (balances, allowances) must therefore be enforced by
+# the write itself, not by checks against the cached user.
+principal_cache: TTLCache[Any] = TTLCache(
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+# Current token version per (org_id, user_id), used to honour revocation of
+# claim-bearing access tokens without loading the whole user document.
+# Inactive or missing users are stored as -1.
+token_version_cache: TTLCache[int] = TTLCache(
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_principal(org_id: Optional[str], user_id: Optional[str]) -> None:
+    if org_id and user_id:
+        principal_cache.invalidate((org_id, str(user_id)))
+        token_version_cache.invalidate((org_id, str(user_id)))
+
+
+# Reporting hierarchy snapshots keyed by org_id, backing the org chart APIs.
+# Writes that change a manager, role, name or department, or add users, must
+# call `invalidate_org_chart`; the TTL bounds staleness across processes.
+org_chart_cache: TTLCache[Any] = TTLCache(
+    max_entries=settings.ORG_CHART_CACHE_MAX_ORGS,
+    ttl_seconds=settings.ORG_CHART_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_org_chart(org_id: Optional[str]) -> None:
+    if org_id:
+        org_chart_cache.invalidate(org_id)
+
+
+# Rendered first page of each org's public recognition feed, keyed by org_id.
+# Recognition writes that change what the page shows call `invalidate_feed`
+# (reactions are patched in place instead).
+feed_cache: TTLCache[Any] = TTLCache(
+    max_entries=settings.FEED_CACHE_MAX_ORGS,
+    ttl_seconds=settings.FEED_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_feed(org_id: Optional[str]) -> None:
+    if org_id:
+        feed_cache.invalidate(org_id)
+
+
+# Org metadata and per-org settings keyed by org_id. Every write to an org
+# document must call `invalidate_org`; entries are shared, so callers must not
+# mutate them.
+org_cache: TTLCache[Any] = TTLCache(
+    max_entries=settings.ORG_CACHE_MAX_ORGS,
+    ttl_seconds=settings.ORG_CACHE_TTL_SECONDS,
+)
+
+# Unknown org ids (`exists=False` defaults), kept apart so that arbitrary
+# X-Org-Id values can only churn this short-lived cache, never evict real orgs.
+unknown_org_cache: TTLCache[Any] = TTLCache(
+    max_entries=settings.UNKNOWN_ORG_CACHE_MAX_ORGS,
+    ttl_seconds=settings.UNKNOWN_ORG_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_org(org_id: Optional[str]) -> None:
+    if org_id:
+        org_cache.invalidate(org_id)
+        unknown_org_cache.invalidate(org_id)
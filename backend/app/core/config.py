@@ -7,14 +7,113 @@ class Settings(BaseSettings):
     # Database
     MONGO_URL: str = "mongodb://localhost:27017"
     DB_NAME: str = "rewards_db"
+    # Connection pool (per process); MIN_POOL_SIZE connections are opened at startup
+    MONGO_MAX_POOL_SIZE: int = 100
+    MONGO_MIN_POOL_SIZE: int = 0
+    MONGO_MAX_IDLE_TIME_MS: Optional[int] = None
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: Optional[int] = None
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = 30000
+    MONGO_CONNECT_TIMEOUT_MS: int = 20000
+    # Comma-separated wire compressors in preference order, e.g. "zstd,snappy"
+    MONGO_COMPRESSORS: str = ""
+    # Build indexes after startup instead of before serving (skipped when the manifest is unchanged)
+    MONGO_BUILD_INDEXES_IN_BACKGROUND: bool = False
+    # Transactions retried on TransientTransactionError/WriteConflict with jittered backoff
+    MONGO_TRANSACTION_MAX_ATTEMPTS: int = 5
+    MONGO_TRANSACTION_BACKOFF_MS: int = 20
     
     # Security
     SECRET_KEY: Optional[str] = None
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Sign role/org/manager/token-version claims so role gates skip the user lookup
+    ACCESS_TOKEN_CLAIMS_ENABLED: bool = False
+    # Rotating refresh tokens; 0 disables issuing them
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 14
     PASSWORD_RESET_TOKEN_EXPIRE_MINUTES: int = 30
     EXPOSE_RESET_TOKEN_IN_RESPONSE: bool = False
     ENV: str = "development"
+
+    # Authenticated principal cache (per process); TTL of 0 disables it
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30.0
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+
+    # Per-process org chart hierarchy snapshots, one per org; TTL of 0 disables them
+    ORG_CHART_CACHE_TTL_SECONDS: float = 300.0
+    ORG_CHART_CACHE_MAX_ORGS: int = 100
+
+    # Per-process cache of each org's first feed page; TTL of 0 disables it
+    FEED_CACHE_TTL_SECONDS: float = 30.0
+    FEED_CACHE_MAX_ORGS: int = 1000
+    # Entries kept per org; first-page requests up to this limit are served from it
+    FEED_CACHE_PAGE_SIZE: int = 50
+
+    # Per-process cache of org metadata (webhooks, approval threshold, default
+    # points); TTL of 0 disables it
+    ORG_CACHE_TTL_SECONDS: float = 60.0
+    ORG_CACHE_MAX_ORGS: int = 1000
+    # Org ids with no org document (e.g. the DB_NAME fallback) are cached
+    # separately and briefly; TTL of 0 disables it
+    UNKNOWN_ORG_CACHE_TTL_SECONDS: float = 5.0
+    UNKNOWN_ORG_CACHE_MAX_ORGS: int = 1000
+
+    # Bulk approve/reject: ids accepted per request, and recognitions approved
+    # per transaction
+    BULK_DECISION_MAX_IDS: int = 100
+    BULK_APPROVAL_CHUNK_SIZE: int = 25
+
+    # Notification outbox dispatcher: handlers run concurrently, messages
+    # claimed per batch, retries back off exponentially up to MAX_ATTEMPTS
+    OUTBOX_CONCURRENCY: int = 8
+    OUTBOX_BATCH_SIZE: int = 50
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 1.0
+    OUTBOX_MAX_ATTEMPTS: int = 8
+    OUTBOX_RETRY_BASE_SECONDS: float = 2.0
+    OUTBOX_RETRY_MAX_SECONDS: float = 600.0
+    # How long a claimed message stays hidden from other dispatchers; renewed as
+    # each message starts, so it must cover one handler's worst case (a webhook:
+    # (WEBHOOK_MAX_RETRIES + 1) timeouts plus the retry delays, about 29s)
+    OUTBOX_LOCK_SECONDS: float = 60.0
+    # Shutdown waits this long for in-flight deliveries
+    OUTBOX_DRAIN_TIMEOUT_SECONDS: float = 10.0
+
+    # Webhook delivery: one pooled keep-alive client per process (HTTP/2 when
+    # the h2 package is installed), with a cap on concurrent requests per host.
+    # 429/5xx responses and transport errors are retried in place, honouring
+    # Retry-After up to WEBHOOK_RETRY_MAX_SECONDS; longer waits are left to the
+    # outbox backoff.
+    WEBHOOK_TIMEOUT_SECONDS: float = 3.0
+    WEBHOOK_MAX_CONNECTIONS: int = 100
+    WEBHOOK_MAX_CONNECTIONS_PER_HOST: int = 10
+    WEBHOOK_KEEPALIVE_SECONDS: float = 30.0
+    WEBHOOK_HTTP2: bool = True
+    WEBHOOK_MAX_RETRIES: int = 2
+    WEBHOOK_RETRY_BASE_SECONDS: float = 0.5
+    WEBHOOK_RETRY_MAX_SECONDS: float = 10.0
+    # Orgs with webhook digests enabled get one message per window (or per
+    # MAX_ITEMS recognitions, whichever comes first) instead of one per post
+    WEBHOOK_DIGEST_WINDOW_SECONDS: float = 60.0
+    WEBHOOK_DIGEST_MAX_ITEMS: int = 20
+
+    # Live feed event broker: "memory" (single worker) or "mongo" (workers share
+    # events through a capped collection)
+    EVENT_BROKER_BACKEND: str = "memory"
+    EVENT_BROKER_COLLECTION: str = "feed_events"
+    EVENT_BROKER_CAPPED_SIZE_BYTES: int = 16 * 1024 * 1024
+    # Events buffered per stream before a slow client is told to resync
+    EVENT_STREAM_QUEUE_SIZE: int = 100
+    # Comment line sent on idle streams so proxies keep them open
+    EVENT_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    # Lifetime of the token a browser EventSource passes in the stream URL (it
+    # cannot send headers); only checked when the stream connects
+    EVENT_STREAM_TOKEN_EXPIRE_SECONDS: int = 60
+
+    # bcrypt cost factor; run `python -m scripts.calibrate_bcrypt` to pick one
+    BCRYPT_ROUNDS: int = 12
+
+    # Dedicated bcrypt worker pool; requests beyond MAX_PENDING get a 503
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
     
     # API
     API_V1_STR: str = "/api/v1"
@@ -47,6 +146,17 @@ class Settings(BaseSettings):
             else:
                 raise ValueError("SECRET_KEY is required unless ENV=development.")
 
+        if self.MONGO_MIN_POOL_SIZE < 0 or (
+            self.MONGO_MAX_POOL_SIZE and self.MONGO_MIN_POOL_SIZE > self.MONGO_MAX_POOL_SIZE
+        ):
+            raise ValueError("MONGO_MIN_POOL_SIZE must be between 0 and MONGO_MAX_POOL_SIZE.")
+
+        if self.EVENT_BROKER_BACKEND not in {"memory", "mongo"}:
+            raise ValueError("EVENT_BROKER_BACKEND must be 'memory' or 'mongo'.")
+
+        if not 4 <= self.BCRYPT_ROUNDS <= 31:
+            raise ValueError("BCRYPT_ROUNDS must be between 4 and 31.")
+
         if isinstance(self.GEMINI_API_KEY, str) and not self.GEMINI_API_KEY.strip():
             self.GEMINI_API_KEY = None
 
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Set
+
+from pymongo import CursorType
+from pymongo.errors import CollectionInvalid, PyMongoError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Sent to a subscriber that fell too far behind; its queued events were dropped
+# and it should refetch the feed instead
+RESYNC_EVENT = "resync"
+
+Deliver = Callable[[Dict[str, Any]], None]
+
+
+class InMemoryBrokerBackend:
+    """Delivers published events straight to this process's subscribers."""
+
+    name = "memory"
+
+    def __init__(self) -> None:
+        self._deliver: Optional[Deliver] = None
+
+    async def start(self, deliver: Deliver, database: Any = None) -> None:
+        self._deliver = deliver
+
+    async def publish(self, message: Dict[str, Any]) -> None:
+        if self._deliver is not None:
+            self._deliver(message)
+
+    async def close(self) -> None:
+        self._deliver = None
+
+
+class MongoBrokerBackend:
+    """Shares events between workers through a capped collection.
+
+    Publishing inserts into the collection and every worker tails it with an
+    awaitable cursor, so an event reaches subscribers on all workers (the
+    publishing one included) in insertion order.
+
+    The tail resumes by natural order rather than by `_id`: ObjectIds minted
+    by different workers are only ordered to the second, so an `$gt` resume
+    would skip events inserted after the last one seen but with a smaller id.
+    """
+
+    name = "mongo"
+    # Pause before re-opening the tail (it also ends when the collection is empty)
+    retry_delay_seconds = 1.0
+
+    def __init__(self, collection_name: str, size_bytes: int) -> None:
+        self._collection_name = collection_name
+        self._size_bytes = size_bytes
+        self._collection: Any = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, deliver: Deliver, database: Any = None) -> None:
+        if database is None:
+            raise RuntimeError("The mongo event broker backend needs a database.")
+        try:
+            await database.create_collection(self._collection_name, capped=True, size=self._size_bytes)
+        except CollectionInvalid:
+            pass  # created by another worker
+        self._collection = database[self._collection_name]
+        self._task = asyncio.create_task(self._tail(deliver))
+
+    async def publish(self, message: Dict[str, Any]) -> None:
+        await self._collection.insert_one({**message, "published_at": datetime.utcnow()})
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _newest_id(self) -> Optional[Any]:
+        newest = await self._collection.find_one({}, {"_id": 1}, sort=[("$natural", -1)])
+        return newest["_id"] if newest is not None else None
+
+    async def _tail(self, deliver: Deliver) -> None:
+        # Only events published after startup; older ones are already in the feed
+        last_seen: Optional[Any] = None
+        started = False
+        while True:
+            try:
+                if not started:
+                    last_seen = await self._newest_id()
+                    started = True
+                elif last_seen is not None and await self._collection.find_one({"_id": last_seen}, {"_id": 1}) is None:
+                    # The capped collection wrapped while the tail was down, so
+                    # events were lost: every subscriber has to refetch
+                    logger.warning("Event stream tail on %s fell behind; resyncing", self._collection_name)
+                    deliver({"org_id": None, "type": RESYNC_EVENT, "data": {}})
+                    last_seen = await self._newest_id()
+
+                # Replay from the start in natural order and skip up to and
+                # including the last delivered event
+                catching_up = last_seen is not None
+                cursor = self._collection.find({}, cursor_type=CursorType.TAILABLE_AWAIT, sort=[("$natural", 1)])
+                async for document in cursor:
+                    document_id = document.pop("_id")
+                    if catching_up:
+                        catching_up = document_id != last_seen
+                        continue
+                    last_seen = document_id
+                    document.pop("published_at", None)
+                    deliver(document)
+            except PyMongoError:
+                logger.exception("Event stream tail on %s failed; retrying", self._collection_name)
+            await asyncio.sleep(self.retry_delay_seconds)
+
+
+class Subscription:
+    def __init__(self, broker: "EventBroker", org_id: str, max_queued: int) -> None:
+        self._broker = broker
+        self.org_id = org_id
+        self._queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=max(max_queued, 1))
+
+    def _offer(self, message: Dict[str, Any]) -> bool:
+        try:
+            self._queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait({"org_id": self.org_id, "type": RESYNC_EVENT, "data": {}})
+            return False
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Next event, or None if `timeout` passes first."""
+        if not self._queue.empty():
+            return self._queue.get_nowait()
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self._broker._unsubscribe(self)
+
+    async def __aenter__(self) -> "Subscription":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class EventBroker:
+    """Per-org pub/sub for live feed events.
+
+    Services publish `{org_id, type, data}` messages; the backend decides how
+    they reach subscribers (in process, or through MongoDB for several
+    workers). Every subscriber gets a bounded queue so a slow client cannot
+    hold events in memory; on overflow it gets a single resync event instead.
+    """
+
+    def __init__(self, backend: Any = None, *, max_queued: Optional[int] = None) -> None:
+        self.backend = backend or InMemoryBrokerBackend()
+        self._max_queued = max_queued if max_queued is not None else settings.EVENT_STREAM_QUEUE_SIZE
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._started = False
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.publish_failures = 0
+
+    async def start(self, database: Any = None) -> None:
+        await self.backend.start(self._deliver, database)
+        self._started = True
+
+    async def close(self) -> None:
+        await self.backend.close()
+        self._started = False
+
+    async def publish(self, org_id: str, event_type: str, data: Dict[str, Any]) -> None:
+        """Publish an event; failures are logged, never raised to the caller."""
+        if not self._started:
+            return
+        try:
+            await self.backend.publish({"org_id": org_id, "type": event_type, "data": data})
+            self.published += 1
+        except Exception:
+            self.publish_failures += 1
+            logger.exception("Failed to publish %s event for org %s", event_type, org_id)
+
+    def subscribe(self, org_id: str) -> Subscription:
+        subscription = Subscription(self, org_id, self._max_queued)
+        self._subscribers.setdefault(org_id, set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(subscription.org_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.org_id]
+
+    def _deliver(self, message: Dict[str, Any]) -> None:
+        org_id = message.get("org_id")
+        if org_id is None:
+            # Not tied to an org (a backend-wide resync): goes to every subscriber
+            subscriptions = [subscription for subscribers in self._subscribers.values() for subscription in subscribers]
+        else:
+            subscriptions = list(self._subscribers.get(org_id, ()))
+        for subscription in subscriptions:
+            if subscription._offer(message):
+                self.delivered += 1
+            else:
+                self.dropped += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend.name,
+            "orgs": len(self._subscribers),
+            "subscribers": sum(len(subscribers) for subscribers in self._subscribers.values()),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "publish_failures": self.publish_failures,
+        }
+
+
+def format_sse(message: Dict[str, Any]) -> str:
+    """Render a broker message as one server-sent event."""
+    data = json.dumps(message.get("data", {}), separators=(",", ":"))
+    return f"event: {message['type']}\ndata: {data}\n\n"
+
+
+def _build_backend() -> Any:
+    if settings.EVENT_BROKER_BACKEND == "mongo":
+        return MongoBrokerBackend(settings.EVENT_BROKER_COLLECTION, settings.EVENT_BROKER_CAPPED_SIZE_BYTES)
+    return InMemoryBrokerBackend()
+
+
+event_broker = EventBroker(_build_backend())
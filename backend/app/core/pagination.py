@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from fastapi import HTTPException, status
+
+T = TypeVar("T")
+
+# Sort specs for keyset pagination: (field, direction) pairs, last one unique.
+NEWEST_FIRST: Tuple[Tuple[str, int], ...] = (("created_at", -1), ("id", -1))
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return datetime.fromisoformat(value["d"])
+    return value
+
+
+def encode_cursor(kind: str, values: Sequence[Any]) -> str:
+    """Opaque cursor carrying the sort key of the last item a client has seen.
+
+    `kind` names the listing, so a cursor from one endpoint (or one sort order)
+    is rejected by another instead of silently skipping rows.
+    """
+    payload = json.dumps({"k": kind, "v": [_encode_value(value) for value in values]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, kind: str, size: int) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = [_decode_value(value) for value in payload["v"]]
+        valid = payload["k"] == kind and len(values) == size
+    except (ValueError, KeyError, TypeError, AttributeError):
+        valid = False
+    if not valid:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor format.")
+    return values
+
+
+def next_cursor(kind: str, items: Sequence[T], limit: int, key: Callable[[T], Sequence[Any]]) -> Optional[str]:
+    """Cursor for the page after `items`, or None when the page came back short.
+
+    Only for listings that return every fetched row; a full last page may
+    still be followed by one empty page. Listings that drop rows while
+    rendering use `keyset_page` instead.
+    """
+    if not items or len(items) < limit:
+        return None
+    return encode_cursor(kind, key(items[-1]))
+
+
+def keyset_page(
+    kind: str, records: Sequence[T], limit: int, key: Callable[[T], Sequence[Any]]
+) -> Tuple[List[T], Optional[str]]:
+    """Split a `limit + 1` fetch into this page's raw rows and the next cursor.
+
+    Whether another page exists is decided by the extra row, and the cursor
+    is taken from the last raw row, so rows the caller skips while rendering
+    can neither end paging early nor be fetched again.
+    """
+    rows = list(records[:limit])
+    if len(records) <= limit or not rows:
+        return rows, None
+    return rows, encode_cursor(kind, key(rows[-1]))
+
+
+def apply_keyset(query: Dict[str, Any], sort: Sequence[Tuple[str, int]], values: Sequence[Any]) -> None:
+    """Restrict `query` to rows strictly after `values` in `sort` order.
+
+    The leading field also gets a plain range so the planner can bound the
+    index scan; the `$or` only breaks ties on the remaining fields.
+    """
+    lead_field, lead_direction = sort[0]
+    lead_bound = {"$lte" if lead_direction < 0 else "$gte": values[0]}
+    existing = query.get(lead_field)
+    query[lead_field] = {**existing, **lead_bound} if isinstance(existing, dict) else lead_bound
+
+    clauses: List[Dict[str, Any]] = []
+    for position, (field, direction) in enumerate(sort):
+        clause = {sort[index][0]: values[index] for index in range(position)}
+        clause[field] = {"$lt" if direction < 0 else "$gt": values[position]}
+        clauses.append(clause)
+    query.setdefault("$and", []).append({"$or": clauses})
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Dict, List, Optional
+
+# Prefixes up to this length are stored for equality lookups; longer queries
+# match on the stored full terms with an anchored regex after the index seek.
+SEARCH_PREFIX_MAX_LENGTH = 12
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_search_text(value: Optional[str]) -> str:
+    """Lowercase, strip accents and collapse whitespace for prefix matching."""
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _WHITESPACE.sub(" ", stripped.casefold()).strip()
+
+
+def _search_terms(first_name: str, last_name: str, email: str, department: str) -> List[str]:
+    terms = [first_name, last_name, email, department]
+    terms.extend(f"{first} {second}" for first, second in ((first_name, last_name), (last_name, first_name)))
+    terms.append(email.split("@", 1)[0])
+    # Each word on its own, so "Mary Ann" is found by "ann" and "Customer
+    # Success" by "success"
+    for value in (first_name, last_name, department):
+        terms.extend(value.split(" "))
+    return [term.strip() for term in terms if term.strip()]
+
+
+def user_search_fields(
+    first_name: Optional[str],
+    last_name: Optional[str],
+    email: Optional[str],
+    department: Optional[str] = None,
+) -> Dict[str, object]:
+    """Derived fields backing recipient typeahead.
+
+    `search_prefixes` holds every prefix (up to SEARCH_PREFIX_MAX_LENGTH) of
+    every term plus the full terms; `search_name` is the "last first" sort key.
+    """
+    first, last = normalize_search_text(first_name), normalize_search_text(last_name)
+    terms = _search_terms(first, last, normalize_search_text(email), normalize_search_text(department))
+    prefixes = set(terms)
+    for term in terms:
+        prefixes.update(term[:length].rstrip() for length in range(1, min(len(term), SEARCH_PREFIX_MAX_LENGTH) + 1))
+    return {
+        "search_name": f"{last} {first}".strip(),
+        "search_prefixes": sorted(prefixes),
+    }
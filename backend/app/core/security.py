@@ -1,18 +1,127 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, TypeVar
 import bcrypt
 import jwt
 from fastapi import HTTPException, status
 from app.core.config import settings
 
-def hash_password(password: str) -> str:
-    """Hash a password using bcrypt"""
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+T = TypeVar("T")
+
+def hash_password(password: str, rounds: Optional[int] = None) -> str:
+    """Hash a password using bcrypt at the configured cost"""
+    salt = bcrypt.gensalt(rounds=rounds or settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
 
 def verify_password(password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
     return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
 
+def get_hash_rounds(hashed_password: str) -> Optional[int]:
+    """Return the cost factor encoded in a bcrypt hash (`$2b$<cost>$...`)"""
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Whether a stored hash was made with a different cost than configured"""
+    return get_hash_rounds(hashed_password) != settings.BCRYPT_ROUNDS
+
+
+class PasswordHashPool:
+    """Bounded thread pool for bcrypt work.
+
+    bcrypt releases the GIL while hashing, so a small dedicated pool keeps the
+    event loop free without letting a login storm queue unbounded CPU work.
+    Callers beyond `max_pending` get a 503 instead of waiting.
+    """
+
+    def __init__(self, *, max_workers: int, max_pending: int) -> None:
+        self._max_workers = max(1, max_workers)
+        self._max_pending = max(1, max_pending)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.peak_pending = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="password-hash",
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        if self._pending >= self._max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication is busy, please retry shortly",
+                headers={"Retry-After": "1"},
+            )
+
+        self._pending += 1
+        self.submitted += 1
+        self.peak_pending = max(self.peak_pending, self._pending)
+        queued_at = time.perf_counter()
+
+        def _timed_call() -> tuple[T, float, float]:
+            started_at = time.perf_counter()
+            result = func(*args)
+            return result, started_at, time.perf_counter()
+
+        try:
+            loop = asyncio.get_running_loop()
+            result, started_at, finished_at = await loop.run_in_executor(self._get_executor(), _timed_call)
+        finally:
+            self._pending -= 1
+
+        self.completed += 1
+        self.total_wait_seconds += started_at - queued_at
+        self.total_run_seconds += finished_at - started_at
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        completed = self.completed or 1
+        return {
+            "max_workers": self._max_workers,
+            "max_pending": self._max_pending,
+            "pending": self._pending,
+            "peak_pending": self.peak_pending,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.total_wait_seconds * 1000 / completed, 2),
+            "avg_run_ms": round(self.total_run_seconds * 1000 / completed, 2),
+        }
+
+
+password_hash_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the bounded bcrypt pool"""
+    return await password_hash_pool.run(hash_password, password)
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    """Verify a password on the bounded bcrypt pool"""
+    return await password_hash_pool.run(verify_password, password, hashed_password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
     to_encode = data.copy()
@@ -34,4 +143,4 @@ def verify_token(token: str) -> dict:
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
-        )
\ No newline at end of file
+        )
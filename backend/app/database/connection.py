@@ -1,71 +1,218 @@
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+
 from app.core.config import settings
+from app.database.indexes import INDEX_MANIFEST, INDEX_MANIFEST_VERSION, manifest_hash
+from app.database.transactions import detect_transaction_support
+
+logger = logging.getLogger(__name__)
+
+# app_metadata document recording the last applied index manifest
+INDEX_MANIFEST_DOC_ID = "index_manifest"
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Collects connection pool counters and checkout wait times.
+
+    pymongo calls listeners from the driver's worker threads (Motor runs every
+    operation on its executor), so counters are guarded by a lock and checkout
+    start times are tracked per thread.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.open_connections = 0
+            self.in_use = 0
+            self.max_in_use = 0
+            self.checkouts = 0
+            self.checkout_failures = 0
+            self.checkout_wait_ms_total = 0.0
+            self.checkout_wait_ms_max = 0.0
+            self.pools_cleared = 0
+
+    def _elapsed_ms(self) -> float:
+        started_at = getattr(self._local, "checkout_started_at", None)
+        self._local.checkout_started_at = None
+        if started_at is None:
+            return 0.0
+        return (time.perf_counter() - started_at) * 1000
+
+    def pool_created(self, event) -> None:
+        pass
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        with self._lock:
+            self.pools_cleared += 1
+
+    def pool_closed(self, event) -> None:
+        pass
+
+    def connection_created(self, event) -> None:
+        with self._lock:
+            self.open_connections += 1
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_closed(self, event) -> None:
+        with self._lock:
+            self.open_connections = max(0, self.open_connections - 1)
+
+    def connection_check_out_started(self, event) -> None:
+        self._local.checkout_started_at = time.perf_counter()
+
+    def connection_check_out_failed(self, event) -> None:
+        self._elapsed_ms()
+        with self._lock:
+            self.checkout_failures += 1
+
+    def connection_checked_out(self, event) -> None:
+        wait_ms = self._elapsed_ms()
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+            self.checkout_wait_ms_total += wait_ms
+            self.checkout_wait_ms_max = max(self.checkout_wait_ms_max, wait_ms)
+
+    def connection_checked_in(self, event) -> None:
+        with self._lock:
+            self.in_use = max(0, self.in_use - 1)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_pool_size": settings.MONGO_MAX_POOL_SIZE,
+                "min_pool_size": settings.MONGO_MIN_POOL_SIZE,
+                "open_connections": self.open_connections,
+                "in_use": self.in_use,
+                "max_in_use": self.max_in_use,
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "checkout_wait_ms_avg": (
+                    round(self.checkout_wait_ms_total / self.checkouts, 3) if self.checkouts else 0.0
+                ),
+                "checkout_wait_ms_max": round(self.checkout_wait_ms_max, 3),
+                "pools_cleared": self.pools_cleared,
+            }
+
+
+pool_metrics = PoolMetricsListener()
+
 
 class Database:
     client: AsyncIOMotorClient = None
     database = None
+    index_build_task: Optional[asyncio.Task] = None
 
 db = Database()
 
 async def get_database():
     return db.database
 
-async def ensure_indexes(database=None) -> None:
-    """Ensure required indexes exist for core collections."""
+async def ensure_indexes(database=None, *, force: bool = False) -> bool:
+    """Apply INDEX_MANIFEST, skipping the work when its hash is already stored.
+
+    Each collection gets a single `create_indexes` call and collections are
+    built concurrently. Returns True when indexes were (re)applied.
+    """
     # Avoid truth-value testing of pymongo Database objects (they raise
     # NotImplementedError when used in boolean contexts). Compare explicitly
     # against None instead.
     target_db = database if database is not None else db.database
     if target_db is None:
-        return
+        return False
 
-    rewards = target_db.rewards
-    await rewards.create_index("org_id")
-    await rewards.create_index("is_active")
-    await rewards.create_index("is_popular")
-    await rewards.create_index("rating")
-    await rewards.create_index("created_at")
-    await rewards.create_index("category")
-    await rewards.create_index("reward_type")
-    await rewards.create_index("prices.INR")
-    await rewards.create_index("prices.USD")
-    await rewards.create_index("prices.EUR")
-
-    recognitions = target_db.recognitions
-    await recognitions.create_index("org_id")
-    await recognitions.create_index("created_at")
-    await recognitions.create_index("is_public")
-    await recognitions.create_index("from_user_id")
-    await recognitions.create_index("to_user_ids")
-
-    redemptions = target_db.redemptions
-    await redemptions.create_index("org_id")
-    await redemptions.create_index([("user_id", 1), ("redeemed_at", 1)])
-
-    points_ledger = target_db.points_ledger
-    await points_ledger.create_index("org_id")
-    await points_ledger.create_index([("user_id", 1), ("created_at", -1)])
-
-    users = target_db.users
-    await users.create_index("org_id")
-
-    orgs = target_db.orgs
-    await orgs.create_index("domain", unique=True)
-
-    audit_logs = target_db.audit_logs
-    await audit_logs.create_index("org_id")
-    await audit_logs.create_index("actor_id")
-    await audit_logs.create_index("action")
-    await audit_logs.create_index("timestamp")
+    current_hash = manifest_hash()
+    if not force:
+        applied = await target_db.app_metadata.find_one({"id": INDEX_MANIFEST_DOC_ID})
+        if applied and applied.get("hash") == current_hash:
+            logger.info("Index manifest unchanged (%s); skipping index build", current_hash[:12])
+            return False
+
+    await asyncio.gather(
+        *(target_db[collection].create_indexes(models) for collection, models in INDEX_MANIFEST.items())
+    )
+    # Only recorded once every build succeeded, so a failed build retries on next boot.
+    await target_db.app_metadata.update_one(
+        {"id": INDEX_MANIFEST_DOC_ID},
+        {"$set": {
+            "hash": current_hash,
+            "version": INDEX_MANIFEST_VERSION,
+            "applied_at": datetime.utcnow(),
+        }},
+        upsert=True,
+    )
+    logger.info("Applied index manifest %s", current_hash[:12])
+    return True
+
+
+async def _ensure_indexes_in_background(database) -> None:
+    try:
+        await ensure_indexes(database)
+    except Exception:
+        logger.exception("Background index build failed; it will be retried on next startup")
+
+
+def client_options() -> Dict[str, Any]:
+    """Motor client keyword arguments built from the pool settings."""
+    options: Dict[str, Any] = {
+        "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+        "serverSelectionTimeoutMS": settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": settings.MONGO_CONNECT_TIMEOUT_MS,
+        "event_listeners": [pool_metrics],
+    }
+    if settings.MONGO_MAX_IDLE_TIME_MS is not None:
+        options["maxIdleTimeMS"] = settings.MONGO_MAX_IDLE_TIME_MS
+    if settings.MONGO_WAIT_QUEUE_TIMEOUT_MS is not None:
+        options["waitQueueTimeoutMS"] = settings.MONGO_WAIT_QUEUE_TIMEOUT_MS
+    compressors = [name.strip() for name in settings.MONGO_COMPRESSORS.split(",") if name.strip()]
+    if compressors:
+        options["compressors"] = ",".join(compressors)
+    return options
+
+
+async def warm_up_pool(database, connections: int) -> None:
+    """Open `connections` pooled sockets up front with concurrent pings.
+
+    pymongo only fills minPoolSize in the background, so without this the first
+    burst of requests after a deploy pays the TCP/TLS/auth handshake.
+    """
+    if connections <= 0:
+        return
+    await asyncio.gather(*(database.command("ping") for _ in range(connections)))
 
 
 async def connect_to_mongo():
     """Create database connection"""
-    db.client = AsyncIOMotorClient(settings.MONGO_URL)
+    db.client = AsyncIOMotorClient(settings.MONGO_URL, **client_options())
     db.database = db.client[settings.DB_NAME]
-    await ensure_indexes(db.database)
+    await warm_up_pool(db.database, settings.MONGO_MIN_POOL_SIZE)
+    await detect_transaction_support(db.database)
+    if settings.MONGO_BUILD_INDEXES_IN_BACKGROUND:
+        db.index_build_task = asyncio.create_task(_ensure_indexes_in_background(db.database))
+    else:
+        await ensure_indexes(db.database)
 
 async def close_mongo_connection():
     """Close database connection"""
+    if db.index_build_task and not db.index_build_task.done():
+        db.index_build_task.cancel()
     if db.client:
         db.client.close()
@@ -0,0 +1,131 @@
+import hashlib
+import json
+from typing import Dict, List
+
+from pymongo import ASCENDING as ASC, DESCENDING as DESC, TEXT, IndexModel
+
+# Bump when changing index options that pymongo does not put in the index
+# document (none today); any edit to the manifest below already changes its hash.
+INDEX_MANIFEST_VERSION = 1
+
+# Every tenant index is led by org_id because every tenant query filters on it;
+# the remaining keys follow equality, then sort, then range, matching the
+# service queries noted next to each index.
+INDEX_MANIFEST: Dict[str, List[IndexModel]] = {
+    "users": [
+        # get_current_user, update_* and every `{"id", "org_id"}` lookup
+        IndexModel([("org_id", ASC), ("id", ASC)], unique=True),
+        # register, login, CSV import and manager-by-email lookups
+        IndexModel([("org_id", ASC), ("email", ASC)], unique=True),
+        # legacy login fallback for users created before org_id existed
+        IndexModel([("email", ASC)]),
+        # org chart children
+        IndexModel([("org_id", ASC), ("manager_id", ASC)]),
+        # downline membership and listing (multikey over ancestors)
+        IndexModel([("org_id", ASC), ("manager_chain", ASC)]),
+        # recipient typeahead: one prefix by equality, keyset on (search_name, id)
+        IndexModel([
+            ("org_id", ASC), ("is_active", ASC), ("search_prefixes", ASC), ("search_name", ASC), ("id", ASC),
+        ]),
+    ],
+    "rewards": [
+        IndexModel([("org_id", ASC), ("id", ASC)], unique=True),
+        # catalog listing by category, and category-preferring recommendations
+        # (the trailing sort keys let a `category: {$in: [...]}` use SORT_MERGE)
+        IndexModel([
+            ("org_id", ASC), ("is_active", ASC), ("category", ASC),
+            ("is_popular", DESC), ("rating", DESC), ("created_at", DESC),
+        ]),
+        # recommendations and gift suggestions sorted by popularity then rating
+        IndexModel([
+            ("org_id", ASC), ("is_active", ASC), ("is_popular", DESC), ("rating", DESC), ("created_at", DESC),
+        ]),
+    ],
+    "recognitions": [
+        IndexModel([("org_id", ASC), ("id", ASC)], unique=True),
+        # get_public_feed keyset pagination on (created_at, id)
+        IndexModel([("org_id", ASC), ("is_public", ASC), ("created_at", DESC), ("id", DESC)]),
+        # get_public_feed search; $text needs equality on both prefix keys, so
+        # each org's public posts are a separate slice of the index
+        IndexModel(
+            [
+                ("org_id", ASC), ("is_public", ASC),
+                ("message", TEXT), ("values_tags", TEXT),
+                ("from_user_snapshot.first_name", TEXT), ("from_user_snapshot.last_name", TEXT),
+                ("to_user_snapshots.first_name", TEXT), ("to_user_snapshots.last_name", TEXT),
+            ],
+            name="recognition_feed_text",
+            default_language="english",
+            weights={
+                "message": 1,
+                "values_tags": 2,
+                "from_user_snapshot.first_name": 2,
+                "from_user_snapshot.last_name": 2,
+                "to_user_snapshots.first_name": 2,
+                "to_user_snapshots.last_name": 2,
+            },
+        ),
+        # get_pending_recognitions; the trailing id keys in this and the indexes
+        # below serve keyset pagination on (created_at, id)
+        IndexModel([("org_id", ASC), ("status", ASC), ("created_at", DESC), ("id", DESC)]),
+        # get_history sent / received (the "all" $or uses both)
+        IndexModel([("org_id", ASC), ("from_user_id", ASC), ("created_at", DESC), ("id", DESC)]),
+        IndexModel([("org_id", ASC), ("to_user_ids", ASC), ("created_at", DESC), ("id", DESC)]),
+    ],
+    "redemptions": [
+        IndexModel([("org_id", ASC), ("id", ASC)], unique=True),
+        # a user's redemption history, newest first
+        IndexModel([("org_id", ASC), ("user_id", ASC), ("redeemed_at", DESC)]),
+        # admin redemption queue, with and without a status filter
+        IndexModel([("org_id", ASC), ("status", ASC), ("redeemed_at", ASC)]),
+        IndexModel([("org_id", ASC), ("redeemed_at", ASC)]),
+    ],
+    "points_ledger": [
+        IndexModel([("org_id", ASC), ("user_id", ASC), ("created_at", DESC), ("id", DESC)]),
+    ],
+    "orgs": [
+        IndexModel([("id", ASC)], unique=True),
+        IndexModel([("domain", ASC)], unique=True),
+    ],
+    "refresh_tokens": [
+        IndexModel([("token_hash", ASC)], unique=True),
+        IndexModel([("family_id", ASC)]),
+        IndexModel([("expires_at", ASC)], expireAfterSeconds=0),
+    ],
+    "user_tokens": [
+        IndexModel([("token_hash", ASC)], unique=True),
+        IndexModel([("org_id", ASC), ("user_id", ASC), ("purpose", ASC)], unique=True),
+        IndexModel([("expires_at", ASC)], expireAfterSeconds=0),
+    ],
+    "recognition_reactions": [
+        # toggle_reaction by key, and the caller's reactions on a feed page
+        # (recognition_id $in) for reacted_by_me
+        IndexModel([("org_id", ASC), ("user_id", ASC), ("recognition_id", ASC), ("emoji", ASC)], unique=True),
+    ],
+    "notification_outbox": [
+        # dispatcher claims: due pending messages, oldest first
+        IndexModel([("status", ASC), ("available_at", ASC)]),
+        # appending to an org's open webhook digest
+        IndexModel([("org_id", ASC), ("kind", ASC), ("status", ASC)]),
+        # permanently failed messages expire after a retention period
+        IndexModel([("expires_at", ASC)], expireAfterSeconds=0),
+    ],
+    "audit_logs": [
+        # list_audit_logs, newest first, optionally filtered by one field
+        IndexModel([("org_id", ASC), ("timestamp", DESC), ("id", DESC)]),
+        IndexModel([("org_id", ASC), ("actor_id", ASC), ("timestamp", DESC), ("id", DESC)]),
+        IndexModel([("org_id", ASC), ("action", ASC), ("timestamp", DESC), ("id", DESC)]),
+        IndexModel([("org_id", ASC), ("entity_type", ASC), ("timestamp", DESC), ("id", DESC)]),
+    ],
+}
+
+
+def manifest_hash(manifest: Dict[str, List[IndexModel]] = INDEX_MANIFEST) -> str:
+    """Stable digest of the manifest; key order inside each index is preserved."""
+    payload = [INDEX_MANIFEST_VERSION] + [
+        [collection, [[list(model.document["key"].items()), {
+            option: value for option, value in model.document.items() if option != "key"
+        }] for model in models]]
+        for collection, models in sorted(manifest.items())
+    ]
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
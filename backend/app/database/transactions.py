@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import random
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from pymongo.errors import OperationFailure, PyMongoError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+WRITE_CONFLICT = 112
+MAX_BACKOFF_MS = 1000
+MAX_COMMIT_ATTEMPTS = 3
+
+
+class TransactionSupport:
+    """Process-wide record of whether the deployment supports transactions.
+
+    Detected once (at startup, or lazily on first use) from the `hello`
+    response: only replica set members and mongos routers accept them, so a
+    standalone mongod never opens a session that is bound to fail.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.supported: Optional[bool] = None
+        self.committed = 0
+        self.retries = 0
+        self.fallbacks = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "supported": self.supported,
+            "committed": self.committed,
+            "retries": self.retries,
+            "fallbacks": self.fallbacks,
+        }
+
+
+transaction_support = TransactionSupport()
+
+
+def _is_transaction_unsupported(error: OperationFailure) -> bool:
+    if error.code == 20:
+        return True
+    return "Transaction numbers are only allowed" in str(error)
+
+
+def _is_retryable(error: PyMongoError) -> bool:
+    if error.has_error_label("TransientTransactionError"):
+        return True
+    return isinstance(error, OperationFailure) and error.code == WRITE_CONFLICT
+
+
+def _backoff_seconds(attempt: int) -> float:
+    """Full-jitter exponential backoff, so contending writers spread out."""
+    ceiling_ms = min(MAX_BACKOFF_MS, settings.MONGO_TRANSACTION_BACKOFF_MS * 2 ** (attempt - 1))
+    return random.uniform(0, ceiling_ms) / 1000
+
+
+async def detect_transaction_support(database) -> bool:
+    client = getattr(database, "client", None)
+    supported = False
+    if client is not None:
+        try:
+            hello = await database.command("hello")
+        except (PyMongoError, AttributeError):
+            hello = {}
+        supported = bool(
+            hello.get("logicalSessionTimeoutMinutes") is not None
+            and (hello.get("setName") or hello.get("msg") == "isdbgrid")
+        )
+    transaction_support.supported = supported
+    logger.info("MongoDB transactions %s", "enabled" if supported else "unavailable; using compensating writes")
+    return supported
+
+
+async def _commit(session) -> None:
+    for attempt in range(1, MAX_COMMIT_ATTEMPTS + 1):
+        try:
+            await session.commit_transaction()
+            return
+        except PyMongoError as exc:
+            if attempt == MAX_COMMIT_ATTEMPTS or not exc.has_error_label("UnknownTransactionCommitResult"):
+                raise
+
+
+async def _abort(session) -> None:
+    if not session.in_transaction:
+        return
+    try:
+        await session.abort_transaction()
+    except PyMongoError:
+        pass
+
+
+async def run_in_transaction(
+    database,
+    work: Callable[[Any], Awaitable[T]],
+    *,
+    fallback: Optional[Callable[[], Awaitable[T]]] = None,
+) -> T:
+    """Run `work(session)` as one transaction, retrying transient conflicts.
+
+    TransientTransactionError and WriteConflict abort the attempt and retry the
+    whole unit with jittered backoff, up to MONGO_TRANSACTION_MAX_ATTEMPTS. Any
+    other error aborts and propagates. Without transaction support `fallback()`
+    runs instead (for writes that need compensation), or `work(None)`.
+    """
+    if transaction_support.supported is None:
+        await detect_transaction_support(database)
+
+    if transaction_support.supported:
+        client = database.client
+        async with await client.start_session() as session:
+            for attempt in range(1, settings.MONGO_TRANSACTION_MAX_ATTEMPTS + 1):
+                session.start_transaction()
+                try:
+                    result = await work(session)
+                    await _commit(session)
+                except PyMongoError as exc:
+                    await _abort(session)
+                    if isinstance(exc, OperationFailure) and _is_transaction_unsupported(exc):
+                        transaction_support.supported = False
+                        break
+                    if not _is_retryable(exc) or attempt == settings.MONGO_TRANSACTION_MAX_ATTEMPTS:
+                        raise
+                    transaction_support.retries += 1
+                    await asyncio.sleep(_backoff_seconds(attempt))
+                except BaseException:
+                    await _abort(session)
+                    raise
+                else:
+                    transaction_support.committed += 1
+                    return result
+
+    transaction_support.fallbacks += 1
+    if fallback is not None:
+        return await fallback()
+    return await work(None)
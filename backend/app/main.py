@@ -11,7 +11,11 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1 import api_router
 from app.core.config import settings
-from app.database.connection import close_mongo_connection, connect_to_mongo
+from app.core.events import event_broker
+from app.core.security import password_hash_pool
+from app.database.connection import close_mongo_connection, connect_to_mongo, db
+from app.services.notification_outbox import notification_outbox
+from app.services.webhook_service import webhook_notifier
 
 request_id_context: contextvars.ContextVar[str] = contextvars.ContextVar(
     "request_id",
@@ -61,10 +65,17 @@ async def lifespan(app: FastAPI):
     # Startup
     await connect_to_mongo()
     logger.info("Connected to MongoDB")
+    await event_broker.start(db.database)
+    webhook_notifier.start()
+    notification_outbox.start(db.database)
     yield
     # Shutdown
+    await notification_outbox.drain()
+    await webhook_notifier.close()
+    await event_broker.close()
     await close_mongo_connection()
     logger.info("Disconnected from MongoDB")
+    password_hash_pool.shutdown()
 
 
 # Create FastAPI app
@@ -79,6 +90,7 @@ openapi_tags = [
     {"name": "admin-redemptions", "description": "Admin workflows for redemption approvals."},
     {"name": "admin-analytics", "description": "Admin reporting and analytics endpoints."},
     {"name": "admin-audit-logs", "description": "Admin audit log access."},
+    {"name": "admin-metrics", "description": "Per-process cache and pool metrics."},
     {"name": "orgs", "description": "Organization configuration and metadata."},
 ]
 
@@ -1,8 +1,16 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
+import uuid
 
 from pydantic import BaseModel, EmailStr, Field
 
+from app.models.enums import UserRole
+
+PASSWORD_RESET_PURPOSE = "password_reset"
+INVITE_PURPOSE = "invite"
+# Marks the short-lived tokens that open the feed event stream
+EVENT_STREAM_PURPOSE = "event_stream"
+
 
 class PasswordResetRequest(BaseModel):
     email: EmailStr
@@ -19,5 +27,63 @@ class PasswordResetResponse(BaseModel):
     expires_at: Optional[datetime] = None
 
 
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str = Field(min_length=1)
+
+
+class RefreshTokenRecord(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    org_id: str
+    user_id: str
+    family_id: str
+    token_hash: str
+    token_version: int = 0
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: datetime
+    revoked_at: Optional[datetime] = None
+
+
+class UserToken(BaseModel):
+    """Single-use password reset or invite token, stored by hash only."""
+
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    org_id: str
+    user_id: str
+    purpose: Literal["password_reset", "invite"]
+    token_hash: str
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: datetime
+
+
+class StreamToken(BaseModel):
+    token: str
+    expires_in: int
+
+
 class InviteResponse(BaseModel):
     invite_url: str
+
+
+class BulkInviteRequest(BaseModel):
+    user_ids: List[str] = Field(min_length=1, max_length=5000)
+
+
+class BulkInviteEntry(BaseModel):
+    user_id: str
+    email: EmailStr
+    invite_url: str
+
+
+class BulkInviteResponse(BaseModel):
+    invites: List[BulkInviteEntry] = Field(default_factory=list)
+    not_found: List[str] = Field(default_factory=list)
+
+
+class TokenClaims(BaseModel):
+    """Principal details carried by (or derived for) an access token."""
+
+    id: str
+    org_id: str
+    role: UserRole
+    manager_id: Optional[str] = None
+    token_version: int = 0
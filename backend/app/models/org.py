@@ -12,11 +12,40 @@ class Organization(BaseModel):
     domain: str
     slack_webhook_url: str | None = None
     teams_webhook_url: str | None = None
+    # Per-org overrides; None falls back to the recognition service defaults
+    approval_threshold: int | None = None
+    default_points: int | None = None
+    # Coalesce public recognition webhooks into periodic digests
+    webhook_digest_enabled: bool = False
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     is_active: bool = True
 
 
+class OrgSettings(BaseModel):
+    """Org metadata read on hot paths, served from `org_cache`."""
+
+    id: str
+    name: str | None = None
+    domain: str | None = None
+    is_active: bool = True
+    # False for org ids with no document (e.g. the DB_NAME fallback in dev)
+    exists: bool = True
+    slack_webhook_url: str | None = None
+    teams_webhook_url: str | None = None
+    approval_threshold: int | None = None
+    default_points: int | None = None
+    webhook_digest_enabled: bool = False
+
+
+class OrgSettingsUpdate(BaseModel):
+    slack_webhook_url: str | None = None
+    teams_webhook_url: str | None = None
+    approval_threshold: int | None = Field(default=None, ge=0)
+    default_points: int | None = Field(default=None, ge=0)
+    webhook_digest_enabled: bool | None = None
+
+
 class OrgBootstrapRequest(BaseModel):
     org_name: str = Field(min_length=1)
     admin_email: EmailStr
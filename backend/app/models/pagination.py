@@ -0,0 +1,16 @@
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of a keyset-paginated listing.
+
+    Pass `next_cursor` back as `cursor` for the following page; it is None
+    once the listing is exhausted.
+    """
+
+    items: List[T] = Field(default_factory=list)
+    next_cursor: Optional[str] = None
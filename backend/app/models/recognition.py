@@ -1,6 +1,6 @@
 from datetime import datetime
 import uuid
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal
 from pydantic import BaseModel, Field, validator
 from app.models.enums import RecognitionType, AchievementType, RecognitionScope, RewardProvider, UserRole, RedemptionStatus
 
@@ -13,9 +13,10 @@ class RecognitionUserSummary(BaseModel):
     manager_id: Optional[str] = None
     avatar_url: Optional[str] = None
 
-class RecognitionReaction(BaseModel):
+class RecognitionReactionSummary(BaseModel):
     emoji: str
-    user_ids: List[str] = Field(default_factory=list)
+    count: int
+    reacted_by_me: bool = False
 
 class Recognition(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -36,7 +37,8 @@ class Recognition(BaseModel):
     from_user_snapshot: Optional[RecognitionUserSummary] = None
     to_user_snapshots: List[RecognitionUserSummary] = Field(default_factory=list)
     values_tags: List[str] = Field(default_factory=list)
-    reactions: List[RecognitionReaction] = Field(default_factory=list)
+    # Per-emoji totals; who reacted lives in the recognition_reactions collection
+    reaction_counts: Dict[str, int] = Field(default_factory=dict)
     points_status: Literal["credited", "pending", "none"] = "none"
     credited_points: int = 0
 
@@ -61,6 +63,18 @@ class RecognitionEligibilityEntry(BaseModel):
     points_eligible: bool
     reason: Optional[str] = None
 
+
+class RecognitionRecipientMatch(RecognitionUserSummary):
+    is_peer: bool = False
+    in_reporting_line: bool = False
+    points_eligible: bool = False
+    reason: Optional[str] = None
+
+
+class RecognitionRecipientSearchResponse(BaseModel):
+    items: List[RecognitionRecipientMatch] = Field(default_factory=list)
+    next_cursor: Optional[str] = None
+
 class RecognitionHistoryEntry(BaseModel):
     id: str
     scope: RecognitionScope
@@ -71,7 +85,7 @@ class RecognitionHistoryEntry(BaseModel):
     from_user: RecognitionUserSummary
     to_users: List[RecognitionUserSummary]
     values_tags: List[str] = Field(default_factory=list)
-    reactions: List[RecognitionReaction] = Field(default_factory=list)
+    reactions: List[RecognitionReactionSummary] = Field(default_factory=list)
     points_status: Literal["credited", "pending", "none"] = "none"
     credited_points: int = 0
 
@@ -84,13 +98,33 @@ class RecognitionFeedEntry(BaseModel):
     from_user: RecognitionUserSummary
     to_users: List[RecognitionUserSummary]
     values_tags: List[str] = Field(default_factory=list)
-    reactions: List[RecognitionReaction] = Field(default_factory=list)
+    reactions: List[RecognitionReactionSummary] = Field(default_factory=list)
     points_status: Literal["credited", "pending", "none"] = "none"
     credited_points: int = 0
+    # Text relevance, set only on search results; part of the search cursor
+    search_score: Optional[float] = None
+
+class RecognitionBulkDecisionRequest(BaseModel):
+    recognition_ids: List[str] = Field(..., min_length=1)
+
+class RecognitionBulkDecisionResult(BaseModel):
+    recognition_id: str
+    ok: bool
+    status: Optional[str] = None
+    detail: Optional[str] = None
+
+class RecognitionBulkDecisionResponse(BaseModel):
+    results: List[RecognitionBulkDecisionResult] = Field(default_factory=list)
+    succeeded: int = 0
+    failed: int = 0
 
 class RecognitionReactionToggleRequest(BaseModel):
     emoji: str
 
+class RecognitionReactionToggleResponse(BaseModel):
+    recognition_id: str
+    reactions: List[RecognitionReactionSummary] = Field(default_factory=list)
+
 class RecognitionMessageAssistRequest(BaseModel):
     message: str
     tone: Optional[Literal["warm", "formal", "short", "enthusiastic"]] = None
@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field, EmailStr, validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import uuid
+from app.core.search import user_search_fields
 from app.models.enums import UserRole
 
 class UserPreferences(BaseModel):
@@ -41,21 +42,44 @@ class User(BaseModel):
     company: Optional[str] = None
     employee_id: Optional[str] = None
     manager_id: Optional[str] = None
+    # Ancestors from the direct manager up to the top of the reporting line,
+    # kept in sync by UserService so downline checks are one indexed query.
+    manager_chain: List[str] = Field(default_factory=list)
     location: Optional[str] = None
     joining_date: Optional[datetime] = None
     avatar_url: Optional[str] = None
-    reset_token_hash: Optional[str] = None
-    reset_token_expires_at: Optional[datetime] = None
     points_balance: int = 0
     total_points_earned: int = 0
     recognition_count: int = 0
     monthly_points_allowance: Optional[int] = None
     monthly_points_spent: int = 0
+    token_version: int = 0
     preferences: Dict[str, Any] = Field(default_factory=dict)
     purchase_history: List[str] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     is_active: bool = True
+    # Recipient typeahead keys, derived from name, email and department on
+    # every construction so they can never drift from the fields they index.
+    search_name: str = ""
+    search_prefixes: List[str] = Field(default_factory=list)
+
+    @validator('search_name', always=True)
+    def _populate_search_name(cls, value, values):
+        return cls._search_fields(values)["search_name"]
+
+    @validator('search_prefixes', always=True)
+    def _populate_search_prefixes(cls, value, values):
+        return cls._search_fields(values)["search_prefixes"]
+
+    @staticmethod
+    def _search_fields(values):
+        return user_search_fields(
+            values.get('first_name'),
+            values.get('last_name'),
+            values.get('email'),
+            values.get('department'),
+        )
 
 class UserCreate(BaseModel):
     email: EmailStr
@@ -126,6 +150,27 @@ class OrgChartNode(BaseModel):
     manager_id: Optional[str] = None
     children: List["OrgChartNode"] = Field(default_factory=list)
 
+class OrgChartSubtreeNode(BaseModel):
+    id: str
+    first_name: str
+    last_name: str
+    role: UserRole
+    department: Optional[str] = None
+    manager_id: Optional[str] = None
+    # Direct reports in total; `children` holds at most one page of them and is
+    # left empty below the requested depth.
+    child_count: int = 0
+    children: List["OrgChartSubtreeNode"] = Field(default_factory=list)
+
+class OrgChartSubtree(BaseModel):
+    root: Optional[OrgChartSubtreeNode] = None
+    items: List[OrgChartSubtreeNode]
+    total: int
+    offset: int
+    limit: int
+    # True when the node budget stopped expansion before the requested depth
+    truncated: bool = False
+
 class UserLogin(BaseModel):
     email: EmailStr
     password: str
@@ -134,3 +179,5 @@ class Token(BaseModel):
     access_token: str
     token_type: str
     expires_in: int
+    refresh_token: Optional[str] = None
+    refresh_expires_in: Optional[int] = None
@@ -2,21 +2,49 @@ import hashlib
 import logging
 import secrets
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from typing import Dict, Optional, Sequence, Union
 
 from fastapi import HTTPException, status
+from pymongo import ReplaceOne
 
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.cache import invalidate_org_chart, invalidate_principal
+from app.core.security import (
+    create_access_token,
+    hash_password_async,
+    password_needs_rehash,
+    verify_password_async,
+)
 from app.core.config import settings
-from app.models.auth import PasswordResetResponse
+from app.models.auth import (
+    EVENT_STREAM_PURPOSE,
+    INVITE_PURPOSE,
+    PASSWORD_RESET_PURPOSE,
+    PasswordResetResponse,
+    RefreshTokenRecord,
+    StreamToken,
+    TokenClaims,
+    UserToken,
+)
 from app.models.user import User, UserCreate, UserLogin, Token
 from app.models.enums import UserRole
 from app.database.connection import get_database
+from app.services.user_service import user_service
 
 PRIVILEGED_ROLE_ASSIGNERS = {UserRole.HR_ADMIN, UserRole.EXECUTIVE, UserRole.C_LEVEL}
 RESET_MESSAGE = "If that email exists in our system, we've sent password reset instructions."
+INVALID_REFRESH_TOKEN = "Invalid or expired refresh token"
 logger = logging.getLogger(__name__)
 
+def _hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+def _invalid_refresh_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=INVALID_REFRESH_TOKEN,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
 def _coerce_role(role: Optional[Union[UserRole, str]]) -> Optional[UserRole]:
     if role is None:
         return None
@@ -30,20 +58,38 @@ class AuthService:
 
     def _build_reset_token(self) -> tuple[str, str, datetime]:
         token = secrets.token_urlsafe(32)
-        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        token_hash = _hash_token(token)
         expires_at = datetime.utcnow() + timedelta(minutes=settings.PASSWORD_RESET_TOKEN_EXPIRE_MINUTES)
         return token, token_hash, expires_at
 
-    async def _persist_reset_token(self, db, user_id: str, token_hash: str, expires_at: datetime) -> None:
-        await db.users.update_one(
-            {"id": user_id},
-            {
-                "$set": {
-                    "reset_token_hash": token_hash,
-                    "reset_token_expires_at": expires_at,
-                    "updated_at": datetime.utcnow(),
-                }
-            },
+    def _user_token_write(self, org_id: str, user_id: str, purpose: str, token_hash: str, expires_at: datetime) -> ReplaceOne:
+        # One outstanding token per user and purpose: issuing a new one replaces
+        # (and thereby invalidates) the previous token.
+        record = UserToken(
+            org_id=org_id,
+            user_id=user_id,
+            purpose=purpose,
+            token_hash=token_hash,
+            expires_at=expires_at,
+        )
+        return ReplaceOne(
+            {"org_id": org_id, "user_id": user_id, "purpose": purpose},
+            record.dict(),
+            upsert=True,
+        )
+
+    async def _persist_reset_token(
+        self,
+        db,
+        user_id: str,
+        token_hash: str,
+        expires_at: datetime,
+        *,
+        org_id: str,
+        purpose: str = PASSWORD_RESET_PURPOSE,
+    ) -> None:
+        await db.user_tokens.bulk_write(
+            [self._user_token_write(org_id, user_id, purpose, token_hash, expires_at)]
         )
     
     async def register_user(
@@ -90,21 +136,24 @@ class AuthService:
         manager_id = user_data.manager_id if is_privileged_actor else None
         if isinstance(manager_id, str) and not manager_id.strip():
             manager_id = None
+        manager_chain = await user_service.resolve_manager_chain(manager_id, org_id=resolved_org_id)
 
         # Create new user
         user = User(
             org_id=resolved_org_id,
             email=user_data.email,
-            password_hash=hash_password(user_data.password),
+            password_hash=await hash_password_async(user_data.password),
             first_name=user_data.first_name,
             last_name=user_data.last_name,
             department=user_data.department,
             company=user_data.company,
             manager_id=manager_id,
+            manager_chain=manager_chain,
             role=role_to_assign
         )
 
         await db.users.insert_one(user.dict())
+        invalidate_org_chart(user.org_id)
         return user
 
     async def authenticate_user(self, login_data: UserLogin, *, org_id: str) -> Token:
@@ -139,24 +188,135 @@ class AuthService:
         user = User(**user_data)
         
         # Verify password
-        if not verify_password(login_data.password, user.password_hash):
+        if not await verify_password_async(login_data.password, user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials"
             )
+
+        if password_needs_rehash(user.password_hash):
+            # The plaintext is only available here, so upgrade (or downgrade)
+            # the stored hash to the configured cost on successful login.
+            user.password_hash = await hash_password_async(login_data.password)
+            await db.users.update_one(
+                {"id": user.id, "org_id": user.org_id},
+                {"$set": {"password_hash": user.password_hash, "updated_at": datetime.utcnow()}},
+            )
+            invalidate_principal(user.org_id, user.id)
         
-        # Create access token
-        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        access_token = create_access_token(
-            data={"sub": user.id}, expires_delta=access_token_expires
+        return await self.issue_tokens(user)
+
+    async def issue_tokens(self, user: User, *, family_id: Optional[str] = None) -> Token:
+        """Issue an access token plus a new refresh token in the given rotation family."""
+        token = self.issue_access_token(user)
+        if settings.REFRESH_TOKEN_EXPIRE_DAYS <= 0:
+            return token
+
+        db = await get_database()
+        refresh_token = secrets.token_urlsafe(48)
+        record = RefreshTokenRecord(
+            org_id=user.org_id,
+            user_id=user.id,
+            family_id=family_id or secrets.token_hex(16),
+            token_hash=_hash_token(refresh_token),
+            token_version=user.token_version,
+            expires_at=datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
         )
-        
+        await db.refresh_tokens.insert_one(record.dict())
+        token.refresh_token = refresh_token
+        token.refresh_expires_in = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+        return token
+
+    async def refresh_access_token(self, refresh_token: str) -> Token:
+        """Rotate a refresh token and issue a fresh access token.
+
+        Each refresh token is single use. Presenting one that was already
+        rotated is treated as theft and revokes its whole family.
+        """
+        db = await get_database()
+        token_hash = _hash_token(refresh_token)
+        now = datetime.utcnow()
+        record = await db.refresh_tokens.find_one_and_update(
+            {"token_hash": token_hash, "revoked_at": None},
+            {"$set": {"revoked_at": now}},
+        )
+        if not record:
+            reused = await db.refresh_tokens.find_one({"token_hash": token_hash})
+            if reused:
+                logger.warning(
+                    "Refresh token reuse detected for user %s; revoking token family",
+                    reused.get("user_id"),
+                )
+                await db.refresh_tokens.update_many(
+                    {"family_id": reused["family_id"], "revoked_at": None},
+                    {"$set": {"revoked_at": now}},
+                )
+            raise _invalid_refresh_token()
+
+        if record["expires_at"] < now:
+            raise _invalid_refresh_token()
+
+        try:
+            user = await self.get_user_by_id(record["user_id"], org_id=record["org_id"])
+        except HTTPException:
+            raise _invalid_refresh_token()
+        if not user.is_active or user.token_version != record.get("token_version", 0):
+            raise _invalid_refresh_token()
+
+        return await self.issue_tokens(user, family_id=record["family_id"])
+
+    async def revoke_refresh_token(self, refresh_token: str) -> None:
+        """Revoke the refresh token's whole rotation family (logout)."""
+        db = await get_database()
+        record = await db.refresh_tokens.find_one({"token_hash": _hash_token(refresh_token)})
+        if not record:
+            return
+        await db.refresh_tokens.update_many(
+            {"family_id": record["family_id"], "revoked_at": None},
+            {"$set": {"revoked_at": datetime.utcnow()}},
+        )
+
+    def issue_access_token(self, user: User) -> Token:
+        """Sign an access token for the user, with role claims when enabled."""
+        claims = {"sub": user.id}
+        if settings.ACCESS_TOKEN_CLAIMS_ENABLED:
+            claims.update(
+                {
+                    "org_id": user.org_id,
+                    "role": user.role.value if isinstance(user.role, UserRole) else user.role,
+                    "manager_id": user.manager_id,
+                    "ver": user.token_version,
+                }
+            )
+
+        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        access_token = create_access_token(data=claims, expires_delta=access_token_expires)
+
         return Token(
             access_token=access_token,
             token_type="bearer",
             expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
         )
 
+    def issue_stream_token(self, claims: TokenClaims) -> StreamToken:
+        """Sign a short-lived token that opens the feed event stream.
+
+        Browsers' EventSource cannot send headers, so the token goes in the
+        stream URL; its purpose claim keeps it from working as an access token.
+        """
+        token = create_access_token(
+            data={
+                "sub": claims.id,
+                "org_id": claims.org_id,
+                "role": claims.role.value,
+                "manager_id": claims.manager_id,
+                "ver": claims.token_version,
+                "purpose": EVENT_STREAM_PURPOSE,
+            },
+            expires_delta=timedelta(seconds=settings.EVENT_STREAM_TOKEN_EXPIRE_SECONDS),
+        )
+        return StreamToken(token=token, expires_in=settings.EVENT_STREAM_TOKEN_EXPIRE_SECONDS)
+
     async def request_password_reset(self, email: str, *, org_id: Optional[str] = None) -> PasswordResetResponse:
         """Generate a password reset token for the given email."""
         db = await get_database()
@@ -170,7 +330,7 @@ class AuthService:
 
         reset_token_to_return = None
         if user:
-            await self._persist_reset_token(db, user["id"], token_hash, expires_at)
+            await self._persist_reset_token(db, user["id"], token_hash, expires_at, org_id=user["org_id"])
             if settings.EXPOSE_RESET_TOKEN_IN_RESPONSE:
                 reset_token_to_return = token
                 logger.info("Generated password reset token for %s: %s", email, token)
@@ -180,39 +340,61 @@ class AuthService:
             expires_at=expires_at if reset_token_to_return else None
         )
 
-    async def create_invite_token(self, user_id: str) -> tuple[str, datetime]:
+    async def create_invite_token(self, user_id: str, *, org_id: str) -> tuple[str, datetime]:
         db = await get_database()
         token, token_hash, expires_at = self._build_reset_token()
-        await self._persist_reset_token(db, user_id, token_hash, expires_at)
+        await self._persist_reset_token(
+            db, user_id, token_hash, expires_at, org_id=org_id, purpose=INVITE_PURPOSE
+        )
         return token, expires_at
 
+    async def create_invite_tokens(self, user_ids: Sequence[str], *, org_id: str) -> Dict[str, tuple[str, datetime]]:
+        """Issue invite tokens for many users with a single bulk write."""
+        unique_ids = list(dict.fromkeys(user_id for user_id in user_ids if user_id))
+        if not unique_ids:
+            return {}
+
+        db = await get_database()
+        issued: Dict[str, tuple[str, datetime]] = {}
+        writes = []
+        for user_id in unique_ids:
+            token, token_hash, expires_at = self._build_reset_token()
+            issued[user_id] = (token, expires_at)
+            writes.append(self._user_token_write(org_id, user_id, INVITE_PURPOSE, token_hash, expires_at))
+        await db.user_tokens.bulk_write(writes, ordered=False)
+        return issued
+
     async def reset_password(self, token: str, new_password: str) -> dict:
-        """Reset the user's password using a valid reset token."""
+        """Reset the user's password using a valid reset or invite token."""
         db = await get_database()
-        token_hash = hashlib.sha256(token.encode()).hexdigest()
-        user_data = await db.users.find_one({"reset_token_hash": token_hash})
+        token_record = await db.user_tokens.find_one({"token_hash": _hash_token(token)})
 
-        if not user_data:
+        # Mongo's TTL monitor only runs periodically, so expiry is still checked here.
+        if not token_record or token_record["expires_at"] < datetime.utcnow():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid or expired reset token"
             )
 
-        expires_at = user_data.get("reset_token_expires_at")
-        if not expires_at or expires_at < datetime.utcnow():
+        new_hash = await hash_password_async(new_password)
+        # Served by the unique token_hash index
+        consumed = await db.user_tokens.delete_one(
+            {"token_hash": token_record["token_hash"], "purpose": token_record["purpose"]}
+        )
+        if consumed.deleted_count == 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid or expired reset token"
             )
 
-        new_hash = hash_password(new_password)
         await db.users.update_one(
-            {"id": user_data["id"]},
+            {"id": token_record["user_id"], "org_id": token_record["org_id"]},
             {
                 "$set": {"password_hash": new_hash, "updated_at": datetime.utcnow()},
-                "$unset": {"reset_token_hash": "", "reset_token_expires_at": ""}
+                "$inc": {"token_version": 1},
             }
         )
+        invalidate_principal(token_record["org_id"], token_record["user_id"])
         return PasswordResetResponse(message="Password has been reset successfully")
     
     async def get_user_by_id(self, user_id: str, *, org_id: str) -> User:
@@ -226,4 +408,15 @@ class AuthService:
             )
         return User(**user_data)
 
+    async def get_token_version(self, user_id: str, *, org_id: str) -> int:
+        """Return the user's current token version, or -1 if they can't sign in."""
+        db = await get_database()
+        user_data = await db.users.find_one(
+            {"id": user_id, "org_id": org_id},
+            {"_id": 0, "token_version": 1, "is_active": 1},
+        )
+        if not user_data or user_data.get("is_active") is False:
+            return -1
+        return int(user_data.get("token_version") or 0)
+
 auth_service = AuthService()
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import asyncio
 import logging
-from typing import Any, Mapping, Sequence
+from typing import Any, Dict, Mapping, Optional, Sequence
 
 from app.core.config import settings
 from app.models.recognition import Recognition, RewardRedemption
@@ -20,16 +19,17 @@ class EmailNotificationService:
         self._enabled = enabled
         self._provider = provider
 
-    def queue_recognition_received(
+    def recognition_received_payload(
         self,
         *,
         recognition: Recognition,
         from_user: Mapping[str, Any],
         recipients: Sequence[Mapping[str, Any]],
-    ) -> None:
+    ) -> Optional[Dict[str, Any]]:
+        """Email for the recipients, or None when email is disabled."""
         if not self._enabled:
-            return
-        payload = {
+            return None
+        return {
             "type": "recognition_received",
             "to": [recipient.get("email") for recipient in recipients if recipient.get("email")],
             "subject": f"You received recognition from {self._format_name(from_user)}",
@@ -40,18 +40,17 @@ class EmailNotificationService:
                 "from_user_id": recognition.from_user_id,
             },
         }
-        self._queue_payload(payload)
 
-    def queue_redemption_status_change(
+    def redemption_status_change_payload(
         self,
         *,
         redemption: RewardRedemption,
         recipient: Mapping[str, Any],
         previous_status: str,
-    ) -> None:
+    ) -> Optional[Dict[str, Any]]:
         if not self._enabled:
-            return
-        payload = {
+            return None
+        return {
             "type": "redemption_status_change",
             "to": [recipient.get("email")],
             "subject": f"Your reward redemption is now {redemption.status}",
@@ -65,19 +64,10 @@ class EmailNotificationService:
                 "current_status": redemption.status,
             },
         }
-        self._queue_payload(payload)
 
-    def _queue_payload(self, payload: Mapping[str, Any]) -> None:
-        try:
-            asyncio.create_task(self._send_payload(payload))
-        except RuntimeError:
-            logger.warning("Email notification skipped because no running event loop is available.")
-
-    async def _send_payload(self, payload: Mapping[str, Any]) -> None:
-        try:
-            await self._provider.send(payload)
-        except Exception:
-            logger.exception("Failed to send email notification payload")
+    async def send(self, payload: Mapping[str, Any]) -> None:
+        """Hand a payload to the provider; errors propagate so the outbox retries."""
+        await self._provider.send(payload)
 
     @staticmethod
     def _format_name(user: Mapping[str, Any]) -> str:
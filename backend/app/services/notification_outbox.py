@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional
+
+from pymongo import ReturnDocument
+
+from app.core.config import settings
+from app.models.org import OrgSettings
+from app.services.email_service import email_notification_service
+from app.services.org_service import org_service
+from app.services.webhook_service import WebhookRejected, webhook_notifier
+
+logger = logging.getLogger(__name__)
+
+# Message kinds
+PUBLIC_RECOGNITION = "recognition.public"
+WEBHOOK_POST = "webhook.post"
+WEBHOOK_DIGEST = "webhook.digest"
+EMAIL_SEND = "email.send"
+
+PENDING = "pending"
+FAILED = "failed"
+
+# Failed messages are kept this long for inspection, then expire (TTL index)
+FAILED_RETENTION = timedelta(days=7)
+
+# Errors that no retry can fix; the message fails on the first one
+PERMANENT_ERRORS = (WebhookRejected,)
+
+
+def outbox_message(kind: str, payload: Dict[str, Any], *, org_id: Optional[str]) -> Dict[str, Any]:
+    now = datetime.utcnow()
+    return {
+        "id": str(uuid.uuid4()),
+        "org_id": org_id,
+        "kind": kind,
+        "payload": payload,
+        "status": PENDING,
+        "attempts": 0,
+        "available_at": now,
+        "created_at": now,
+    }
+
+
+class NotificationOutbox:
+    """Durable queue for webhooks and emails, drained by one dispatcher task.
+
+    Writers insert messages into `notification_outbox` (in the same
+    transaction as the change that caused them). The dispatcher claims due
+    messages in batches, runs at most OUTBOX_CONCURRENCY handlers at a time,
+    deletes what succeeded and reschedules failures with exponential backoff
+    until OUTBOX_MAX_ATTEMPTS. A claim only hides a message for
+    OUTBOX_LOCK_SECONDS, so work held by a crashed worker is picked up again;
+    the lock is renewed as each message starts, so messages waiting behind
+    slow ones in the batch are not reclaimed and sent twice.
+    """
+
+    def __init__(self) -> None:
+        self._db: Any = None
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._stopping = False
+        self._handlers: Dict[str, Callable[[Any, Dict[str, Any]], Awaitable[None]]] = {
+            PUBLIC_RECOGNITION: self._fan_out_public_recognition,
+            WEBHOOK_POST: self._post_webhook,
+            WEBHOOK_DIGEST: self._flush_digest,
+            EMAIL_SEND: self._send_email,
+        }
+        self.delivered = 0
+        self.retried = 0
+        self.failed = 0
+
+    async def enqueue(self, db, messages: Iterable[Dict[str, Any]], *, session=None) -> None:
+        messages = list(messages)
+        if not messages:
+            return
+        kwargs = {"session": session} if session else {}
+        await db.notification_outbox.insert_many(messages, ordered=False, **kwargs)
+
+    def wake(self) -> None:
+        """Nudge the dispatcher after a commit instead of waiting for the next poll."""
+        if self._wake is not None:
+            self._wake.set()
+
+    def start(self, database) -> None:
+        if database is None or self._task is not None:
+            return
+        self._db = database
+        self._stopping = False
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def drain(self) -> None:
+        """Stop claiming, let the current batch finish (up to the drain timeout)."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self.wake()
+        try:
+            await asyncio.wait_for(self._task, settings.OUTBOX_DRAIN_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning("Outbox drain timed out; unfinished messages are retried after restart")
+            self._task.cancel()
+        finally:
+            self._task = None
+            self._wake = None
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                processed = await self.dispatch_once()
+            except Exception:
+                logger.exception("Outbox dispatch failed")
+                processed = 0
+            if processed or self._stopping:
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), settings.OUTBOX_POLL_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def dispatch_once(self, db=None) -> int:
+        """Claim and process one batch of due messages; returns how many were claimed."""
+        db = db if db is not None else self._db
+        messages = await self._claim(db)
+        if not messages:
+            return 0
+        semaphore = asyncio.Semaphore(max(settings.OUTBOX_CONCURRENCY, 1))
+
+        async def process(message: Dict[str, Any]) -> None:
+            async with semaphore:
+                await self._process(db, message)
+
+        await asyncio.gather(*(process(message) for message in messages))
+        return len(messages)
+
+    async def _claim(self, db) -> List[Dict[str, Any]]:
+        now = datetime.utcnow()
+        due = {"status": PENDING, "available_at": {"$lte": now}}
+        candidates = await db.notification_outbox.find(due, {"_id": 0, "id": 1}).sort(
+            [("available_at", 1)]
+        ).limit(settings.OUTBOX_BATCH_SIZE).to_list(settings.OUTBOX_BATCH_SIZE)
+        if not candidates:
+            return []
+        ids = [doc["id"] for doc in candidates]
+        claim = str(uuid.uuid4())
+        await db.notification_outbox.update_many(
+            {**due, "id": {"$in": ids}},
+            {"$set": {"available_at": now + timedelta(seconds=settings.OUTBOX_LOCK_SECONDS), "claim": claim}},
+        )
+        # Another worker may have claimed some of them in between
+        return await db.notification_outbox.find({"id": {"$in": ids}, "claim": claim}, {"_id": 0}).to_list(len(ids))
+
+    async def _process(self, db, message: Dict[str, Any]) -> None:
+        # The batch lock may have run out while this message waited for a slot
+        renewed = await db.notification_outbox.update_one(
+            {"id": message["id"], "claim": message["claim"]},
+            {"$set": {"available_at": datetime.utcnow() + timedelta(seconds=settings.OUTBOX_LOCK_SECONDS)}},
+        )
+        if renewed.matched_count == 0:
+            logger.warning("Outbox message %s was reclaimed before it ran; skipping", message["id"])
+            return
+        handler = self._handlers.get(message["kind"])
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown outbox message kind {message['kind']!r}")
+            await handler(db, message)
+        except Exception as exc:
+            await self._reschedule(db, message, exc)
+            return
+        deleted = await db.notification_outbox.delete_one({"id": message["id"], "claim": message["claim"]})
+        if deleted.deleted_count == 0:
+            logger.warning("Outbox message %s was reclaimed while it ran and may be sent again", message["id"])
+        self.delivered += 1
+
+    async def _reschedule(self, db, message: Dict[str, Any], error: Exception) -> None:
+        attempts = message.get("attempts", 0) + 1
+        now = datetime.utcnow()
+        update: Dict[str, Any] = {"attempts": attempts, "last_error": repr(error)[:500]}
+        if attempts >= settings.OUTBOX_MAX_ATTEMPTS or isinstance(error, PERMANENT_ERRORS):
+            logger.error("Outbox message %s (%s) failed permanently: %r", message["id"], message["kind"], error)
+            update.update({"status": FAILED, "expires_at": now + FAILED_RETENTION})
+            self.failed += 1
+        else:
+            delay = min(settings.OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1), settings.OUTBOX_RETRY_MAX_SECONDS)
+            update["available_at"] = now + timedelta(seconds=delay * random.uniform(0.5, 1.0))
+            self.retried += 1
+        await db.notification_outbox.update_one({"id": message["id"], "claim": message["claim"]}, {"$set": update})
+
+    async def _fan_out_public_recognition(self, db, message: Dict[str, Any]) -> None:
+        org = await org_service.get_org_settings(message["org_id"], db=db)
+        if org.webhook_digest_enabled:
+            await self._add_to_digest(db, org.id, message["payload"]["text"])
+            return
+        await self._enqueue_webhook_posts(db, org, message["payload"])
+
+    async def _add_to_digest(self, db, org_id: str, text: str) -> None:
+        """Append to the org's open digest, opening one due after the window.
+
+        A digest stops taking lines once claimed or full; the next line opens
+        a new one. A full digest is made due at once.
+        """
+        now = datetime.utcnow()
+        max_items = max(settings.WEBHOOK_DIGEST_MAX_ITEMS, 1)
+        digest = await db.notification_outbox.find_one_and_update(
+            {
+                "org_id": org_id,
+                "kind": WEBHOOK_DIGEST,
+                "status": PENDING,
+                "claim": {"$exists": False},
+                "item_count": {"$lt": max_items},
+            },
+            {
+                "$push": {"payload.lines": text},
+                "$inc": {"item_count": 1},
+                "$setOnInsert": {
+                    "id": str(uuid.uuid4()),
+                    "attempts": 0,
+                    "available_at": now + timedelta(seconds=settings.WEBHOOK_DIGEST_WINDOW_SECONDS),
+                    "created_at": now,
+                },
+            },
+            projection={"_id": 0, "id": 1, "item_count": 1},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        if digest["item_count"] >= max_items:
+            await db.notification_outbox.update_one(
+                {"id": digest["id"], "claim": {"$exists": False}},
+                {"$set": {"available_at": now}},
+            )
+
+    async def _flush_digest(self, db, message: Dict[str, Any]) -> None:
+        org = await org_service.get_org_settings(message["org_id"], db=db)
+        text = webhook_notifier.format_digest_message(message["payload"]["lines"])
+        await self._enqueue_webhook_posts(db, org, {"text": text})
+
+    async def _enqueue_webhook_posts(self, db, org: OrgSettings, body: Mapping[str, Any]) -> None:
+        # One message per URL, so a retry never re-posts to a hook that succeeded
+        await self.enqueue(
+            db,
+            [
+                outbox_message(WEBHOOK_POST, {"url": url, "body": dict(body)}, org_id=org.id)
+                for url in webhook_notifier.collect_urls(org.dict())
+            ],
+        )
+
+    async def _post_webhook(self, db, message: Dict[str, Any]) -> None:
+        await webhook_notifier.post(message["payload"]["url"], message["payload"]["body"])
+
+    async def _send_email(self, db, message: Dict[str, Any]) -> None:
+        await email_notification_service.send(message["payload"])
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None,
+            "delivered": self.delivered,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
+
+
+notification_outbox = NotificationOutbox()
@@ -1,13 +1,23 @@
-from datetime import timedelta
+from datetime import datetime
 
 from fastapi import HTTPException, status
+from pymongo import ReturnDocument
 
-from app.core.config import settings
-from app.core.security import create_access_token, hash_password
+from app.core.cache import invalidate_org, org_cache, unknown_org_cache
+from app.core.security import hash_password_async
 from app.database.connection import get_database
 from app.models.enums import UserRole
-from app.models.org import Organization, OrgBootstrapRequest, OrgBootstrapResponse
-from app.models.user import Token, User
+from app.models.org import (
+    Organization,
+    OrgBootstrapRequest,
+    OrgBootstrapResponse,
+    OrgSettings,
+    OrgSettingsUpdate,
+)
+from app.models.user import User
+from app.services.auth_service import auth_service
+
+ORG_SETTINGS_PROJECTION = {field: 1 for field in OrgSettings.model_fields if field != "exists"}
 
 
 class OrgService:
@@ -24,27 +34,19 @@ class OrgService:
 
         organization = Organization(name=payload.org_name, domain=domain)
         await db.orgs.insert_one(organization.dict())
+        invalidate_org(organization.id)
 
         admin_user = User(
             org_id=organization.id,
             email=payload.admin_email,
-            password_hash=hash_password(payload.admin_password),
+            password_hash=await hash_password_async(payload.admin_password),
             first_name=payload.admin_first_name,
             last_name=payload.admin_last_name,
             role=UserRole.HR_ADMIN,
         )
         await db.users.insert_one(admin_user.dict())
 
-        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        access_token = create_access_token(
-            data={"sub": admin_user.id}, expires_delta=access_token_expires
-        )
-
-        token = Token(
-            access_token=access_token,
-            token_type="bearer",
-            expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        )
+        token = await auth_service.issue_tokens(admin_user)
 
         return OrgBootstrapResponse(
             org_id=organization.id,
@@ -53,5 +55,47 @@ class OrgService:
             token=token,
         )
 
+    async def get_org_settings(self, org_id: str, *, db=None) -> OrgSettings:
+        """Cached org metadata; unknown org ids yield `exists=False` defaults.
+
+        Unknown ids are kept in `unknown_org_cache` rather than `org_cache`, so a
+        stream of made-up X-Org-Id values cannot evict real orgs.
+        """
+        unknown = unknown_org_cache.get(org_id)
+        if unknown is not None:
+            return unknown
+
+        async def load() -> OrgSettings:
+            database = db if db is not None else await get_database()
+            document = await database.orgs.find_one({"id": org_id}, {"_id": 0, **ORG_SETTINGS_PROJECTION})
+            if document is None:
+                return OrgSettings(id=org_id, exists=False)
+            return OrgSettings(**document)
+
+        org = await org_cache.get_or_load(org_id, load, store_if=lambda loaded: loaded.exists)
+        if not org.exists:
+            unknown_org_cache.set(org_id, org)
+        return org
+
+    async def update_org_settings(self, org_id: str, payload: OrgSettingsUpdate) -> OrgSettings:
+        db = await get_database()
+        changes = payload.dict(exclude_unset=True)
+        if changes.get("webhook_digest_enabled", False) is None:
+            del changes["webhook_digest_enabled"]
+        for field in ("slack_webhook_url", "teams_webhook_url"):
+            if field in changes:
+                changes[field] = (changes[field] or "").strip() or None
+
+        document = await db.orgs.find_one_and_update(
+            {"id": org_id},
+            {"$set": {**changes, "updated_at": datetime.utcnow()}},
+            projection={"_id": 0, **ORG_SETTINGS_PROJECTION},
+            return_document=ReturnDocument.AFTER,
+        )
+        invalidate_org(org_id)
+        if document is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found")
+        return OrgSettings(**document)
+
 
 org_service = OrgService()
@@ -1,39 +1,103 @@
+import logging
+import re
+import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Sequence
+from typing import Collection, Dict, List, Optional, Sequence, Set, Tuple, TypeVar
 
 from fastapi import HTTPException, status
-from pymongo.errors import OperationFailure
-
+from fastapi.encoders import jsonable_encoder
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import PyMongoError
+
+from app.core.cache import feed_cache, invalidate_feed, invalidate_principal
+from app.core.config import settings
+from app.core.events import event_broker
+from app.core.pagination import NEWEST_FIRST, apply_keyset, decode_cursor, encode_cursor, keyset_page
+from app.core.search import SEARCH_PREFIX_MAX_LENGTH, normalize_search_text
 from app.database.connection import get_database
+from app.database.transactions import run_in_transaction
 from app.models.enums import RecognitionScope, RecognitionType, UserRole
+from app.models.pagination import Page
 from app.models.points_ledger import PointsLedgerEntry
 from app.models.recognition import (
     Recognition,
+    RecognitionBulkDecisionResponse,
+    RecognitionBulkDecisionResult,
     RecognitionCreate,
     RecognitionFeedEntry,
     RecognitionHistoryEntry,
-    RecognitionReaction,
+    RecognitionReactionSummary,
+    RecognitionReactionToggleResponse,
+    RecognitionRecipientMatch,
+    RecognitionRecipientSearchResponse,
     RecognitionUserSummary,
 )
 from app.models.user import User
 from app.services.email_service import email_notification_service
+from app.services.notification_outbox import EMAIL_SEND, PUBLIC_RECOGNITION, notification_outbox, outbox_message
+from app.services.org_service import org_service
 from app.services.webhook_service import webhook_notifier
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_POINTS = 10
 MAX_POINTS = 10000
 APPROVAL_THRESHOLD = 200
 PRIVILEGED_ROLES = {UserRole.HR_ADMIN, UserRole.EXECUTIVE, UserRole.C_LEVEL}
 MANAGER_ROLES = {UserRole.MANAGER}
 
+# Cursor kinds and their keyset sort orders
+FEED_CURSOR = "feed"
+FEED_SEARCH_CURSOR = "feed_search"
+FEED_SEARCH_SORT = (("search_score", -1),) + NEWEST_FIRST
+HISTORY_CURSOR = "history"
+PENDING_CURSOR = "pending"
+RECIPIENT_CURSOR = "recipients"
+RECIPIENT_SORT = (("search_name", 1), ("id", 1))
+
+# Live feed event types (see app.core.events)
+RECOGNITION_CREATED_EVENT = "recognition.created"
+RECOGNITION_UPDATED_EVENT = "recognition.updated"
+REACTION_UPDATED_EVENT = "reaction.updated"
+
+# Emoji are used as keys of `reaction_counts`, so they must be short and valid
+# MongoDB field names
+MAX_REACTION_EMOJI_LENGTH = 16
+
+EntryT = TypeVar("EntryT", RecognitionFeedEntry, RecognitionHistoryEntry)
+
+# (recognition_id, recipients, points, giver) for one payout
+Award = Tuple[Optional[str], Sequence[Dict[str, object]], int, Optional[User]]
+
+NOT_FOUND_DETAIL = "Recognition not found"
+NOT_PENDING_DETAIL = "Recognition is not pending approval"
+
 
 def _normalize_role(role: Optional[UserRole]) -> UserRole:
     return role if isinstance(role, UserRole) else UserRole(role or UserRole.EMPLOYEE)
 
 
-def _is_transaction_unsupported(error: OperationFailure) -> bool:
-    if error.code == 20:
-        return True
-    return "Transaction numbers are only allowed" in str(error)
+def _newest_first_key(record: Dict[str, object]) -> Tuple[object, object]:
+    return record["created_at"], record["id"]
+
+
+def _reaction_counts(record: Dict[str, object]) -> Dict[str, int]:
+    counts = record.get("reaction_counts")
+    if counts is None:
+        # Not migrated yet: the legacy embedded [{emoji, user_ids}] list
+        return {reaction["emoji"]: len(reaction.get("user_ids", [])) for reaction in record.get("reactions", [])}
+    return counts
+
+
+def _reaction_summaries(
+    counts: Dict[str, int],
+    mine: Collection[str] = (),
+) -> List[RecognitionReactionSummary]:
+    return [
+        RecognitionReactionSummary(emoji=emoji, count=count, reacted_by_me=emoji in mine)
+        for emoji, count in counts.items()
+        if count > 0
+    ]
 
 
 class RecognitionService:
@@ -60,6 +124,86 @@ class RecognitionService:
             "emptyMessage": "No eligible teammates yet." if not recipients else None,
         }
 
+    async def search_recipients(
+        self,
+        current_user: User,
+        query: str,
+        *,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> RecognitionRecipientSearchResponse:
+        """Prefix search over active teammates, with points eligibility per match.
+
+        Matches any word of the first name, last name or department, the full
+        name in either order, or the email. Results are ordered by
+        (search_name, id) and paged with an opaque cursor.
+        """
+        term = normalize_search_text(query)
+        if not term:
+            return RecognitionRecipientSearchResponse()
+
+        db = await get_database()
+        filters: Dict[str, object] = {
+            "org_id": current_user.org_id,
+            "is_active": True,
+            "search_prefixes": term[:SEARCH_PREFIX_MAX_LENGTH].rstrip(),
+            "id": {"$ne": current_user.id},
+        }
+        extra: List[Dict[str, object]] = []
+        if len(term) > SEARCH_PREFIX_MAX_LENGTH:
+            # Only prefixes up to the max length are stored; the full terms are
+            # too, so the rest of the query is checked on the fetched documents.
+            extra.append({"search_prefixes": {"$regex": f"^{re.escape(term)}"}})
+        if extra:
+            filters["$and"] = extra
+        if cursor:
+            apply_keyset(filters, RECIPIENT_SORT, decode_cursor(cursor, RECIPIENT_CURSOR, 2))
+
+        projection = {
+            "_id": 0,
+            "id": 1,
+            "first_name": 1,
+            "last_name": 1,
+            "department": 1,
+            "role": 1,
+            "manager_id": 1,
+            "manager_chain": 1,
+            "avatar_url": 1,
+            "is_active": 1,
+            "search_name": 1,
+        }
+        docs = await (
+            db.users.find(filters, projection)
+            .sort(list(RECIPIENT_SORT))
+            .limit(limit + 1)
+            .to_list(limit + 1)
+        )
+        has_more = len(docs) > limit
+        docs = docs[:limit]
+
+        user_role = _normalize_role(current_user.role)
+        downline_user_ids: Optional[set[str]] = None
+        if user_role in MANAGER_ROLES:
+            downline_user_ids = self._downline_recipient_ids(current_user, docs)
+
+        items: List[RecognitionRecipientMatch] = []
+        for doc in docs:
+            points_eligible = self._is_points_eligible(current_user, doc, downline_user_ids)
+            items.append(
+                RecognitionRecipientMatch(
+                    **self._map_user_summary(doc).dict(),
+                    is_peer=self._is_peer(current_user, doc),
+                    in_reporting_line=current_user.id in (doc.get("manager_chain") or []),
+                    points_eligible=points_eligible,
+                    reason=self._points_eligibility_reason(user_role, points_eligible),
+                )
+            )
+
+        next_cursor = None
+        if has_more and docs:
+            next_cursor = encode_cursor(RECIPIENT_CURSOR, [docs[-1].get("search_name", ""), docs[-1]["id"]])
+        return RecognitionRecipientSearchResponse(items=items, next_cursor=next_cursor)
+
     async def get_recipient_eligibility(
         self,
         current_user: User,
@@ -82,7 +226,7 @@ class RecognitionService:
 
         downline_user_ids: Optional[set[str]] = None
         if user_role in MANAGER_ROLES:
-            downline_user_ids = await self._get_downline_user_ids(current_user)
+            downline_user_ids = self._downline_recipient_ids(current_user, recipients)
 
         eligibility: List[Dict[str, object]] = []
         for recipient in recipients:
@@ -116,7 +260,8 @@ class RecognitionService:
         if not recipient_ids:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Recipient is required")
 
-        recipient_ids = list({rid for rid in recipient_ids if rid and rid != current_user.id})
+        # dict.fromkeys dedupes while keeping the caller's order for to_user_ids
+        recipient_ids = list(dict.fromkeys(rid for rid in recipient_ids if rid and rid != current_user.id))
         if not recipient_ids:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="You must choose someone other than yourself")
 
@@ -126,12 +271,21 @@ class RecognitionService:
 
         downline_user_ids: Optional[set[str]] = None
         if user_role in MANAGER_ROLES:
-            downline_user_ids = await self._get_downline_user_ids(current_user)
+            downline_user_ids = self._downline_recipient_ids(current_user, recipients)
 
         await self._enforce_scope_permissions(current_user, recipients, scope, downline_user_ids=downline_user_ids)
 
+        org = await org_service.get_org_settings(current_user.org_id, db=db)
+        default_points = org.default_points if org.default_points is not None else DEFAULT_POINTS
+        approval_threshold = org.approval_threshold if org.approval_threshold is not None else APPROVAL_THRESHOLD
+
         can_award_points = self._can_award_points(current_user, recipients, downline_user_ids)
-        points_awarded = self._determine_points(user_role, payload.points_awarded, allow_points=can_award_points)
+        points_awarded = self._determine_points(
+            user_role,
+            payload.points_awarded,
+            allow_points=can_award_points,
+            default_points=default_points,
+        )
         if payload.recognition_type == RecognitionType.KUDOS:
             points_awarded = 0
 
@@ -143,7 +297,7 @@ class RecognitionService:
                 detail="Values tags must include between 1 and 3 entries.",
             )
 
-        approval_required = points_awarded > APPROVAL_THRESHOLD
+        approval_required = points_awarded > approval_threshold
         status_value = "pending" if approval_required else "approved"
         approved_at = None if approval_required else datetime.utcnow()
         approved_by = None if approval_required else current_user.id
@@ -174,92 +328,58 @@ class RecognitionService:
             from_user_snapshot=self._map_user_summary(current_user.dict()).dict(),
             to_user_snapshots=[self._map_user_summary(recipient).dict() for recipient in recipients],
             values_tags=normalized_tags,
-            reactions=[],
             status=status_value,
             approved_at=approved_at,
             approved_by=approved_by,
         )
 
-        client = getattr(db, "client", None)
-        session = None
-        transaction_started = False
-
-        if client:
-            try:
-                session = await client.start_session()
-                session.start_transaction()
-                transaction_started = True
-            except (OperationFailure, AttributeError):
-                if session:
-                    await session.end_session()
-                session = None
-
-        use_transaction = bool(transaction_started and session)
-        if use_transaction:
-            try:
-                await db.recognitions.insert_one(
-                    recognition.dict(exclude={"points_status", "credited_points"}),
-                    session=session,
-                )
-                if not approval_required:
-                    await self._reward_recipients(
-                        recipients,
-                        points_awarded,
-                        org_id=current_user.org_id,
-                        recognition_id=recognition.id,
-                        session=session,
-                    )
-                    await self._update_manager_allowance(
-                        current_user,
-                        points_awarded,
-                        org_id=current_user.org_id,
-                        session=session,
-                    )
-                await session.commit_transaction()
-            except OperationFailure as exc:
-                if _is_transaction_unsupported(exc):
-                    try:
-                        await session.abort_transaction()
-                    except Exception:
-                        pass
-                    await session.end_session()
-                    use_transaction = False
-                    session = None
-                else:
-                    await session.abort_transaction()
-                    await session.end_session()
-                    raise
-            except Exception:
-                await session.abort_transaction()
-                await session.end_session()
-                raise
-            else:
-                await session.end_session()
-                await self._dispatch_recognition_notifications(recognition, current_user, recipients)
-                return self._apply_points_status(recognition)
+        notifications = self._notification_messages(recognition, current_user, recipients)
+        touched: Set[str] = set()
 
-        if not use_transaction:
-            await db.recognitions.insert_one(recognition.dict(exclude={"points_status", "credited_points"}))
+        async def write(session) -> None:
+            kwargs = {"session": session} if session else {}
+            # Rewards first: a failed allowance debit then leaves nothing
+            # behind even without transaction support
             if not approval_required:
                 await self._reward_recipients(
                     recipients,
                     points_awarded,
                     org_id=current_user.org_id,
                     recognition_id=recognition.id,
+                    giver=current_user,
+                    touched=touched,
+                    session=session,
                 )
-                await self._update_manager_allowance(current_user, points_awarded, org_id=current_user.org_id)
+            await db.recognitions.insert_one(
+                recognition.dict(exclude={"points_status", "credited_points"}),
+                **kwargs,
+            )
+            await notification_outbox.enqueue(db, notifications, session=session)
 
-        await self._dispatch_recognition_notifications(recognition, current_user, recipients)
-        return self._apply_points_status(recognition)
+        try:
+            await run_in_transaction(db, write)
+        finally:
+            self._invalidate_principals(current_user.org_id, touched)
+        recognition = self._apply_points_status(recognition)
+        if recognition.is_public:
+            invalidate_feed(current_user.org_id)
+            await event_broker.publish(
+                current_user.org_id,
+                RECOGNITION_CREATED_EVENT,
+                jsonable_encoder(self._feed_entry_from_recognition(recognition)),
+            )
+
+        notification_outbox.wake()
+        return recognition
 
     async def approve_recognition(self, recognition_id: str, current_user: User) -> Recognition:
         db = await get_database()
         record = await db.recognitions.find_one({"id": recognition_id, "org_id": current_user.org_id})
         if not record:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recognition not found")
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=NOT_FOUND_DETAIL)
 
         if record.get("status") != "pending":
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Recognition is not pending approval")
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=NOT_PENDING_DETAIL)
 
         recipients = await self._load_users(record.get("to_user_ids", []), org_id=current_user.org_id)
         if len(recipients) != len(record.get("to_user_ids", [])):
@@ -277,20 +397,6 @@ class RecognitionService:
                         detail="Monthly points allowance exceeded.",
                     )
 
-        client = getattr(db, "client", None)
-        session = None
-        transaction_started = False
-
-        if client:
-            try:
-                session = await client.start_session()
-                session.start_transaction()
-                transaction_started = True
-            except (OperationFailure, AttributeError):
-                if session:
-                    await session.end_session()
-                session = None
-
         update = {
             "$set": {
                 "status": "approved",
@@ -299,74 +405,54 @@ class RecognitionService:
             }
         }
 
-        use_transaction = bool(transaction_started and session)
-        if use_transaction:
-            try:
-                await db.recognitions.update_one({"id": recognition_id, "org_id": current_user.org_id}, update, session=session)
-                if points_awarded > 0:
-                    await self._reward_recipients(
-                        recipients,
-                        points_awarded,
-                        org_id=current_user.org_id,
-                        recognition_id=recognition_id,
-                        session=session,
-                    )
-                    if from_user:
-                        await self._update_manager_allowance(
-                            User(**from_user),
-                            points_awarded,
-                            org_id=current_user.org_id,
-                            session=session,
-                        )
-                await session.commit_transaction()
-            except OperationFailure as exc:
-                if _is_transaction_unsupported(exc):
-                    try:
-                        await session.abort_transaction()
-                    except Exception:
-                        pass
-                    await session.end_session()
-                    use_transaction = False
-                    session = None
-                else:
-                    await session.abort_transaction()
-                    await session.end_session()
-                    raise
-            except Exception:
-                await session.abort_transaction()
-                await session.end_session()
-                raise
-            else:
-                await session.end_session()
-                updated_record = await db.recognitions.find_one({"id": recognition_id, "org_id": current_user.org_id})
-                return self._build_recognition_from_record(updated_record)
+        claim = {"id": recognition_id, "org_id": current_user.org_id, "status": "pending"}
+        touched: Set[str] = set()
 
-        if not use_transaction:
-            await db.recognitions.update_one({"id": recognition_id, "org_id": current_user.org_id}, update)
-            if points_awarded > 0:
+        async def write(session) -> None:
+            kwargs = {"session": session} if session else {}
+            # Claim first so a concurrent approve or reject cannot pay out twice
+            result = await db.recognitions.update_one(claim, update, **kwargs)
+            if result.modified_count != 1:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=NOT_PENDING_DETAIL)
+            if points_awarded <= 0:
+                return
+            try:
                 await self._reward_recipients(
                     recipients,
                     points_awarded,
                     org_id=current_user.org_id,
                     recognition_id=recognition_id,
+                    giver=User(**from_user) if from_user else None,
+                    touched=touched,
+                    session=session,
                 )
-                if from_user:
-                    await self._update_manager_allowance(
-                        User(**from_user),
-                        points_awarded,
-                        org_id=current_user.org_id,
+            except HTTPException:
+                if session is None:
+                    # No transaction to abort: hand the claim back
+                    await db.recognitions.update_one(
+                        {"id": recognition_id, "org_id": current_user.org_id, "status": "approved"},
+                        {"$set": {"status": "pending", "approved_at": None, "approved_by": None}},
                     )
+                raise
 
+        try:
+            await run_in_transaction(db, write)
+        finally:
+            self._invalidate_principals(current_user.org_id, touched)
         updated = await db.recognitions.find_one({"id": recognition_id, "org_id": current_user.org_id})
-        return self._build_recognition_from_record(updated)
+        recognition = self._build_recognition_from_record(updated)
+        if record.get("is_public"):
+            invalidate_feed(current_user.org_id)
+            await self._publish_status_change(recognition)
+        return recognition
 
     async def reject_recognition(self, recognition_id: str, current_user: User) -> Recognition:
         db = await get_database()
         record = await db.recognitions.find_one({"id": recognition_id, "org_id": current_user.org_id})
         if not record:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recognition not found")
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=NOT_FOUND_DETAIL)
         if record.get("status") != "pending":
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Recognition is not pending approval")
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=NOT_PENDING_DETAIL)
 
         update = {
             "$set": {
@@ -375,36 +461,313 @@ class RecognitionService:
                 "approved_at": datetime.utcnow(),
             }
         }
-        await db.recognitions.update_one({"id": recognition_id, "org_id": current_user.org_id}, update)
+        result = await db.recognitions.update_one(
+            {"id": recognition_id, "org_id": current_user.org_id, "status": "pending"}, update
+        )
+        if result.modified_count != 1:
+            # Approved or rejected concurrently since the read above
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=NOT_PENDING_DETAIL)
         updated = await db.recognitions.find_one({"id": recognition_id, "org_id": current_user.org_id})
-        return self._build_recognition_from_record(updated)
+        recognition = self._build_recognition_from_record(updated)
+        if record.get("is_public"):
+            invalidate_feed(current_user.org_id)
+            await self._publish_status_change(recognition)
+        return recognition
+
+    async def _publish_status_change(self, recognition: Recognition) -> None:
+        await event_broker.publish(
+            recognition.org_id,
+            RECOGNITION_UPDATED_EVENT,
+            {
+                "id": recognition.id,
+                "points_status": recognition.points_status,
+                "credited_points": recognition.credited_points,
+            },
+        )
 
-    async def _dispatch_recognition_notifications(
+    async def bulk_approve_recognitions(
         self,
-        recognition: Recognition,
+        recognition_ids: Sequence[str],
         current_user: User,
-        recipients: Sequence[dict],
-    ) -> None:
+    ) -> RecognitionBulkDecisionResponse:
+        """Approve many pending recognitions with per-item results.
+
+        All ids are validated with one `$in` read, recipients and senders are
+        loaded with one more, and manager allowances are checked against each
+        sender's total for the batch (in request order, so the recognitions
+        that fit are approved). The rest are approved in transactions of
+        BULK_APPROVAL_CHUNK_SIZE, each paying out with one users bulk_write
+        and one ledger insert_many.
+        """
         db = await get_database()
-        org = await db.orgs.find_one({"id": current_user.org_id}) or {}
-        webhook_notifier.queue_public_recognition(
-            org=org,
-            recognition=recognition,
-            from_user=current_user.dict(),
-            to_users=recipients,
+        org_id = current_user.org_id
+        ids = self._bulk_ids(recognition_ids)
+        records, results = await self._load_pending_for_decision(db, ids, org_id)
+
+        user_ids = {
+            str(user_id)
+            for record in records.values()
+            for user_id in [record["from_user_id"], *record.get("to_user_ids", [])]
+        }
+        users = {
+            doc["id"]: doc
+            for doc in await db.users.find({"org_id": org_id, "id": {"$in": list(user_ids)}}, {"_id": 0}).to_list(None)
+        }
+
+        awards: Dict[str, Award] = {}
+        spent: Dict[str, int] = {}
+        for recognition_id in ids:
+            record = records.get(recognition_id)
+            if record is None:
+                continue
+            recipient_ids = record.get("to_user_ids", [])
+            recipients = [users[user_id] for user_id in recipient_ids if user_id in users]
+            if len(recipients) != len(recipient_ids):
+                results[recognition_id] = self._bulk_failure(recognition_id, "One or more recipients not found")
+                continue
+            points = int(record.get("points_awarded") or 0)
+            sender = users.get(record["from_user_id"])
+            if sender and _normalize_role(sender.get("role")) in MANAGER_ROLES and points > 0:
+                allowance = sender.get("monthly_points_allowance")
+                committed = spent.get(sender["id"], 0)
+                if allowance is not None and committed + points > allowance - (sender.get("monthly_points_spent") or 0):
+                    results[recognition_id] = self._bulk_failure(recognition_id, "Monthly points allowance exceeded.")
+                    continue
+                spent[sender["id"]] = committed + points
+            awards[recognition_id] = (recognition_id, recipients, points, User(**sender) if sender else None)
+
+        approved: List[str] = []
+        chunk_size = max(settings.BULK_APPROVAL_CHUNK_SIZE, 1)
+        candidates = list(awards)
+        for start in range(0, len(candidates), chunk_size):
+            chunk = candidates[start:start + chunk_size]
+            touched: Set[str] = set()
+            try:
+                claimed = await run_in_transaction(
+                    db,
+                    lambda session, chunk=chunk, touched=touched: self._approve_chunk(
+                        db, chunk, awards, current_user, touched, session
+                    ),
+                )
+            except HTTPException as exc:
+                # A sender's allowance ran out since validation; the chunk was rolled back
+                for recognition_id in chunk:
+                    results[recognition_id] = self._bulk_failure(recognition_id, exc.detail)
+                continue
+            except PyMongoError:
+                logger.exception("Bulk approval of %d recognitions failed", len(chunk))
+                for recognition_id in chunk:
+                    results[recognition_id] = self._bulk_failure(recognition_id, "Approval failed; please retry.")
+                continue
+            finally:
+                self._invalidate_principals(org_id, touched)
+            for recognition_id in chunk:
+                if recognition_id in claimed:
+                    approved.append(recognition_id)
+                    results[recognition_id] = RecognitionBulkDecisionResult(
+                        recognition_id=recognition_id, ok=True, status="approved"
+                    )
+                else:
+                    # Decided by someone else since it was validated
+                    results[recognition_id] = self._bulk_failure(recognition_id, NOT_PENDING_DETAIL)
+
+        await self._after_bulk_decision(approved, records, org_id, status_value="approved")
+        return self._bulk_response(ids, results)
+
+    async def bulk_reject_recognitions(
+        self,
+        recognition_ids: Sequence[str],
+        current_user: User,
+    ) -> RecognitionBulkDecisionResponse:
+        """Reject many pending recognitions with one read and one update_many."""
+        db = await get_database()
+        org_id = current_user.org_id
+        ids = self._bulk_ids(recognition_ids)
+        records, results = await self._load_pending_for_decision(db, ids, org_id)
+
+        rejected = await self._decide(db, list(records), "rejected", current_user)
+        for recognition_id in records:
+            if recognition_id in rejected:
+                results[recognition_id] = RecognitionBulkDecisionResult(
+                    recognition_id=recognition_id, ok=True, status="rejected"
+                )
+            else:
+                results[recognition_id] = self._bulk_failure(recognition_id, NOT_PENDING_DETAIL)
+
+        await self._after_bulk_decision(
+            [recognition_id for recognition_id in ids if recognition_id in rejected],
+            records,
+            org_id,
+            status_value="rejected",
+        )
+        return self._bulk_response(ids, results)
+
+    def _bulk_ids(self, recognition_ids: Sequence[str]) -> List[str]:
+        ids = list(dict.fromkeys(recognition_ids))
+        if len(ids) > settings.BULK_DECISION_MAX_IDS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {settings.BULK_DECISION_MAX_IDS} recognitions can be decided at once.",
+            )
+        return ids
+
+    async def _load_pending_for_decision(
+        self,
+        db,
+        ids: Sequence[str],
+        org_id: str,
+    ) -> Tuple[Dict[str, Dict[str, object]], Dict[str, RecognitionBulkDecisionResult]]:
+        """Pending records by id, plus failures for ids that are missing or decided."""
+        docs = await db.recognitions.find(
+            {"org_id": org_id, "id": {"$in": list(ids)}},
+            {"_id": 0, "id": 1, "status": 1, "is_public": 1, "from_user_id": 1, "to_user_ids": 1, "points_awarded": 1},
+        ).to_list(len(ids))
+        found = {doc["id"]: doc for doc in docs}
+        records: Dict[str, Dict[str, object]] = {}
+        results: Dict[str, RecognitionBulkDecisionResult] = {}
+        for recognition_id in ids:
+            record = found.get(recognition_id)
+            if record is None:
+                results[recognition_id] = self._bulk_failure(recognition_id, NOT_FOUND_DETAIL)
+            elif record.get("status") != "pending":
+                results[recognition_id] = self._bulk_failure(recognition_id, NOT_PENDING_DETAIL)
+            else:
+                records[recognition_id] = record
+        return records, results
+
+    async def _decide(
+        self,
+        db,
+        ids: Sequence[str],
+        status_value: str,
+        current_user: User,
+        session=None,
+    ) -> set[str]:
+        """Move still-pending `ids` to `status_value`; returns the ids this call moved.
+
+        The shared `approved_at` stamp identifies our writes, so a recognition
+        decided concurrently by someone else is not claimed twice.
+        """
+        if not ids:
+            return set()
+        kwargs = {"session": session} if session else {}
+        now = datetime.utcnow()
+        decision = {"approved_by": current_user.id, "approved_at": now}
+        await db.recognitions.update_many(
+            {"org_id": current_user.org_id, "id": {"$in": list(ids)}, "status": "pending"},
+            {"$set": {"status": status_value, **decision}},
+            **kwargs,
         )
-        email_notification_service.queue_recognition_received(
+        docs = await db.recognitions.find(
+            {"org_id": current_user.org_id, "id": {"$in": list(ids)}, "status": status_value, **decision},
+            {"_id": 0, "id": 1},
+            **kwargs,
+        ).to_list(len(ids))
+        return {doc["id"] for doc in docs}
+
+    async def _approve_chunk(
+        self,
+        db,
+        chunk: Sequence[str],
+        awards: Dict[str, Award],
+        current_user: User,
+        touched: Set[str],
+        session,
+    ) -> set[str]:
+        claimed = await self._decide(db, chunk, "approved", current_user, session)
+        payouts = [awards[recognition_id] for recognition_id in chunk if recognition_id in claimed]
+        try:
+            await self._reward_batch(
+                [award for award in payouts if award[2] > 0],
+                org_id=current_user.org_id,
+                touched=touched,
+                session=session,
+            )
+        except HTTPException:
+            if session is None and claimed:
+                # No transaction to abort: hand the claimed ones back
+                await db.recognitions.update_many(
+                    {"id": {"$in": list(claimed)}, "org_id": current_user.org_id, "status": "approved"},
+                    {"$set": {"status": "pending", "approved_at": None, "approved_by": None}},
+                )
+            raise
+        return claimed
+
+    async def _after_bulk_decision(
+        self,
+        decided: Sequence[str],
+        records: Dict[str, Dict[str, object]],
+        org_id: str,
+        *,
+        status_value: str,
+    ) -> None:
+        public = [recognition_id for recognition_id in decided if records[recognition_id].get("is_public")]
+        if not public:
+            return
+        invalidate_feed(org_id)
+        for recognition_id in public:
+            points = int(records[recognition_id].get("points_awarded") or 0)
+            points_status = self._resolve_points_status(points, status_value)
+            await event_broker.publish(
+                org_id,
+                RECOGNITION_UPDATED_EVENT,
+                {
+                    "id": recognition_id,
+                    "points_status": points_status,
+                    "credited_points": self._resolve_credited_points(points, status_value),
+                },
+            )
+
+    def _bulk_failure(self, recognition_id: str, detail: str) -> RecognitionBulkDecisionResult:
+        return RecognitionBulkDecisionResult(recognition_id=recognition_id, ok=False, detail=detail)
+
+    def _bulk_response(
+        self,
+        ids: Sequence[str],
+        results: Dict[str, RecognitionBulkDecisionResult],
+    ) -> RecognitionBulkDecisionResponse:
+        ordered = [results[recognition_id] for recognition_id in ids]
+        succeeded = sum(1 for result in ordered if result.ok)
+        return RecognitionBulkDecisionResponse(results=ordered, succeeded=succeeded, failed=len(ordered) - succeeded)
+
+    def _notification_messages(
+        self,
+        recognition: Recognition,
+        current_user: User,
+        recipients: Sequence[dict],
+    ) -> List[Dict[str, object]]:
+        """Outbox messages for a new recognition: the public webhook post (its
+        URLs are resolved by the dispatcher) and the recipients' email."""
+        from_user = current_user.dict()
+        messages = []
+        if recognition.is_public:
+            messages.append(outbox_message(
+                PUBLIC_RECOGNITION,
+                {"text": webhook_notifier.format_recognition_message(recognition, from_user, recipients)},
+                org_id=current_user.org_id,
+            ))
+        email = email_notification_service.recognition_received_payload(
             recognition=recognition,
-            from_user=current_user.dict(),
+            from_user=from_user,
             recipients=recipients,
         )
+        if email:
+            messages.append(outbox_message(EMAIL_SEND, email, org_id=current_user.org_id))
+        return messages
 
-    async def get_pending_recognitions(self, current_user: User, limit: int = 100) -> List[Recognition]:
+    async def get_pending_recognitions(
+        self,
+        current_user: User,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Page[Recognition]:
         db = await get_database()
-        records = await db.recognitions.find(
-            {"org_id": current_user.org_id, "status": "pending"}
-        ).sort("created_at", -1).limit(limit).to_list(limit)
-        return [self._build_recognition_from_record(record) for record in records]
+        query: Dict[str, object] = {"org_id": current_user.org_id, "status": "pending"}
+        if cursor:
+            apply_keyset(query, NEWEST_FIRST, decode_cursor(cursor, PENDING_CURSOR, 2))
+        records = await db.recognitions.find(query).sort(list(NEWEST_FIRST)).limit(limit + 1).to_list(limit + 1)
+        records, next_page = keyset_page(PENDING_CURSOR, records, limit, _newest_first_key)
+        return Page(items=[self._build_recognition_from_record(record) for record in records], next_cursor=next_page)
 
     async def get_history(
         self,
@@ -412,7 +775,8 @@ class RecognitionService:
         direction: Optional[str] = None,
         recognition_type: Optional[RecognitionType] = None,
         limit: int = 50,
-    ) -> List[RecognitionHistoryEntry]:
+        cursor: Optional[str] = None,
+    ) -> Page[RecognitionHistoryEntry]:
         db = await get_database()
         direction = (direction or "all").lower()
         query: Dict[str, object] = {}
@@ -429,8 +793,11 @@ class RecognitionService:
 
         if recognition_type:
             query["recognition_type"] = recognition_type
+        if cursor:
+            apply_keyset(query, NEWEST_FIRST, decode_cursor(cursor, HISTORY_CURSOR, 2))
 
-        records = await db.recognitions.find(query).sort("created_at", -1).limit(limit).to_list(limit)
+        records = await db.recognitions.find(query).sort(list(NEWEST_FIRST)).limit(limit + 1).to_list(limit + 1)
+        records, next_page = keyset_page(HISTORY_CURSOR, records, limit, _newest_first_key)
 
         user_ids: set[str] = set()
         for record in records:
@@ -493,13 +860,13 @@ class RecognitionService:
                 from_user=from_summary,
                 to_users=to_summaries,
                 values_tags=record.get("values_tags", []),
-                reactions=[RecognitionReaction(**reaction) for reaction in record.get("reactions", [])],
+                reactions=_reaction_summaries(_reaction_counts(record)),
                 points_status=self._resolve_points_status(record.get("points_awarded", 0), record.get("status")),
                 credited_points=self._resolve_credited_points(record.get("points_awarded", 0), record.get("status")),
             )
             history.append(entry)
 
-        return history
+        return Page(items=await self._with_my_reactions(current_user, history), next_cursor=next_page)
 
     async def get_public_feed(
         self,
@@ -509,56 +876,86 @@ class RecognitionService:
         limit: int = 50,
         cursor: Optional[str] = None,
         skip: int = 0,
-    ) -> List[RecognitionFeedEntry]:
+    ) -> Page[RecognitionFeedEntry]:
+        # Unfiltered first pages are the bulk of feed traffic; they are served
+        # from one shared, rendered page per org.
+        page_size = settings.FEED_CACHE_PAGE_SIZE
+        if feed_cache.enabled and limit <= page_size and not (search or value_tag or cursor or skip):
+            cached = await feed_cache.get_or_load(
+                current_user.org_id,
+                lambda: self._query_public_feed(current_user, limit=page_size),
+            )
+            page = self._first_feed_page(cached, limit)
+        else:
+            page = await self._query_public_feed(
+                current_user,
+                search=search,
+                value_tag=value_tag,
+                limit=limit,
+                cursor=cursor,
+                skip=skip,
+            )
+        # The cached page is shared by the whole org, so per-user flags are
+        # applied to copies after the cache
+        return Page(items=await self._with_my_reactions(current_user, page.items), next_cursor=page.next_cursor)
+
+    @staticmethod
+    def _first_feed_page(cached: Page[RecognitionFeedEntry], limit: int) -> Page[RecognitionFeedEntry]:
+        """The first `limit` entries of the cached first page.
+
+        When rendered entries remain after the slice, the next page starts
+        after the last one kept; otherwise every row up to the cached page's
+        cursor was either kept or dropped while rendering, so that cursor
+        still applies.
+        """
+        if len(cached.items) <= limit:
+            return cached
+        items = cached.items[:limit]
+        return Page(items=items, next_cursor=encode_cursor(FEED_CURSOR, [items[-1].created_at, items[-1].id]))
+
+    async def _query_public_feed(
+        self,
+        current_user: User,
+        search: Optional[str] = None,
+        value_tag: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+    ) -> Page[RecognitionFeedEntry]:
         db = await get_database()
         query: Dict[str, object] = {"is_public": True, "org_id": current_user.org_id}
-        and_filters: List[Dict[str, object]] = []
-        cursor_created_at: Optional[datetime] = None
-        cursor_id: Optional[str] = None
-
+        search_text = search.strip() if search else ""
+        cursor_values: Optional[List[object]] = None
         if cursor:
-            try:
-                cursor_created_at_raw, cursor_id = cursor.split("|", 1)
-                cursor_created_at = datetime.fromisoformat(cursor_created_at_raw)
-            except ValueError as exc:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid cursor format.",
-                ) from exc
-
-        if cursor_created_at and cursor_id:
-            and_filters.append(
-                {
-                    "$or": [
-                        {"created_at": {"$lt": cursor_created_at}},
-                        {"created_at": cursor_created_at, "id": {"$lt": cursor_id}},
-                    ]
-                }
-            )
-
-        if search:
-            and_filters.append(
-                {
-                    "$or": [
-                        {"message": {"$regex": search, "$options": "i"}},
-                        {"from_user_snapshot.first_name": {"$regex": search, "$options": "i"}},
-                        {"from_user_snapshot.last_name": {"$regex": search, "$options": "i"}},
-                        {"to_user_snapshots.first_name": {"$regex": search, "$options": "i"}},
-                        {"to_user_snapshots.last_name": {"$regex": search, "$options": "i"}},
-                    ]
-                }
-            )
+            cursor_values = self._decode_feed_cursor(cursor, search=bool(search_text))
 
         if value_tag:
             query["values_tags"] = value_tag
 
-        if and_filters:
-            query["$and"] = and_filters
+        if search_text:
+            records = await self._search_public_feed(
+                db,
+                query,
+                search_text,
+                limit=limit + 1,
+                skip=0 if cursor else skip,
+                after=cursor_values,
+            )
+            records, next_page = keyset_page(
+                FEED_SEARCH_CURSOR,
+                records,
+                limit,
+                lambda record: (record["search_score"], record["created_at"], record["id"]),
+            )
+        else:
+            if cursor_values:
+                apply_keyset(query, NEWEST_FIRST, cursor_values)
 
-        cursor_query = db.recognitions.find(query).sort([("created_at", -1), ("id", -1)])
-        if not cursor and skip:
-            cursor_query = cursor_query.skip(skip)
-        records = await cursor_query.limit(limit).to_list(limit)
+            cursor_query = db.recognitions.find(query).sort(list(NEWEST_FIRST))
+            if not cursor and skip:
+                cursor_query = cursor_query.skip(skip)
+            records = await cursor_query.limit(limit + 1).to_list(limit + 1)
+            records, next_page = keyset_page(FEED_CURSOR, records, limit, _newest_first_key)
 
         user_ids: set[str] = set()
         for record in records:
@@ -615,42 +1012,198 @@ class RecognitionService:
                     from_user=from_summary,
                     to_users=to_summaries,
                     values_tags=record.get("values_tags", []),
-                    reactions=[RecognitionReaction(**reaction) for reaction in record.get("reactions", [])],
+                    reactions=_reaction_summaries(_reaction_counts(record)),
                     points_status=self._resolve_points_status(record.get("points_awarded", 0), record.get("status")),
                     credited_points=self._resolve_credited_points(record.get("points_awarded", 0), record.get("status")),
+                    search_score=record.get("search_score"),
                 )
             )
 
-        return feed
+        return Page(items=feed, next_cursor=next_page)
+
+    async def _search_public_feed(
+        self,
+        db,
+        query: Dict[str, object],
+        search_text: str,
+        *,
+        limit: int,
+        skip: int = 0,
+        after: Optional[Sequence[object]] = None,
+    ) -> List[Dict[str, object]]:
+        """Run a feed search on the `recognition_feed_text` index.
+
+        Matches are ranked by text score (names and values tags weigh double
+        the message), then newest first. `after` is the (score, created_at,
+        id) of the last entry already shown.
+        """
+        pipeline: List[Dict[str, object]] = [
+            {"$match": {**query, "$text": {"$search": search_text}}},
+            {"$addFields": {"search_score": {"$meta": "textScore"}}},
+        ]
+        if after is not None:
+            keyset: Dict[str, object] = {}
+            apply_keyset(keyset, FEED_SEARCH_SORT, after)
+            pipeline.append({"$match": keyset})
+        pipeline.append({"$sort": dict(FEED_SEARCH_SORT)})
+        if skip:
+            pipeline.append({"$skip": skip})
+        pipeline.append({"$limit": limit})
+        return await db.recognitions.aggregate(pipeline).to_list(limit)
 
     async def toggle_reaction(
         self,
         recognition_id: str,
         emoji: str,
         current_user: User,
-    ) -> Recognition:
+    ) -> RecognitionReactionToggleResponse:
+        """Add or remove the caller's `emoji` reaction.
+
+        Each reaction is its own document keyed by (recognition, user, emoji),
+        so concurrent toggles never overwrite each other; the recognition only
+        carries per-emoji counters, adjusted with `$inc` when a reaction is
+        actually inserted or deleted.
+        """
+        emoji = emoji.strip()
+        if not emoji or len(emoji) > MAX_REACTION_EMOJI_LENGTH or "." in emoji or emoji.startswith("$"):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid reaction emoji.")
+
         db = await get_database()
-        record = await db.recognitions.find_one({"id": recognition_id, "org_id": current_user.org_id})
+        record_query = {"id": recognition_id, "org_id": current_user.org_id}
+        record = await db.recognitions.find_one(
+            record_query, {"_id": 0, "id": 1, "is_public": 1, "reactions": 1, "reaction_counts": 1}
+        )
         if not record:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recognition not found")
-
-        reactions = [RecognitionReaction(**reaction) for reaction in record.get("reactions", [])]
-        reaction_entry = next((reaction for reaction in reactions if reaction.emoji == emoji), None)
-        if reaction_entry:
-            if current_user.id in reaction_entry.user_ids:
-                reaction_entry.user_ids = [uid for uid in reaction_entry.user_ids if uid != current_user.id]
-            else:
-                reaction_entry.user_ids.append(current_user.id)
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=NOT_FOUND_DETAIL)
+        is_public = record.get("is_public", False)
+        if "reaction_counts" not in record:
+            await self.migrate_legacy_reactions(db, current_user.org_id, record)
+
+        reaction_key = {
+            "org_id": current_user.org_id,
+            "recognition_id": recognition_id,
+            "user_id": current_user.id,
+            "emoji": emoji,
+        }
+        removed = await db.recognition_reactions.delete_one(reaction_key)
+        if removed.deleted_count:
+            delta = -1
+        else:
+            added = await db.recognition_reactions.update_one(
+                reaction_key,
+                {"$setOnInsert": {"id": str(uuid.uuid4()), "created_at": datetime.utcnow()}},
+                upsert=True,
+            )
+            # No upsert means a concurrent request from the same user added it
+            delta = 1 if added.upserted_id is not None else 0
+
+        if delta:
+            record = await db.recognitions.find_one_and_update(
+                record_query,
+                {"$inc": {f"reaction_counts.{emoji}": delta}},
+                {"_id": 0, "reaction_counts": 1},
+                return_document=ReturnDocument.AFTER,
+            )
         else:
-            reactions.append(RecognitionReaction(emoji=emoji, user_ids=[current_user.id]))
+            record = await db.recognitions.find_one(record_query, {"_id": 0, "reaction_counts": 1})
+        counts = (record or {}).get("reaction_counts", {})
+        self._patch_cached_feed_reactions(current_user.org_id, recognition_id, counts)
+        if delta and is_public:
+            await event_broker.publish(
+                current_user.org_id,
+                REACTION_UPDATED_EVENT,
+                {"id": recognition_id, "emoji": emoji, "count": max(counts.get(emoji, 0), 0), "delta": delta},
+            )
+
+        mine = await db.recognition_reactions.find(
+            {"org_id": current_user.org_id, "user_id": current_user.id, "recognition_id": recognition_id},
+            {"_id": 0, "emoji": 1},
+        ).to_list(None)
+        return RecognitionReactionToggleResponse(
+            recognition_id=recognition_id,
+            reactions=_reaction_summaries(counts, {doc["emoji"] for doc in mine}),
+        )
 
-        reactions = [reaction for reaction in reactions if reaction.user_ids]
+    async def migrate_legacy_reactions(self, db, org_id: str, record: Dict[str, object]) -> None:
+        """Move an embedded `reactions` list into recognition_reactions and
+        replace it with `reaction_counts`.
+
+        Safe to repeat or race: reaction documents are upserted by key and the
+        swap only applies to a recognition that has no counters yet.
+        """
+        writes = [
+            UpdateOne(
+                {"org_id": org_id, "recognition_id": record["id"], "user_id": user_id, "emoji": reaction["emoji"]},
+                {"$setOnInsert": {"id": str(uuid.uuid4()), "created_at": datetime.utcnow()}},
+                upsert=True,
+            )
+            for reaction in record.get("reactions") or []
+            for user_id in reaction.get("user_ids", [])
+        ]
+        if writes:
+            await db.recognition_reactions.bulk_write(writes, ordered=False)
         await db.recognitions.update_one(
-            {"id": recognition_id, "org_id": current_user.org_id},
-            {"$set": {"reactions": [reaction.dict() for reaction in reactions]}},
+            {"id": record["id"], "org_id": org_id, "reaction_counts": {"$exists": False}},
+            {"$set": {"reaction_counts": _reaction_counts(record)}, "$unset": {"reactions": ""}},
         )
-        record["reactions"] = [reaction.dict() for reaction in reactions]
-        return self._build_recognition_from_record(record)
+
+    async def _with_my_reactions(self, current_user: User, entries: Sequence[EntryT]) -> List[EntryT]:
+        """`entries` with `reacted_by_me` set for the caller; changed entries are copies."""
+        reacted_ids = [entry.id for entry in entries if entry.reactions]
+        if not reacted_ids:
+            return list(entries)
+        db = await get_database()
+        docs = await db.recognition_reactions.find(
+            {"org_id": current_user.org_id, "user_id": current_user.id, "recognition_id": {"$in": reacted_ids}},
+            {"_id": 0, "recognition_id": 1, "emoji": 1},
+        ).to_list(None)
+        mine: Dict[str, set[str]] = {}
+        for doc in docs:
+            mine.setdefault(doc["recognition_id"], set()).add(doc["emoji"])
+        return [
+            entry.copy(update={
+                "reactions": [
+                    reaction.copy(update={"reacted_by_me": reaction.emoji in mine[entry.id]})
+                    for reaction in entry.reactions
+                ],
+            })
+            if entry.id in mine
+            else entry
+            for entry in entries
+        ]
+
+    def _decode_feed_cursor(self, cursor: str, *, search: bool) -> List[object]:
+        if "|" not in cursor:
+            if search:
+                return decode_cursor(cursor, FEED_SEARCH_CURSOR, 3)
+            return decode_cursor(cursor, FEED_CURSOR, 2)
+        # Deprecated client-built cursors: '<created_at>|<id>', or
+        # '<search_score>|<created_at>|<id>' for searches.
+        try:
+            if search:
+                score_raw, created_at_raw, cursor_id = cursor.split("|", 2)
+                return [float(score_raw), datetime.fromisoformat(created_at_raw), cursor_id]
+            created_at_raw, cursor_id = cursor.split("|", 1)
+            return [datetime.fromisoformat(created_at_raw), cursor_id]
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor format.",
+            ) from exc
+
+    def _patch_cached_feed_reactions(
+        self,
+        org_id: str,
+        recognition_id: str,
+        counts: Dict[str, int],
+    ) -> None:
+        """Reactions are the most frequent feed write, so update the cached page
+        in place rather than dropping it."""
+        page = feed_cache.peek(org_id)
+        for entry in page.items if page else []:
+            if entry.id == recognition_id:
+                entry.reactions = _reaction_summaries(counts)
+                return
 
     async def _reward_recipients(
         self,
@@ -659,54 +1212,129 @@ class RecognitionService:
         *,
         org_id: str,
         recognition_id: Optional[str] = None,
+        giver: Optional[User] = None,
+        touched: Set[str],
         session=None,
     ) -> None:
+        await self._reward_batch(
+            [(recognition_id, recipients, points, giver)], org_id=org_id, touched=touched, session=session
+        )
+
+    async def _reward_batch(self, awards: Sequence[Award], *, org_id: str, touched: Set[str], session=None) -> None:
+        """Credit every recipient and debit giver allowances in one batch.
+
+        Credits are summed per user and go out as a single unordered
+        bulk_write, and the ledger entries as a single insert_many; only the
+        conditional allowance debits cost one round trip per manager giver.
+        The users written are added to `touched`; callers invalidate their
+        cached principals once the transaction is over, since a reload
+        before the commit would cache the old documents.
+        """
+        if not awards:
+            return
         db = await get_database()
-        update = {
-            "$inc": {
-                "points_balance": points,
-                "total_points_earned": points,
-                "recognition_count": 1,
-            },
-            "$set": {"updated_at": datetime.utcnow()},
-        }
-        for recipient in recipients:
-            kwargs = {"session": session} if session else {}
-            await db.users.update_one(
-                {"id": recipient["id"], "org_id": org_id},
-                update,
-                **kwargs,
+        kwargs = {"session": session} if session else {}
+        now = datetime.utcnow()
+        credits: Dict[str, List[int]] = {}
+        spent: Dict[str, int] = {}
+        givers: Dict[str, User] = {}
+        ledger_entries = []
+        for recognition_id, recipients, points, giver in awards:
+            for recipient in recipients:
+                totals = credits.setdefault(str(recipient["id"]), [0, 0])
+                totals[0] += points
+                totals[1] += 1
+                if points > 0 and recognition_id:
+                    ledger_entries.append(
+                        PointsLedgerEntry(
+                            org_id=org_id,
+                            user_id=str(recipient["id"]),
+                            delta=points,
+                            reason="recognition_award",
+                            ref_type="recognition",
+                            ref_id=recognition_id,
+                        ).dict()
+                    )
+            if giver:
+                givers[giver.id] = giver
+                spent[giver.id] = spent.get(giver.id, 0) + points
+
+        # Debits go first so an exhausted allowance fails the payout before
+        # anything is credited
+        await self._debit_allowances(db, givers, spent, org_id=org_id, now=now, touched=touched, session=session)
+
+        writes = [
+            UpdateOne(
+                {"id": user_id, "org_id": org_id},
+                {
+                    "$inc": {"points_balance": points, "total_points_earned": points, "recognition_count": count},
+                    "$set": {"updated_at": now},
+                },
             )
-            if points > 0 and recognition_id:
-                ledger_entry = PointsLedgerEntry(
-                    org_id=org_id,
-                    user_id=str(recipient["id"]),
-                    delta=points,
-                    reason="recognition_award",
-                    ref_type="recognition",
-                    ref_id=recognition_id,
-                )
-                await db.points_ledger.insert_one(ledger_entry.dict(), **kwargs)
+            for user_id, (points, count) in credits.items()
+        ]
+        touched.update(credits)
+        if writes:
+            await db.users.bulk_write(writes, ordered=False, **kwargs)
+
+        if ledger_entries:
+            await db.points_ledger.insert_many(ledger_entries, ordered=False, **kwargs)
 
-    async def _update_manager_allowance(
+    async def _debit_allowances(
         self,
-        current_user: User,
-        points: int,
+        db,
+        givers: Dict[str, User],
+        spent: Dict[str, int],
         *,
         org_id: str,
+        now: datetime,
+        touched: Set[str],
         session=None,
     ) -> None:
-        if points <= 0:
-            return
-        if _normalize_role(current_user.role) not in MANAGER_ROLES:
-            return
-        db = await get_database()
+        """Charge manager allowances, adding each giver tried to `touched`.
+
+        The earlier allowance checks run against the caller's (possibly
+        cached) user, so each debit is conditional on the stored balance and
+        a debit that no longer fits raises instead of overspending (the
+        giver's cached copy is then refreshed too).
+        """
         kwargs = {"session": session} if session else {}
-        await db.users.update_one(
-            {"id": current_user.id, "org_id": org_id},
-            {"$inc": {"monthly_points_spent": points}, "$set": {"updated_at": datetime.utcnow()}},
-            **kwargs,
-        )
+        charged: List[Tuple[str, int]] = []
+        for giver_id, points in spent.items():
+            giver = givers[giver_id]
+            if points <= 0 or _normalize_role(giver.role) not in MANAGER_ROLES:
+                continue
+            touched.add(giver_id)
+            query: Dict[str, object] = {"id": giver_id, "org_id": org_id}
+            allowance = giver.monthly_points_allowance
+            if allowance is not None:
+                # A missing monthly_points_spent counts as 0
+                query["$or"] = [{"monthly_points_spent": {"$lte": allowance - points}}, {"monthly_points_spent": None}]
+            debited = allowance is None or points <= allowance
+            if debited:
+                result = await db.users.update_one(
+                    query,
+                    {"$inc": {"monthly_points_spent": points}, "$set": {"updated_at": now}},
+                    **kwargs,
+                )
+                debited = result.matched_count > 0
+            if not debited:
+                if session is None:
+                    # No transaction to roll back the givers already charged
+                    for charged_id, charged_points in charged:
+                        await db.users.update_one(
+                            {"id": charged_id, "org_id": org_id},
+                            {"$inc": {"monthly_points_spent": -charged_points}},
+                        )
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Monthly points allowance exceeded.",
+                )
+            charged.append((giver_id, points))
+
+    def _invalidate_principals(self, org_id: str, user_ids: Collection[str]) -> None:
+        for user_id in user_ids:
+            invalidate_principal(org_id, user_id)
 
     async def _load_users(self, user_ids: Sequence[str], *, org_id: str) -> List[Dict[str, object]]:
         db = await get_database()
@@ -748,7 +1376,7 @@ class RecognitionService:
 
         if scope == RecognitionScope.REPORT and user_role not in PRIVILEGED_ROLES:
             if downline_user_ids is None:
-                downline_user_ids = await self._get_downline_user_ids(current_user)
+                downline_user_ids = self._downline_recipient_ids(current_user, recipients)
             for recipient in recipients:
                 if recipient.get("id") in downline_user_ids:
                     continue
@@ -757,14 +1385,21 @@ class RecognitionService:
                     detail="Report recognition is limited to your reporting line.",
                 )
 
-    def _determine_points(self, user_role: UserRole, requested_points: Optional[int], *, allow_points: bool = True) -> int:
+    def _determine_points(
+        self,
+        user_role: UserRole,
+        requested_points: Optional[int],
+        *,
+        allow_points: bool = True,
+        default_points: int = DEFAULT_POINTS,
+    ) -> int:
         if user_role in PRIVILEGED_ROLES:
-            points = requested_points if requested_points is not None else DEFAULT_POINTS
+            points = requested_points if requested_points is not None else default_points
         elif allow_points:
-            if requested_points not in (None, DEFAULT_POINTS):
+            if requested_points not in (None, default_points):
                 # Non-privileged roles cannot override the default
                 pass
-            points = DEFAULT_POINTS
+            points = default_points
         else:
             points = 0
 
@@ -815,31 +1450,18 @@ class RecognitionService:
             return "peer_scope" if points_eligible else "outside_peer_scope"
         return "standard_points"
 
-    async def _get_downline_user_ids(self, current_user: User) -> set[str]:
-        db = await get_database()
-        docs = await db.users.find(
-            {"org_id": current_user.org_id},
-            {"_id": 0, "id": 1, "manager_id": 1, "is_active": 1},
-        ).to_list(10000)
-        reports_by_manager: Dict[str, List[str]] = {}
-        for doc in docs:
-            if doc.get("is_active") is False:
-                continue
-            manager_id = doc.get("manager_id")
-            if manager_id:
-                reports_by_manager.setdefault(manager_id, []).append(doc["id"])
-
-        downline: set[str] = set()
-        stack = [current_user.id]
-        while stack:
-            manager_id = stack.pop()
-            for report_id in reports_by_manager.get(manager_id, []):
-                if report_id in downline:
-                    continue
-                downline.add(report_id)
-                stack.append(report_id)
-
-        return downline
+    def _downline_recipient_ids(
+        self,
+        current_user: User,
+        recipients: Sequence[Dict[str, object]],
+    ) -> set[str]:
+        """Recipients in the current user's reporting line, read from their manager_chain."""
+        return {
+            str(recipient.get("id"))
+            for recipient in recipients
+            if recipient.get("is_active") is not False
+            and current_user.id in (recipient.get("manager_chain") or [])
+        }
 
     def _map_user_summary(self, data: Dict[str, object]) -> RecognitionUserSummary:
         return RecognitionUserSummary(
@@ -884,6 +1506,21 @@ class RecognitionService:
         recognition.credited_points = self._resolve_credited_points(recognition.points_awarded, recognition.status)
         return recognition
 
+    def _feed_entry_from_recognition(self, recognition: Recognition) -> RecognitionFeedEntry:
+        return RecognitionFeedEntry(
+            id=recognition.id,
+            message=recognition.message,
+            points_awarded=recognition.points_awarded,
+            recognition_type=recognition.recognition_type,
+            created_at=recognition.created_at,
+            from_user=recognition.from_user_snapshot,
+            to_users=recognition.to_user_snapshots,
+            values_tags=recognition.values_tags,
+            reactions=_reaction_summaries(recognition.reaction_counts),
+            points_status=recognition.points_status,
+            credited_points=recognition.credited_points,
+        )
+
     def _build_recognition_from_record(self, record: Dict[str, object]) -> Recognition:
         recognition = Recognition(**record)
         return self._apply_points_status(recognition)
@@ -5,9 +5,10 @@ from typing import List, Optional
 
 from fastapi import HTTPException, status
 from motor.motor_asyncio import AsyncIOMotorClientSession
-from pymongo.errors import OperationFailure
 
+from app.core.cache import invalidate_principal
 from app.database.connection import get_database
+from app.database.transactions import run_in_transaction
 from app.models.points_ledger import PointsLedgerEntry
 from app.models.recognition import RewardRedemption, RewardRedemptionCreate
 from app.models.reward import Reward
@@ -15,12 +16,6 @@ from app.models.enums import RewardProvider, RedemptionStatus
 from app.models.user import User
 
 
-def _is_transaction_unsupported(error: OperationFailure) -> bool:
-    if error.code == 20:
-        return True
-    return "Transaction numbers are only allowed" in str(error)
-
-
 class RedemptionProviderHandler:
     provider: RewardProvider
 
@@ -93,63 +88,27 @@ class RedemptionService:
             status=initial_status,
         )
 
-        client = getattr(db, "client", None)
-        session = None
-        transaction_started = False
-
-        if client:
-            try:
-                session = await client.start_session()
-                session.start_transaction()
-                transaction_started = True
-            except (OperationFailure, AttributeError):
-                if session:
-                    await session.end_session()
-                session = None
-
-        use_transaction = bool(transaction_started and session)
-        if use_transaction:
-            try:
-                await self._decrement_availability(
-                    reward.id,
-                    org_id=current_user.org_id,
-                    session=session,
-                )
-                await self._debit_points(
-                    current_user.id,
-                    current_user.org_id,
-                    reward.points_required,
-                    session=session,
-                )
-                await db.redemptions.insert_one(redemption.dict(), session=session)
-                await self._record_ledger_entry(
-                    redemption,
-                    org_id=current_user.org_id,
-                    session=session,
-                )
-                await session.commit_transaction()
-            except OperationFailure as exc:
-                if _is_transaction_unsupported(exc):
-                    try:
-                        await session.abort_transaction()
-                    except Exception:
-                        pass
-                    await session.end_session()
-                    use_transaction = False
-                    session = None
-                else:
-                    await session.abort_transaction()
-                    await session.end_session()
-                    raise
-            except Exception:
-                await session.abort_transaction()
-                await session.end_session()
-                raise
-            else:
-                await session.end_session()
-                return redemption
+        async def write(session) -> RewardRedemption:
+            await self._decrement_availability(
+                reward.id,
+                org_id=current_user.org_id,
+                session=session,
+            )
+            await self._debit_points(
+                current_user.id,
+                current_user.org_id,
+                reward.points_required,
+                session=session,
+            )
+            await db.redemptions.insert_one(redemption.dict(), session=session)
+            await self._record_ledger_entry(
+                redemption,
+                org_id=current_user.org_id,
+                session=session,
+            )
+            return redemption
 
-        if not use_transaction:
+        async def write_with_compensation() -> RewardRedemption:
             await self._decrement_availability(reward.id, org_id=current_user.org_id)
             try:
                 await self._debit_points(current_user.id, current_user.org_id, reward.points_required)
@@ -164,8 +123,9 @@ class RedemptionService:
                 await self._credit_points(current_user.id, current_user.org_id, reward.points_required)
                 await self._increment_availability(reward.id, org_id=current_user.org_id)
                 raise
+            return redemption
 
-        return redemption
+        return await run_in_transaction(db, write, fallback=write_with_compensation)
 
     async def get_user_redemptions(
         self,
@@ -220,6 +180,7 @@ class RedemptionService:
         matched = result.get("matched_count") if isinstance(result, dict) else result.matched_count
         if matched == 0:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Insufficient points to redeem reward")
+        invalidate_principal(org_id, user_id)
 
     async def _credit_points(self, user_id: str, org_id: str, points: int) -> None:
         if points <= 0:
@@ -230,6 +191,7 @@ class RedemptionService:
             {"id": user_id, "org_id": org_id},
             {"$inc": {"points_balance": points}, "$set": {"updated_at": datetime.utcnow()}},
         )
+        invalidate_principal(org_id, user_id)
 
     async def _record_ledger_entry(
         self,
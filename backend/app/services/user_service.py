@@ -1,8 +1,10 @@
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException, status
 from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo import UpdateOne
 
 from app.models.user import (
     User,
@@ -10,10 +12,76 @@ from app.models.user import (
     UserPreferences,
     UserReportingUpdate,
     OrgChartNode,
+    OrgChartSubtree,
+    OrgChartSubtreeNode,
     UserResponse,
 )
+from app.core.cache import invalidate_org_chart, invalidate_principal, org_chart_cache
+from app.core.search import user_search_fields
 from app.database.connection import get_database
 
+# Upper bound on nodes returned by one subtree request, whatever depth and
+# page size were asked for; expansion is breadth-first, so the shallowest
+# levels are always complete.
+MAX_SUBTREE_NODES = 5000
+
+# Profile fields that feed the recipient typeahead keys
+SEARCH_SOURCE_FIELDS = {"first_name", "last_name", "department"}
+
+ORG_CHART_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "first_name": 1,
+    "last_name": 1,
+    "role": 1,
+    "department": 1,
+    "manager_id": 1,
+}
+
+
+class OrgHierarchySnapshot:
+    """Read-only reporting hierarchy for one org, built from a single query.
+
+    Children are stored as pre-sorted id tuples so a subtree page is a slice.
+    Users whose manager is missing from the org are treated as top level.
+    """
+
+    def __init__(self, users: List[Dict[str, Any]]) -> None:
+        self.people: Dict[str, Dict[str, Any]] = {}
+        for user in users:
+            self.people[user["id"]] = {
+                "id": user["id"],
+                "first_name": user.get("first_name", ""),
+                "last_name": user.get("last_name", ""),
+                "role": user.get("role"),
+                "department": user.get("department"),
+                "manager_id": user.get("manager_id") or None,
+            }
+
+        children: Dict[str, List[str]] = {}
+        roots: List[str] = []
+        for person in self.people.values():
+            manager_id = person["manager_id"]
+            if manager_id and manager_id in self.people and manager_id != person["id"]:
+                children.setdefault(manager_id, []).append(person["id"])
+            else:
+                roots.append(person["id"])
+
+        def sort_key(user_id: str) -> Tuple[str, str, str]:
+            person = self.people[user_id]
+            return (person["last_name"], person["first_name"], user_id)
+
+        self.roots: Tuple[str, ...] = tuple(sorted(roots, key=sort_key))
+        self.children: Dict[str, Tuple[str, ...]] = {
+            manager_id: tuple(sorted(report_ids, key=sort_key)) for manager_id, report_ids in children.items()
+        }
+
+    def children_of(self, user_id: Optional[str]) -> Tuple[str, ...]:
+        if user_id is None:
+            return self.roots
+        return self.children.get(user_id, ())
+
+
 class UserService:
     def __init__(self):
         pass
@@ -24,11 +92,22 @@ class UserService:
         
         update_dict = {k: v for k, v in update_data.dict().items() if v is not None}
         update_dict["updated_at"] = datetime.utcnow()
+        if update_dict.keys() & SEARCH_SOURCE_FIELDS:
+            existing = await db.users.find_one({"id": user_id, "org_id": org_id}, {"_id": 0, "email": 1})
+            merged = {**(existing or {}), **update_dict}
+            update_dict.update(user_search_fields(
+                merged.get("first_name"),
+                merged.get("last_name"),
+                merged.get("email"),
+                merged.get("department"),
+            ))
         
         await db.users.update_one(
             {"id": user_id, "org_id": org_id},
             {"$set": update_dict}
         )
+        invalidate_principal(org_id, user_id)
+        invalidate_org_chart(org_id)
         
         updated_user = await db.users.find_one({"id": user_id, "org_id": org_id})
         return User(**updated_user)
@@ -53,6 +132,7 @@ class UserService:
             {"id": user_id, "org_id": org_id},
             {"$set": {"preferences": current_preferences, "updated_at": datetime.utcnow()}}
         )
+        invalidate_principal(org_id, user_id)
         
         updated_user = await db.users.find_one({"id": user_id, "org_id": org_id})
         return User(**updated_user)
@@ -77,6 +157,7 @@ class UserService:
 
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="User not found")
+        invalidate_principal(org_id, user_id)
 
         updated_user = await db.users.find_one({"id": user_id, "org_id": org_id})
 
@@ -97,73 +178,184 @@ class UserService:
         return [User(**user) for user in users]
 
     async def get_descendants(self, manager_id: str, org_id: str) -> List[str]:
-        """Fetch all descendant user IDs under a manager."""
+        """Fetch all descendant user IDs under a manager, nearest levels first."""
         if not manager_id:
             return []
 
         db = await get_database()
-        cursor = db.users.find({"org_id": org_id}, {"id": 1, "manager_id": 1})
+        cursor = db.users.find(
+            {"org_id": org_id, "manager_chain": manager_id},
+            {"_id": 0, "id": 1, "manager_chain": 1},
+        )
         users = await cursor.to_list(length=None)
+        users.sort(key=lambda user: (len(user.get("manager_chain") or []), user["id"]))
+        return [user["id"] for user in users]
 
-        children_by_manager: dict[str, list[str]] = {}
-        for user in users:
-            parent_id = user.get("manager_id")
-            if not parent_id:
-                continue
-            children_by_manager.setdefault(parent_id, []).append(user["id"])
+    async def resolve_manager_chain(
+        self,
+        manager_id: Optional[str],
+        *,
+        org_id: str,
+        user_id: Optional[str] = None,
+    ) -> List[str]:
+        """Ancestor list for someone reporting to `manager_id`.
 
-        for children in children_by_manager.values():
-            children.sort()
+        Rejects reporting lines that would make `user_id` its own ancestor.
+        """
+        if not manager_id:
+            return []
+        if manager_id == user_id:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="A user cannot report to themselves")
 
-        descendants: list[str] = []
-        queue = list(children_by_manager.get(manager_id, []))
-        while queue:
-            current_id = queue.pop(0)
-            descendants.append(current_id)
-            queue.extend(children_by_manager.get(current_id, []))
+        db = await get_database()
+        manager = await db.users.find_one(
+            {"id": manager_id, "org_id": org_id},
+            {"_id": 0, "manager_chain": 1},
+        )
+        chain = [manager_id] + list((manager or {}).get("manager_chain") or [])
+        if user_id and user_id in chain:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Reporting line would create a cycle",
+            )
+        return chain
 
-        return descendants
+    async def rebuild_manager_chains(self, org_id: str) -> int:
+        """Recompute every manager_chain in an org from manager_id.
 
-    async def get_org_chart(self, org_id: str) -> List[OrgChartNode]:
-        """Return a hierarchical org chart starting at top-level users."""
+        Used after bulk imports and for backfills; only documents whose chain
+        changed are written. Returns the number of users updated.
+        """
         db = await get_database()
-        projection = {
-            "id": 1,
-            "first_name": 1,
-            "last_name": 1,
-            "role": 1,
-            "department": 1,
-            "manager_id": 1,
-        }
-        users = await db.users.find({"org_id": org_id}, projection).to_list(length=None)
+        users = await db.users.find(
+            {"org_id": org_id},
+            {"_id": 0, "id": 1, "manager_id": 1, "manager_chain": 1},
+        ).to_list(length=None)
+        manager_of = {user["id"]: user.get("manager_id") for user in users}
 
-        nodes: Dict[str, OrgChartNode] = {}
+        chains: Dict[str, List[str]] = {}
         for user in users:
-            manager_id = user.get("manager_id") or None
-            node = OrgChartNode(
-                id=user["id"],
-                first_name=user.get("first_name", ""),
-                last_name=user.get("last_name", ""),
-                role=user.get("role"),
-                department=user.get("department"),
-                manager_id=manager_id,
+            chain: List[str] = []
+            seen = {user["id"]}
+            current = manager_of.get(user["id"])
+            while current and current not in seen:
+                if current in chains:
+                    chain.extend([current] + [ancestor for ancestor in chains[current] if ancestor not in seen])
+                    break
+                chain.append(current)
+                seen.add(current)
+                current = manager_of.get(current)
+            chains[user["id"]] = chain
+
+        changed = [user["id"] for user in users if (user.get("manager_chain") or []) != chains[user["id"]]]
+        if changed:
+            await db.users.bulk_write(
+                [
+                    UpdateOne({"id": user_id, "org_id": org_id}, {"$set": {"manager_chain": chains[user_id]}})
+                    for user_id in changed
+                ],
+                ordered=False,
             )
-            nodes[node.id] = node
+            for user_id in changed:
+                invalidate_principal(org_id, user_id)
+        # Callers run this after bulk changes to users, so drop the snapshot even
+        # when every chain was already correct.
+        invalidate_org_chart(org_id)
+        return len(changed)
+
+    async def _reparent_descendants(self, user_id: str, chain: List[str], *, org_id: str) -> None:
+        """Rewrite the chains below `user_id` after its own chain changed."""
+        db = await get_database()
+        descendants = await db.users.find(
+            {"org_id": org_id, "manager_chain": user_id},
+            {"_id": 0, "id": 1, "manager_chain": 1},
+        ).to_list(length=None)
+        writes = []
+        for descendant in descendants:
+            current_chain = descendant.get("manager_chain") or []
+            prefix = current_chain[: current_chain.index(user_id) + 1]
+            writes.append(
+                UpdateOne(
+                    {"id": descendant["id"], "org_id": org_id},
+                    {"$set": {"manager_chain": prefix + chain}},
+                )
+            )
+        if writes:
+            await db.users.bulk_write(writes, ordered=False)
+            for descendant in descendants:
+                invalidate_principal(org_id, descendant["id"])
 
-        roots: List[OrgChartNode] = []
-        for node in nodes.values():
-            if node.manager_id and node.manager_id in nodes:
-                nodes[node.manager_id].children.append(node)
-            else:
-                roots.append(node)
+    async def get_org_hierarchy(self, org_id: str) -> OrgHierarchySnapshot:
+        """Return the cached hierarchy snapshot for an org, building it on a miss."""
+
+        async def load() -> OrgHierarchySnapshot:
+            db = await get_database()
+            users = await db.users.find({"org_id": org_id}, ORG_CHART_PROJECTION).to_list(length=None)
+            return OrgHierarchySnapshot(users)
 
-        def sort_nodes(items: List[OrgChartNode]) -> None:
-            items.sort(key=lambda entry: (entry.last_name, entry.first_name, entry.id))
-            for item in items:
-                sort_nodes(item.children)
+        return await org_chart_cache.get_or_load(org_id, load)
 
-        sort_nodes(roots)
-        return roots
+    async def get_org_chart(self, org_id: str) -> List[OrgChartNode]:
+        """Return a hierarchical org chart starting at top-level users."""
+        snapshot = await self.get_org_hierarchy(org_id)
+        nodes = {user_id: OrgChartNode(**person) for user_id, person in snapshot.people.items()}
+        for manager_id, report_ids in snapshot.children.items():
+            nodes[manager_id].children = [nodes[report_id] for report_id in report_ids]
+        return [nodes[root_id] for root_id in snapshot.roots]
+
+    async def get_org_chart_subtree(
+        self,
+        org_id: str,
+        *,
+        root_id: Optional[str] = None,
+        depth: int = 1,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> OrgChartSubtree:
+        """Return one page of a node's reports, expanded `depth` levels down.
+
+        Without `root_id` the page is taken from the top-level users. `offset`
+        pages the first level only; deeper levels show their first `limit`
+        reports, and `child_count` tells the client whether to fetch more.
+        """
+        snapshot = await self.get_org_hierarchy(org_id)
+        if root_id is not None and root_id not in snapshot.people:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+        def make_node(user_id: str) -> OrgChartSubtreeNode:
+            return OrgChartSubtreeNode(
+                **snapshot.people[user_id],
+                child_count=len(snapshot.children_of(user_id)),
+            )
+
+        top_level = snapshot.children_of(root_id)
+        items = [make_node(user_id) for user_id in top_level[offset:offset + limit]]
+        budget = MAX_SUBTREE_NODES - len(items)
+        truncated = False
+
+        queue: Deque[Tuple[OrgChartSubtreeNode, int]] = deque((node, 1) for node in items)
+        while queue:
+            node, level = queue.popleft()
+            if level >= depth or not node.child_count:
+                continue
+            report_ids = snapshot.children_of(node.id)[:limit]
+            if len(report_ids) > budget:
+                truncated = True
+                break
+            budget -= len(report_ids)
+            for report_id in report_ids:
+                child = make_node(report_id)
+                node.children.append(child)
+                queue.append((child, level + 1))
+
+        return OrgChartSubtree(
+            root=make_node(root_id) if root_id is not None else None,
+            items=items,
+            total=len(top_level),
+            offset=offset,
+            limit=limit,
+            truncated=truncated,
+        )
 
     async def debit_points(
         self,
@@ -189,6 +381,7 @@ class UserService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Insufficient balance to award recognition"
             )
+        invalidate_principal(org_id, user_id)
 
     async def credit_recognition(
         self,
@@ -218,6 +411,7 @@ class UserService:
 
         if result.matched_count == 0:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recipient not found")
+        invalidate_principal(org_id, user_id)
 
     async def update_reporting(self, user_id: str, org_id: str, payload: UserReportingUpdate) -> User:
         """Update reporting lines and roles for a user."""
@@ -230,17 +424,34 @@ class UserService:
         if payload.role is not None:
             update_dict["role"] = payload.role
 
+        existing = await db.users.find_one({"id": user_id, "org_id": org_id})
+        if not existing:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
         if not update_dict:
-            existing = await db.users.find_one({"id": user_id, "org_id": org_id})
-            if not existing:
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
             return User(**existing)
 
+        manager_changed = "manager_id" in update_dict and existing.get("manager_id") != update_dict["manager_id"]
+        if manager_changed:
+            update_dict["manager_chain"] = await self.resolve_manager_chain(
+                update_dict["manager_id"],
+                org_id=org_id,
+                user_id=user_id,
+            )
+
         update_dict["updated_at"] = datetime.utcnow()
+        update: Dict[str, Dict[str, object]] = {"$set": update_dict}
+        # Role and manager are signed into claim-bearing access tokens; bumping
+        # the version revokes tokens issued before the change.
+        if any(key in update_dict and existing.get(key) != update_dict[key] for key in ("role", "manager_id")):
+            update["$inc"] = {"token_version": 1}
 
-        result = await db.users.update_one({"id": user_id, "org_id": org_id}, {"$set": update_dict})
+        result = await db.users.update_one({"id": user_id, "org_id": org_id}, update)
         if result.matched_count == 0:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        invalidate_principal(org_id, user_id)
+        invalidate_org_chart(org_id)
+        if manager_changed:
+            await self._reparent_descendants(user_id, update_dict["manager_chain"], org_id=org_id)
 
         updated = await db.users.find_one({"id": user_id, "org_id": org_id})
         return User(**updated)
@@ -249,12 +460,14 @@ class UserService:
         """Activate or deactivate a user account."""
         db = await get_database()
 
-        result = await db.users.update_one(
-            {"id": user_id, "org_id": org_id},
-            {"$set": {"is_active": is_active, "updated_at": datetime.utcnow()}},
-        )
+        update: Dict[str, Dict[str, object]] = {"$set": {"is_active": is_active, "updated_at": datetime.utcnow()}}
+        if not is_active:
+            update["$inc"] = {"token_version": 1}
+
+        result = await db.users.update_one({"id": user_id, "org_id": org_id}, update)
         if result.matched_count == 0:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        invalidate_principal(org_id, user_id)
 
         updated = await db.users.find_one({"id": user_id, "org_id": org_id})
         return User(**updated)
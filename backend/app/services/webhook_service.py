@@ -1,42 +1,101 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import logging
-from typing import Any, Iterable, Mapping, Sequence
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Deque, Dict, Mapping, Optional, Sequence
 
 import httpx
 
+from app.core.config import settings
 from app.models.recognition import Recognition
 
 logger = logging.getLogger(__name__)
 
+# Latency samples kept for the percentiles reported by `stats`
+LATENCY_SAMPLES = 1000
+
+
+class WebhookRejected(httpx.HTTPStatusError):
+    """The hook refused the post outright (a 4xx other than 429, such as a
+    deleted Slack hook's 404/410); retrying will not help."""
+
+
+def _retryable(response: httpx.Response) -> bool:
+    return response.status_code == 429 or response.status_code >= 500
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    value = (response.headers.get("Retry-After") or "").strip()
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
 
 class WebhookNotifier:
+    """Posts recognition messages to Slack / Teams incoming webhooks.
+
+    Between `start` and `close` (the app lifespan) every POST goes through one
+    pooled keep-alive client; outside it each call opens a short-lived client.
+    Concurrent requests per host are capped, and throttled or failing requests
+    are retried with backoff before the error is raised to the caller.
+    """
+
     def __init__(
         self,
         *,
-        timeout_seconds: float = 3.0,
+        timeout_seconds: Optional[float] = None,
         client_factory: type[httpx.AsyncClient] = httpx.AsyncClient,
     ) -> None:
-        self._timeout = httpx.Timeout(timeout_seconds)
+        self._timeout = httpx.Timeout(
+            timeout_seconds if timeout_seconds is not None else settings.WEBHOOK_TIMEOUT_SECONDS
+        )
         self._client_factory = client_factory
+        self._client: Optional[httpx.AsyncClient] = None
+        self._http2 = False
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._latencies_ms: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.requests = 0
+        self.delivered = 0
+        self.failed = 0
+        self.retries = 0
 
-    def queue_public_recognition(
-        self,
-        org: Mapping[str, Any],
-        recognition: Recognition,
-        from_user: Mapping[str, Any],
-        to_users: Sequence[Mapping[str, Any]],
-    ) -> None:
-        if not recognition.is_public:
+    def start(self) -> None:
+        if self._client is not None:
             return
-        urls = self._collect_urls(org)
-        if not urls:
-            return
-        try:
-            asyncio.create_task(self.notify_public_recognition(org, recognition, from_user, to_users))
-        except RuntimeError:
-            logger.warning("Webhook notification skipped because no running event loop is available.")
+        # httpx refuses http2=True without the optional h2 package
+        self._http2 = settings.WEBHOOK_HTTP2 and importlib.util.find_spec("h2") is not None
+        self._client = self._client_factory(
+            timeout=self._timeout,
+            limits=httpx.Limits(
+                max_connections=settings.WEBHOOK_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.WEBHOOK_MAX_CONNECTIONS,
+                keepalive_expiry=settings.WEBHOOK_KEEPALIVE_SECONDS,
+            ),
+            http2=self._http2,
+        )
+
+    async def close(self) -> None:
+        client, self._client = self._client, None
+        self._host_slots.clear()
+        if client is not None:
+            await client.aclose()
 
     async def notify_public_recognition(
         self,
@@ -45,23 +104,23 @@ class WebhookNotifier:
         from_user: Mapping[str, Any],
         to_users: Sequence[Mapping[str, Any]],
     ) -> None:
-        urls = self._collect_urls(org)
+        urls = self.collect_urls(org)
         if not urls:
             return
-        payload = {"text": self._format_recognition_message(recognition, from_user, to_users)}
+        payload = {"text": self.format_recognition_message(recognition, from_user, to_users)}
         await asyncio.gather(
             *[self._post_payload(url, payload) for url in urls],
             return_exceptions=True,
         )
 
-    def _collect_urls(self, org: Mapping[str, Any]) -> list[str]:
+    def collect_urls(self, org: Mapping[str, Any]) -> list[str]:
         urls = [
             (org.get("slack_webhook_url") or "").strip(),
             (org.get("teams_webhook_url") or "").strip(),
         ]
         return [url for url in urls if url]
 
-    def _format_recognition_message(
+    def format_recognition_message(
         self,
         recognition: Recognition,
         from_user: Mapping[str, Any],
@@ -77,13 +136,101 @@ class WebhookNotifier:
             return f"{base_message} ({points_label}) | Values: {tags}"
         return f"{base_message} ({points_label})"
 
+    def format_digest_message(self, lines: Sequence[str]) -> str:
+        """Combine lines from `format_recognition_message` into one post."""
+        if len(lines) == 1:
+            return lines[0]
+        items = "\n".join(f"• {line.removeprefix('🎉 ')}" for line in lines)
+        return f"🎉 {len(lines)} new recognitions:\n{items}"
+
     async def _post_payload(self, url: str, payload: Mapping[str, Any]) -> None:
         try:
-            async with self._client_factory(timeout=self._timeout) as client:
-                await client.post(url, json=payload)
+            await self.post(url, payload)
         except Exception:
             logger.exception("Failed to send webhook notification to %s", url)
 
+    async def post(self, url: str, payload: Mapping[str, Any]) -> None:
+        """POST one payload; raises once retries are exhausted, or
+        `WebhookRejected` at once on a non-retryable response."""
+        async with self._client_scope() as client, self._host_slot(httpx.URL(url).host):
+            # The host slot is held through backoff so a throttled host does
+            # not get more parallel requests while it is asking for fewer
+            attempt = 0
+            while True:
+                self.requests += 1
+                started = time.perf_counter()
+                try:
+                    response = await client.post(url, json=payload)
+                except httpx.TransportError as exc:
+                    error: Exception = exc
+                    delay = self._backoff(attempt)
+                else:
+                    if not _retryable(response):
+                        self._latencies_ms.append((time.perf_counter() - started) * 1000)
+                        if not response.is_success:
+                            self.failed += 1
+                            raise WebhookRejected(
+                                f"Webhook rejected the post with {response.status_code}",
+                                request=response.request,
+                                response=response,
+                            )
+                        self.delivered += 1
+                        return
+                    error = httpx.HTTPStatusError(
+                        f"Webhook returned {response.status_code}", request=response.request, response=response
+                    )
+                    retry_after = _retry_after_seconds(response)
+                    delay = retry_after if retry_after is not None else self._backoff(attempt)
+
+                if attempt >= settings.WEBHOOK_MAX_RETRIES or delay > settings.WEBHOOK_RETRY_MAX_SECONDS:
+                    self.failed += 1
+                    raise error
+                attempt += 1
+                self.retries += 1
+                await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def _client_scope(self) -> AsyncIterator[httpx.AsyncClient]:
+        if self._client is not None:
+            yield self._client
+            return
+        async with self._client_factory(timeout=self._timeout) as client:
+            yield client
+
+    @asynccontextmanager
+    async def _host_slot(self, host: str) -> AsyncIterator[None]:
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(max(settings.WEBHOOK_MAX_CONNECTIONS_PER_HOST, 1))
+        async with slot:
+            yield
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        delay = min(settings.WEBHOOK_RETRY_BASE_SECONDS * 2 ** attempt, settings.WEBHOOK_RETRY_MAX_SECONDS)
+        return delay * random.uniform(0.5, 1.0)
+
+    def stats(self) -> Dict[str, Any]:
+        samples = sorted(self._latencies_ms)
+
+        def percentile(fraction: float) -> float:
+            if not samples:
+                return 0.0
+            return round(samples[min(int(len(samples) * fraction), len(samples) - 1)], 2)
+
+        return {
+            "pooled": self._client is not None,
+            "http2": self._http2,
+            "hosts": len(self._host_slots),
+            "requests": self.requests,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "retries": self.retries,
+            "latency_ms_p50": percentile(0.5),
+            "latency_ms_p95": percentile(0.95),
+            "latency_ms_max": round(samples[-1], 2) if samples else 0.0,
+        }
+
     @staticmethod
     def _format_name(user: Mapping[str, Any]) -> str:
         first = (user.get("first_name") or "").strip()
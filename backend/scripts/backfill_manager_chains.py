@@ -0,0 +1,23 @@
+import asyncio
+
+from app.database.connection import connect_to_mongo, close_mongo_connection, get_database
+from app.services.user_service import user_service
+
+async def backfill_manager_chains() -> None:
+    await connect_to_mongo()
+    try:
+        db = await get_database()
+
+        # manager_chain is derived from manager_id, so recomputing it per org is
+        # safe to run repeatedly; only users whose chain changed are written
+        org_ids = [org_id for org_id in await db.users.distinct("org_id") if org_id]
+        updated = 0
+        for org_id in org_ids:
+            updated += await user_service.rebuild_manager_chains(org_id)
+
+        print(f"Manager chain backfill complete: {updated} users updated across {len(org_ids)} orgs.")
+    finally:
+        await close_mongo_connection()
+
+if __name__ == "__main__":
+    asyncio.run(backfill_manager_chains())
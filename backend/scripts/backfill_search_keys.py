@@ -0,0 +1,41 @@
+import asyncio
+
+from pymongo import UpdateOne
+
+from app.core.search import user_search_fields
+from app.database.connection import connect_to_mongo, close_mongo_connection, get_database
+
+BATCH_SIZE = 1000
+
+async def backfill_search_keys() -> None:
+    await connect_to_mongo()
+    try:
+        db = await get_database()
+        projection = {"_id": 0, "id": 1, "org_id": 1, "first_name": 1, "last_name": 1, "email": 1,
+                      "department": 1, "search_name": 1, "search_prefixes": 1}
+
+        # The keys are derived from the profile fields, so this is safe to run
+        # repeatedly; only users whose keys changed are written
+        writes = []
+        updated = 0
+        async for user in db.users.find({}, projection):
+            fields = user_search_fields(
+                user.get("first_name"), user.get("last_name"), user.get("email"), user.get("department")
+            )
+            if all(user.get(key) == value for key, value in fields.items()):
+                continue
+            writes.append(UpdateOne({"id": user["id"], "org_id": user.get("org_id")}, {"$set": fields}))
+            if len(writes) >= BATCH_SIZE:
+                await db.users.bulk_write(writes, ordered=False)
+                updated += len(writes)
+                writes = []
+        if writes:
+            await db.users.bulk_write(writes, ordered=False)
+            updated += len(writes)
+
+        print(f"Search key backfill complete: {updated} users updated.")
+    finally:
+        await close_mongo_connection()
+
+if __name__ == "__main__":
+    asyncio.run(backfill_search_keys())
@@ -0,0 +1,56 @@
+import argparse
+import statistics
+import time
+
+import bcrypt
+
+from app.core.config import settings
+
+MIN_ROUNDS = 10
+MAX_ROUNDS = 16
+
+
+def measure_hash_ms(rounds: int, samples: int) -> float:
+    """Median wall-clock time for one bcrypt hash at the given cost."""
+    password = b"calibration-password"
+    timings = []
+    for _ in range(samples):
+        salt = bcrypt.gensalt(rounds=rounds)
+        started_at = time.perf_counter()
+        bcrypt.hashpw(password, salt)
+        timings.append((time.perf_counter() - started_at) * 1000)
+    return statistics.median(timings)
+
+
+def recommend_rounds(target_ms: float, samples: int) -> int:
+    """Highest cost whose median hash time fits the budget (never below MIN_ROUNDS)."""
+    recommended = MIN_ROUNDS
+    print(f"{'rounds':>6}  {'median ms':>10}")
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        elapsed_ms = measure_hash_ms(rounds, samples)
+        marker = " (configured)" if rounds == settings.BCRYPT_ROUNDS else ""
+        print(f"{rounds:>6}  {elapsed_ms:>10.1f}{marker}")
+        if elapsed_ms > target_ms:
+            if rounds == MIN_ROUNDS:
+                print(f"Even {MIN_ROUNDS} rounds exceeds the budget; not recommending a lower cost.")
+            break
+        recommended = rounds
+    return recommended
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure bcrypt cost on this host and recommend BCRYPT_ROUNDS for a latency budget",
+    )
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=250.0,
+        help="Maximum acceptable time for one hash/verify in milliseconds (default: 250)",
+    )
+    parser.add_argument("--samples", type=int, default=3, help="Hashes to time per cost factor (default: 3)")
+
+    arguments = parser.parse_args()
+    rounds = recommend_rounds(arguments.target_ms, max(1, arguments.samples))
+    print(f"\nRecommended BCRYPT_ROUNDS={rounds} for a {arguments.target_ms:.0f} ms budget.")
+    print("Existing hashes are upgraded on each user's next successful login.")
@@ -0,0 +1,24 @@
+import asyncio
+
+from app.database.connection import connect_to_mongo, close_mongo_connection, get_database
+from app.services.recognition_service import recognition_service
+
+async def migrate_reactions() -> None:
+    await connect_to_mongo()
+    try:
+        db = await get_database()
+        projection = {"_id": 0, "id": 1, "org_id": 1, "reactions": 1}
+
+        # Recognitions toggled since the upgrade migrate themselves; this moves
+        # the rest. Safe to rerun: migrated records have reaction_counts set
+        migrated = 0
+        async for record in db.recognitions.find({"reaction_counts": {"$exists": False}}, projection):
+            await recognition_service.migrate_legacy_reactions(db, record["org_id"], record)
+            migrated += 1
+
+        print(f"Reaction migration complete: {migrated} recognitions migrated.")
+    finally:
+        await close_mongo_connection()
+
+if __name__ == "__main__":
+    asyncio.run(migrate_reactions())
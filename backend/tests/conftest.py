@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Dict, Tuple
 
 import pytest
 
+from app.core.cache import feed_cache, org_cache, org_chart_cache, unknown_org_cache
 from app.models.enums import UserRole
 from app.models.user import User
 from app.services.recognition_service import RecognitionService
+from app.services.user_service import UserService
 
 from .fakes import FakeDatabase
 
@@ -37,6 +40,16 @@ def _make_user(
     )
 
 
+@pytest.fixture(autouse=True)
+def _clear_org_caches():
+    # Every test builds its own FakeDatabase for the same org ids.
+    for cache in (org_chart_cache, feed_cache, org_cache, unknown_org_cache):
+        cache.clear()
+    yield
+    for cache in (org_chart_cache, feed_cache, org_cache, unknown_org_cache):
+        cache.clear()
+
+
 @pytest.fixture
 def recognition_service_setup(monkeypatch: pytest.MonkeyPatch) -> Tuple[RecognitionService, FakeDatabase, Dict[str, User]]:
     manager = _make_user(user_id="manager-1", role=UserRole.MANAGER, monthly_points_allowance=500)
@@ -63,4 +76,6 @@ def recognition_service_setup(monkeypatch: pytest.MonkeyPatch) -> Tuple[Recognit
         return db
 
     monkeypatch.setattr("app.services.recognition_service.get_database", fake_get_database)
+    monkeypatch.setattr("app.services.user_service.get_database", fake_get_database)
+    asyncio.run(UserService().rebuild_manager_chains(manager.org_id))
     return RecognitionService(), db, users
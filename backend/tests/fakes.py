@@ -5,6 +5,44 @@ from datetime import datetime
 import re
 from typing import Any, Dict, Iterable, List, Optional, Sequence
 
+from pymongo import InsertOne, ReplaceOne
+
+
+class FakeUpdateResult(dict):
+    """Update result usable both as a dict and like pymongo's UpdateResult."""
+
+    @property
+    def matched_count(self) -> int:
+        return self["matched_count"]
+
+    @property
+    def modified_count(self) -> int:
+        return self["modified_count"]
+
+    @property
+    def upserted_id(self) -> Optional[Any]:
+        return self.get("upserted_id")
+
+
+class FakeDeleteResult(dict):
+    @property
+    def deleted_count(self) -> int:
+        return self["deleted_count"]
+
+
+class FakeBulkWriteResult(dict):
+    @property
+    def inserted_count(self) -> int:
+        return self["inserted_count"]
+
+    @property
+    def matched_count(self) -> int:
+        return self["matched_count"]
+
+    @property
+    def upserted_count(self) -> int:
+        return self["upserted_count"]
+
 
 class FakeCursor:
     def __init__(self, documents: Iterable[Dict[str, Any]], projection: Optional[Dict[str, int]] = None) -> None:
@@ -37,8 +75,8 @@ class FakeCursor:
         self._limit = limit
         return self
 
-    async def to_list(self, limit: Optional[int]) -> List[Dict[str, Any]]:
-        effective_limit = self._limit if self._limit is not None else limit
+    async def to_list(self, length: Optional[int]) -> List[Dict[str, Any]]:
+        effective_limit = self._limit if self._limit is not None else length
         if effective_limit is None:
             effective_limit = len(self._documents)
         sliced = self._documents[:effective_limit]
@@ -62,6 +100,7 @@ class FakeCollection:
     def __init__(self, documents: Optional[Iterable[Dict[str, Any]]] = None) -> None:
         self._documents: Dict[str, Dict[str, Any]] = {}
         self.indexes: List[Any] = []
+        self.index_options: List[Dict[str, Any]] = []
         if documents:
             for document in documents:
                 self._upsert(document)
@@ -87,6 +126,8 @@ class FakeCollection:
                 continue
             doc_values = self._extract_values(document, key)
             if isinstance(value, dict):
+                if "$exists" in value and (key in document if "." not in key else doc_values != [None]) != value["$exists"]:
+                    return False
                 if "$ne" in value and any(doc_value == value["$ne"] for doc_value in doc_values):
                     return False
                 if "$in" in value and not any(doc_value in value["$in"] for doc_value in doc_values):
@@ -164,27 +205,197 @@ class FakeCollection:
                 return results[0] if results else None
         return None
 
+    def _apply_update(self, document: Dict[str, Any], update: Dict[str, Any]) -> None:
+        if "$inc" in update:
+            for key, value in update["$inc"].items():
+                *parents, leaf = key.split(".")
+                target = document
+                for part in parents:
+                    target = target.setdefault(part, {})
+                target[leaf] = target.get(leaf, 0) + value
+        if "$set" in update:
+            for key, value in update["$set"].items():
+                document[key] = value
+        if "$unset" in update:
+            for key in update["$unset"]:
+                document.pop(key, None)
+        if "$push" in update:
+            for key, value in update["$push"].items():
+                *parents, leaf = key.split(".")
+                target = document
+                for part in parents:
+                    target = target.setdefault(part, {})
+                target.setdefault(leaf, []).append(value)
+        document.setdefault("updated_at", datetime.utcnow())
+
+    def _upsert_document(self, query: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+        # Like MongoDB, only plain equality fields of the query seed the new document
+        document = {
+            key: value
+            for key, value in query.items()
+            if not key.startswith("$") and not (isinstance(value, dict) and any(k.startswith("$") for k in value))
+        }
+        document.update(update.get("$setOnInsert", {}))
+        self._apply_update(document, update)
+        self._upsert(document)
+        return document
+
     async def update_one(self, query: Dict[str, Any], update: Dict[str, Any], **kwargs: Any) -> Dict[str, int]:
         for document in self._documents.values():
             if self._matches(document, query):
-                if "$inc" in update:
-                    for key, value in update["$inc"].items():
-                        document[key] = document.get(key, 0) + value
-                if "$set" in update:
-                    for key, value in update["$set"].items():
-                        document[key] = value
-                document.setdefault("updated_at", datetime.utcnow())
-                return {"matched_count": 1, "modified_count": 1}
-        return {"matched_count": 0, "modified_count": 0}
+                self._apply_update(document, update)
+                return FakeUpdateResult(matched_count=1, modified_count=1)
+        if kwargs.get("upsert"):
+            document = self._upsert_document(query, update)
+            return FakeUpdateResult(matched_count=0, modified_count=0, upserted_id=document.get("id"))
+        return FakeUpdateResult(matched_count=0, modified_count=0)
+
+    async def update_many(self, query: Dict[str, Any], update: Dict[str, Any], **kwargs: Any) -> Dict[str, int]:
+        matched = 0
+        for document in self._documents.values():
+            if self._matches(document, query):
+                self._apply_update(document, update)
+                matched += 1
+        return FakeUpdateResult(matched_count=matched, modified_count=matched)
+
+    async def find_one_and_update(
+        self,
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+        projection: Optional[Dict[str, int]] = None,
+        return_document: bool = False,
+        **kwargs: Any,
+    ) -> Optional[Dict[str, Any]]:
+        for document in self._documents.values():
+            if self._matches(document, query):
+                before = deepcopy(document)
+                self._apply_update(document, update)
+                result = document if return_document else before
+                return FakeCursor([result], projection)._apply_projection(result)
+        if kwargs.get("upsert"):
+            document = self._upsert_document(query, update)
+            return FakeCursor([document], projection)._apply_projection(document) if return_document else None
+        return None
 
     async def insert_one(self, document: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
         self._upsert(document)
         return {"inserted_id": document.get("id")}
 
+    async def insert_many(self, documents: Iterable[Dict[str, Any]], **kwargs: Any) -> Dict[str, Any]:
+        inserted_ids = []
+        for document in documents:
+            self._upsert(document)
+            inserted_ids.append(document.get("id"))
+        return {"inserted_ids": inserted_ids}
+
+    async def delete_one(self, query: Dict[str, Any], **kwargs: Any) -> FakeDeleteResult:
+        for doc_id, document in list(self._documents.items()):
+            if self._matches(document, query):
+                del self._documents[doc_id]
+                return FakeDeleteResult(deleted_count=1)
+        return FakeDeleteResult(deleted_count=0)
+
+    async def delete_many(self, query: Dict[str, Any], **kwargs: Any) -> FakeDeleteResult:
+        doomed = [doc_id for doc_id, document in self._documents.items() if self._matches(document, query)]
+        for doc_id in doomed:
+            del self._documents[doc_id]
+        return FakeDeleteResult(deleted_count=len(doomed))
+
+    async def bulk_write(self, requests: Sequence[Any], **kwargs: Any) -> FakeBulkWriteResult:
+        counts = {"inserted_count": 0, "matched_count": 0, "upserted_count": 0}
+        for request in requests:
+            if isinstance(request, InsertOne):
+                self._upsert(request._doc)
+                counts["inserted_count"] += 1
+                continue
+            match_id = next(
+                (doc_id for doc_id, doc in self._documents.items() if self._matches(doc, request._filter)),
+                None,
+            )
+            if match_id is not None:
+                counts["matched_count"] += 1
+                if isinstance(request, ReplaceOne):
+                    del self._documents[match_id]
+                    self._upsert(request._doc)
+                else:
+                    self._apply_update(self._documents[match_id], request._doc)
+            elif request._upsert:
+                counts["upserted_count"] += 1
+                if isinstance(request, ReplaceOne):
+                    self._upsert(request._doc)
+                else:
+                    document = {key: value for key, value in request._filter.items() if not key.startswith("$")}
+                    document.update(request._doc.get("$setOnInsert", {}))
+                    self._apply_update(document, request._doc)
+                    self._upsert(document)
+        return FakeBulkWriteResult(**counts)
+
     async def create_index(self, keys: Any, **kwargs: Any) -> str:
         self.indexes.append(keys)
+        self.index_options.append(kwargs)
         return kwargs.get("name", str(keys))
 
+    async def create_indexes(self, models: Iterable[Any]) -> List[str]:
+        names = []
+        for model in models:
+            document = dict(model.document)
+            self.indexes.append(list(document.pop("key").items()))
+            self.index_options.append(document)
+            names.append(document["name"])
+        return names
+
+    def aggregate(self, pipeline: Sequence[Dict[str, Any]], **kwargs: Any) -> FakeCursor:
+        """Supports $match (including a simplified $text), $addFields with a
+        textScore $meta, $sort, $skip and $limit."""
+        documents = [deepcopy(doc) for doc in self._documents.values()]
+        scores: Dict[int, float] = {}
+        for stage in pipeline:
+            (operator, spec), = stage.items()
+            if operator == "$match":
+                query = dict(spec)
+                text = query.pop("$text", None)
+                documents = [doc for doc in documents if self._matches(doc, query)]
+                if text is not None:
+                    for doc in documents:
+                        scores[id(doc)] = self._text_score(doc, text["$search"])
+                    documents = [doc for doc in documents if scores[id(doc)] > 0]
+            elif operator == "$addFields":
+                for doc in documents:
+                    for field, expression in spec.items():
+                        if expression == {"$meta": "textScore"}:
+                            doc[field] = scores.get(id(doc), 0.0)
+                        else:
+                            doc[field] = expression
+            elif operator == "$sort":
+                documents = FakeCursor(documents).sort(list(spec.items()))._documents
+            elif operator == "$skip":
+                documents = documents[spec:]
+            elif operator == "$limit":
+                documents = documents[:spec]
+            else:
+                raise NotImplementedError(f"FakeCollection.aggregate does not support {operator}")
+        return FakeCursor(documents)
+
+    def _text_score(self, document: Dict[str, Any], search: str) -> float:
+        """Term-frequency score over every string in the document, standing in
+        for MongoDB's weighted, stemmed text index."""
+        words: List[str] = []
+
+        def collect(value: Any) -> None:
+            if isinstance(value, str):
+                words.extend(re.findall(r"\w+", value.lower()))
+            elif isinstance(value, dict):
+                for key, item in value.items():
+                    if key != "id" and not key.endswith(("_id", "_ids")):
+                        collect(item)
+            elif isinstance(value, list):
+                for item in value:
+                    collect(item)
+
+        collect(document)
+        terms = set(re.findall(r"\w+", search.lower()))
+        return float(sum(words.count(term) for term in terms))
+
     def values(self) -> List[Dict[str, Any]]:
         return [deepcopy(doc) for doc in self._documents.values()]
 
@@ -208,3 +419,12 @@ class FakeDatabase:
         self.redemptions = FakeCollection(redemptions)
         self.points_ledger = FakeCollection(points_ledger)
         self.orgs = FakeCollection(orgs)
+        self.refresh_tokens = FakeCollection()
+        self.user_tokens = FakeCollection()
+        self.audit_logs = FakeCollection()
+        self.recognition_reactions = FakeCollection()
+        self.notification_outbox = FakeCollection()
+        self.app_metadata = FakeCollection()
+
+    def __getitem__(self, name: str) -> FakeCollection:
+        return getattr(self, name)
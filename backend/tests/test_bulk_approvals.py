@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.models.enums import RecognitionType
+
+
+def _pending(users, recognition_id: str, points: int, *, status: str = "pending", to=("employee",)) -> dict:
+    return {
+        "id": recognition_id,
+        "org_id": users["manager"].org_id,
+        "from_user_id": users["manager"].id,
+        "to_user_ids": [users[key].id for key in to],
+        "message": "Thanks!",
+        "points_awarded": points,
+        "recognition_type": RecognitionType.MANAGER_TO_EMPLOYEE,
+        "is_public": True,
+        "status": status,
+        "created_at": datetime(2024, 1, 1),
+    }
+
+
+def test_bulk_approve_reports_per_item_and_pays_out_in_batches(recognition_service_setup, monkeypatch) -> None:
+    service, db, users = recognition_service_setup
+    monkeypatch.setattr(settings, "BULK_APPROVAL_CHUNK_SIZE", 1)
+    records = [
+        _pending(users, "rec-1", 200, to=("employee", "peer")),
+        _pending(users, "rec-2", 200),
+        # Allowance is 500: the first two spend 400, so this one no longer fits
+        _pending(users, "rec-3", 200),
+        _pending(users, "rec-4", 50),
+        _pending(users, "rec-done", 10, status="approved"),
+    ]
+    asyncio.run(db.recognitions.insert_many(records))
+    bulk_writes = []
+    original_bulk_write = db.users.bulk_write
+
+    async def counting_bulk_write(requests, **kwargs):
+        bulk_writes.append(len(requests))
+        return await original_bulk_write(requests, **kwargs)
+
+    monkeypatch.setattr(db.users, "bulk_write", counting_bulk_write)
+
+    response = asyncio.run(service.bulk_approve_recognitions(
+        ["rec-1", "rec-2", "rec-3", "rec-4", "rec-done", "missing", "rec-1"], users["hr"]
+    ))
+
+    assert [(result.recognition_id, result.ok, result.status or result.detail) for result in response.results] == [
+        ("rec-1", True, "approved"),
+        ("rec-2", True, "approved"),
+        ("rec-3", False, "Monthly points allowance exceeded."),
+        ("rec-4", True, "approved"),
+        ("rec-done", False, "Recognition is not pending approval"),
+        ("missing", False, "Recognition not found"),
+    ]
+    assert (response.succeeded, response.failed) == (3, 3)
+    assert db.recognitions.get("rec-3")["status"] == "pending"
+    assert db.users.get(users["employee"].id)["points_balance"] == 450
+    assert db.users.get(users["peer"].id)["points_balance"] == 200
+    assert db.users.get(users["manager"].id)["monthly_points_spent"] == 450
+    assert len(db.points_ledger.values()) == 4
+    # One credit bulk_write per chunk, however many recipients it credits
+    # (allowance debits are separate conditional updates)
+    assert bulk_writes == [2, 1, 1]
+
+
+def test_bulk_reject_and_id_limit(recognition_service_setup, monkeypatch) -> None:
+    service, db, users = recognition_service_setup
+    asyncio.run(db.recognitions.insert_many([_pending(users, "rec-1", 20), _pending(users, "rec-2", 20)]))
+
+    response = asyncio.run(service.bulk_reject_recognitions(["rec-1", "rec-2"], users["hr"]))
+
+    assert [(result.ok, result.status) for result in response.results] == [(True, "rejected"), (True, "rejected")]
+    assert {record["status"] for record in db.recognitions.values()} == {"rejected"}
+    assert db.points_ledger.values() == []
+
+    monkeypatch.setattr(settings, "BULK_DECISION_MAX_IDS", 1)
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(service.bulk_reject_recognitions(["rec-1", "rec-2"], users["hr"]))
+    assert exc.value.status_code == 400
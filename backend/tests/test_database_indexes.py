@@ -1,33 +1,83 @@
 import asyncio
 
+import pytest
+
 from app.database.connection import ensure_indexes
 from .fakes import FakeDatabase
 
 
+def _unique_indexes(collection) -> list:
+    return [
+        keys
+        for keys, options in zip(collection.indexes, collection.index_options)
+        if options.get("unique")
+    ]
+
+
 def test_ensure_indexes_creates_expected_indexes() -> None:
     db = FakeDatabase()
 
     asyncio.run(ensure_indexes(db))
 
     assert db.rewards.indexes == [
-        "org_id",
-        "is_active",
-        "is_popular",
-        "rating",
-        "created_at",
-        "category",
-        "reward_type",
-        "prices.INR",
-        "prices.USD",
-        "prices.EUR",
+        [("org_id", 1), ("id", 1)],
+        [("org_id", 1), ("is_active", 1), ("category", 1), ("is_popular", -1), ("rating", -1), ("created_at", -1)],
+        [("org_id", 1), ("is_active", 1), ("is_popular", -1), ("rating", -1), ("created_at", -1)],
     ]
     assert db.recognitions.indexes == [
-        "org_id",
-        "created_at",
-        "is_public",
-        "from_user_id",
-        "to_user_ids",
+        [("org_id", 1), ("id", 1)],
+        [("org_id", 1), ("is_public", 1), ("created_at", -1), ("id", -1)],
+        [
+            ("org_id", 1), ("is_public", 1),
+            ("message", "text"), ("values_tags", "text"),
+            ("from_user_snapshot.first_name", "text"), ("from_user_snapshot.last_name", "text"),
+            ("to_user_snapshots.first_name", "text"), ("to_user_snapshots.last_name", "text"),
+        ],
+        [("org_id", 1), ("status", 1), ("created_at", -1), ("id", -1)],
+        [("org_id", 1), ("from_user_id", 1), ("created_at", -1), ("id", -1)],
+        [("org_id", 1), ("to_user_ids", 1), ("created_at", -1), ("id", -1)],
+    ]
+    assert db.redemptions.indexes == [
+        [("org_id", 1), ("id", 1)],
+        [("org_id", 1), ("user_id", 1), ("redeemed_at", -1)],
+        [("org_id", 1), ("status", 1), ("redeemed_at", 1)],
+        [("org_id", 1), ("redeemed_at", 1)],
     ]
-    assert db.redemptions.indexes == ["org_id", [("user_id", 1), ("redeemed_at", 1)]]
-    assert db.points_ledger.indexes == ["org_id", [("user_id", 1), ("created_at", -1)]]
-    assert db.orgs.indexes == ["domain"]
+    assert db.points_ledger.indexes == [[("org_id", 1), ("user_id", 1), ("created_at", -1), ("id", -1)]]
+    assert db.orgs.indexes == [[("id", 1)], [("domain", 1)]]
+    assert db.recognition_reactions.indexes == [
+        [("org_id", 1), ("user_id", 1), ("recognition_id", 1), ("emoji", 1)],
+    ]
+    assert db.notification_outbox.indexes == [
+        [("status", 1), ("available_at", 1)],
+        [("org_id", 1), ("kind", 1), ("status", 1)],
+        [("expires_at", 1)],
+    ]
+
+
+def test_tenant_lookups_are_unique_per_org() -> None:
+    db = FakeDatabase()
+
+    asyncio.run(ensure_indexes(db))
+
+    assert _unique_indexes(db.users) == [
+        [("org_id", 1), ("id", 1)],
+        [("org_id", 1), ("email", 1)],
+    ]
+    for collection in (db.rewards, db.recognitions, db.redemptions):
+        assert _unique_indexes(collection) == [[("org_id", 1), ("id", 1)]]
+    assert all(keys[0] == ("org_id", 1) for keys in db.audit_logs.indexes)
+
+
+def test_ensure_indexes_skips_unchanged_manifest(monkeypatch: pytest.MonkeyPatch) -> None:
+    db = FakeDatabase()
+
+    assert asyncio.run(ensure_indexes(db)) is True
+    built = len(db.users.indexes)
+    assert asyncio.run(ensure_indexes(db)) is False
+    assert len(db.users.indexes) == built
+
+    monkeypatch.setattr("app.database.connection.manifest_hash", lambda: "changed")
+    assert asyncio.run(ensure_indexes(db)) is True
+    assert len(db.users.indexes) == 2 * built
+    assert db.app_metadata.get("index_manifest")["hash"] == "changed"
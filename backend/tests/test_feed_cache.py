@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+from app.core.cache import TTLCache, feed_cache
+from app.models.enums import RecognitionType
+
+
+def _record(users, rec_id: str, minutes: int, *, status: str = "approved") -> dict:
+    sender, recipient = users["manager"], users["employee"]
+    return {
+        "id": rec_id,
+        "org_id": sender.org_id,
+        "from_user_id": sender.id,
+        "to_user_ids": [recipient.id],
+        "message": "Great work!",
+        "points_awarded": 10,
+        "recognition_type": RecognitionType.PEER_TO_PEER,
+        "created_at": datetime(2024, 1, 1, 12, 0, 0) + timedelta(minutes=minutes),
+        "is_public": True,
+        "status": status,
+    }
+
+
+def _count_finds(db, monkeypatch) -> list:
+    calls = []
+    original = db.recognitions.find
+
+    def counting_find(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(db.recognitions, "find", counting_find)
+    return calls
+
+
+def test_first_page_is_served_from_cache(recognition_service_setup, monkeypatch) -> None:
+    service, db, users = recognition_service_setup
+    for index in range(3):
+        asyncio.run(db.recognitions.insert_one(_record(users, f"rec-{index}", index)))
+    finds = _count_finds(db, monkeypatch)
+    feed_cache.reset_stats()
+
+    first = asyncio.run(service.get_public_feed(users["employee"], limit=10)).items
+    second = asyncio.run(service.get_public_feed(users["peer"], limit=2)).items
+
+    assert [entry.id for entry in first] == ["rec-2", "rec-1", "rec-0"]
+    assert [entry.id for entry in second] == ["rec-2", "rec-1"]
+    assert len(finds) == 1
+    assert feed_cache.stats()["hits"] == 1
+
+    asyncio.run(service.get_public_feed(users["employee"], limit=10, value_tag="teamwork")).items
+    assert len(finds) == 2
+
+
+def test_reject_invalidates_and_reactions_patch_in_place(recognition_service_setup, monkeypatch) -> None:
+    service, db, users = recognition_service_setup
+    asyncio.run(db.recognitions.insert_one(_record(users, "rec-pending", 0, status="pending")))
+    finds = _count_finds(db, monkeypatch)
+
+    feed = asyncio.run(service.get_public_feed(users["employee"])).items
+    assert feed[0].points_status == "pending"
+
+    asyncio.run(service.toggle_reaction("rec-pending", "🎉", users["peer"]))
+    feed = asyncio.run(service.get_public_feed(users["employee"])).items
+    assert [(reaction.emoji, reaction.count) for reaction in feed[0].reactions] == [("🎉", 1)]
+    assert len(finds) == 1
+
+    asyncio.run(service.reject_recognition("rec-pending", users["hr"]))
+    feed = asyncio.run(service.get_public_feed(users["employee"])).items
+    assert feed[0].points_status == "none"
+    assert len(finds) == 2
+
+
+def test_concurrent_misses_share_one_load() -> None:
+    cache: TTLCache[str] = TTLCache(max_entries=10, ttl_seconds=30)
+    loads = []
+
+    async def loader() -> str:
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return "page"
+
+    async def run() -> list:
+        return await asyncio.gather(*(cache.get_or_load("org-1", loader) for _ in range(5)))
+
+    assert asyncio.run(run()) == ["page"] * 5
+    assert len(loads) == 1
+    assert cache.stats()["coalesced"] == 4
+
+
+def test_load_racing_an_invalidation_is_not_stored() -> None:
+    cache: TTLCache[str] = TTLCache(max_entries=10, ttl_seconds=30)
+
+    async def loader() -> str:
+        await asyncio.sleep(0)
+        cache.invalidate("org-1")
+        return "stale"
+
+    assert asyncio.run(cache.get_or_load("org-1", loader)) == "stale"
+    assert cache.get("org-1") is None
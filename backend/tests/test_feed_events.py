@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.api.dependencies import get_current_claims, get_stream_claims
+from app.core.cache import token_version_cache
+from app.core.config import settings
+from app.core.events import RESYNC_EVENT, EventBroker, MongoBrokerBackend, format_sse
+from app.models.auth import TokenClaims
+from app.models.enums import RecognitionScope, RecognitionType, UserRole
+from app.models.recognition import RecognitionCreate
+from app.services.auth_service import AuthService
+
+from .conftest import _make_user
+from .fakes import FakeDatabase
+
+
+class _CappedCollection:
+    """Natural-order reads over a list; each tail ends at the current end."""
+
+    def __init__(self, documents):
+        self.documents = documents
+
+    def find(self, query, cursor_type=None, sort=None):
+        async def cursor():
+            for document in list(self.documents):
+                yield dict(document)
+
+        return cursor()
+
+    async def find_one(self, query, projection=None, sort=None):
+        if not query:
+            return dict(self.documents[-1]) if self.documents else None
+        return next((dict(d) for d in self.documents if d["_id"] == query["_id"]), None)
+
+
+def test_broker_fans_out_per_org_and_resyncs_slow_subscribers() -> None:
+    async def scenario():
+        broker = EventBroker(max_queued=2)
+        await broker.start()
+        org_one, org_two = broker.subscribe("org-1"), broker.subscribe("org-2")
+        for index in range(3):
+            await broker.publish("org-1", "reaction.updated", {"n": index})
+
+        one = [await org_one.get(timeout=0) for _ in range(2)]
+        two = await org_two.get(timeout=0)
+        org_one.close()
+        org_two.close()
+        return broker, one, two
+
+    broker, one, two = asyncio.run(scenario())
+
+    # The third event overflowed the queue: the backlog is dropped for a resync
+    assert one[0]["type"] == RESYNC_EVENT
+    assert one[1] is None
+    assert two is None
+    assert broker.stats()["subscribers"] == 0
+    assert (broker.stats()["delivered"], broker.stats()["dropped"]) == (2, 1)
+
+
+def test_format_sse() -> None:
+    message = {"org_id": "org-1", "type": "reaction.updated", "data": {"id": "rec-1", "count": 2}}
+
+    assert format_sse(message) == 'event: reaction.updated\ndata: {"id":"rec-1","count":2}\n\n'
+
+
+def test_service_publishes_feed_events(recognition_service_setup, monkeypatch) -> None:
+    service, _, users = recognition_service_setup
+    broker = EventBroker()
+    monkeypatch.setattr("app.services.recognition_service.event_broker", broker)
+
+    async def scenario():
+        await broker.start()
+        subscription = broker.subscribe(users["manager"].org_id)
+        payload = RecognitionCreate(
+            to_user_id=users["employee"].id,
+            message="Shipped it!",
+            recognition_type=RecognitionType.MANAGER_TO_EMPLOYEE,
+            scope=RecognitionScope.REPORT,
+        )
+        recognition = await service.create_recognition(users["manager"], payload)
+        await service.toggle_reaction(recognition.id, "🎉", users["peer"])
+        await service.toggle_reaction(recognition.id, "🎉", users["peer"])
+        messages = []
+        while (message := await subscription.get(timeout=0)) is not None:
+            messages.append(message)
+        return recognition, messages
+
+    recognition, messages = asyncio.run(scenario())
+
+    assert [message["type"] for message in messages] == ["recognition.created", "reaction.updated", "reaction.updated"]
+    created = messages[0]["data"]
+    assert created["id"] == recognition.id
+    assert created["from_user"]["id"] == users["manager"].id
+    json.dumps(created)
+    assert [(m["data"]["count"], m["data"]["delta"]) for m in messages[1:]] == [(1, 1), (0, -1)]
+
+
+def test_mongo_tail_resumes_by_natural_order_not_id() -> None:
+    async def scenario():
+        collection = _CappedCollection([{"_id": "m", "org_id": "org-1", "type": "old", "data": {}}])
+        backend = MongoBrokerBackend("feed_events", 1024)
+        backend._collection = collection
+        backend.retry_delay_seconds = 0
+        delivered = []
+        task = asyncio.create_task(backend._tail(lambda message: delivered.append(message["type"])))
+
+        async def spin():
+            for _ in range(20):
+                await asyncio.sleep(0)
+
+        await spin()
+        # Another worker's event sorts before the last one seen by _id
+        collection.documents.append({"_id": "a", "org_id": "org-1", "type": "new", "data": {}})
+        await spin()
+        after_insert = list(delivered)
+        # Both rolled out of the capped collection while the tail was away
+        collection.documents[:] = [{"_id": "b", "org_id": "org-1", "type": "missed", "data": {}}]
+        await spin()
+        task.cancel()
+        return after_insert, delivered
+
+    after_insert, delivered = asyncio.run(scenario())
+
+    assert after_insert == ["new"]
+    assert delivered == ["new", RESYNC_EVENT]
+
+
+def test_backend_resync_reaches_every_org() -> None:
+    broker = EventBroker()
+    org_one, org_two = broker.subscribe("org-1"), broker.subscribe("org-2")
+
+    broker._deliver({"org_id": None, "type": RESYNC_EVENT, "data": {}})
+
+    assert asyncio.run(org_one.get(timeout=0))["type"] == RESYNC_EVENT
+    assert asyncio.run(org_two.get(timeout=0))["type"] == RESYNC_EVENT
+
+
+def test_stream_token_opens_the_stream_only(monkeypatch) -> None:
+    employee = _make_user(user_id="employee-1", role=UserRole.EMPLOYEE)
+    employee.token_version = 2
+    db = FakeDatabase(users=[employee.dict()])
+
+    async def fake_get_database():
+        return db
+
+    monkeypatch.setattr("app.services.auth_service.get_database", fake_get_database)
+    monkeypatch.setattr("app.services.org_service.get_database", fake_get_database)
+    token_version_cache.clear()
+    claims = TokenClaims(id="employee-1", org_id="org-1", role=UserRole.EMPLOYEE, token_version=2)
+
+    stream_token = AuthService().issue_stream_token(claims)
+
+    assert stream_token.expires_in == settings.EVENT_STREAM_TOKEN_EXPIRE_SECONDS
+    assert asyncio.run(get_stream_claims(stream_token.token)) == claims
+    # Not usable as a bearer token for the rest of the API
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=stream_token.token)
+    with pytest.raises(HTTPException) as as_access_token:
+        asyncio.run(get_current_claims(credentials, org_id="org-1"))
+    assert as_access_token.value.status_code == status.HTTP_401_UNAUTHORIZED
+    # Nor is an access token accepted in the stream URL
+    access_token = AuthService().issue_access_token(employee).access_token
+    with pytest.raises(HTTPException):
+        asyncio.run(get_stream_claims(access_token))
+
+    # Revoked sessions cannot open new streams with an already issued token
+    asyncio.run(db.users.update_one({"id": "employee-1"}, {"$inc": {"token_version": 1}}))
+    token_version_cache.clear()
+    with pytest.raises(HTTPException) as revoked:
+        asyncio.run(get_stream_claims(stream_token.token))
+    assert revoked.value.status_code == status.HTTP_401_UNAUTHORIZED
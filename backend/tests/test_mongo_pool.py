@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.core.config import settings
+from app.database.connection import PoolMetricsListener, client_options, warm_up_pool
+
+
+def test_client_options_follow_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "MONGO_MAX_POOL_SIZE", 20)
+    monkeypatch.setattr(settings, "MONGO_MIN_POOL_SIZE", 4)
+    monkeypatch.setattr(settings, "MONGO_WAIT_QUEUE_TIMEOUT_MS", 1500)
+    monkeypatch.setattr(settings, "MONGO_COMPRESSORS", " zstd, snappy ,")
+
+    options = client_options()
+
+    assert options["maxPoolSize"] == 20
+    assert options["minPoolSize"] == 4
+    assert options["waitQueueTimeoutMS"] == 1500
+    assert options["compressors"] == "zstd,snappy"
+    assert "maxIdleTimeMS" not in options
+
+    client = AsyncIOMotorClient("mongodb://localhost:27017", connect=False, **options)
+    pool_options = client.delegate.options.pool_options
+    assert pool_options.max_pool_size == 20
+    assert pool_options.min_pool_size == 4
+    client.close()
+
+
+def test_pool_listener_tracks_checkouts_and_in_use() -> None:
+    listener = PoolMetricsListener()
+
+    for _ in range(2):
+        listener.connection_created(None)
+        listener.connection_check_out_started(None)
+        listener.connection_checked_out(None)
+    listener.connection_checked_in(None)
+    listener.connection_check_out_started(None)
+    listener.connection_check_out_failed(None)
+
+    stats = listener.stats()
+    assert stats["open_connections"] == 2
+    assert stats["checkouts"] == 2
+    assert stats["in_use"] == 1
+    assert stats["max_in_use"] == 2
+    assert stats["checkout_failures"] == 1
+    assert stats["checkout_wait_ms_max"] >= 0
+
+
+def test_warm_up_pool_pings_once_per_connection() -> None:
+    class PingDatabase:
+        def __init__(self) -> None:
+            self.commands: list[str] = []
+
+        async def command(self, name: str) -> dict:
+            self.commands.append(name)
+            return {"ok": 1}
+
+    database = PingDatabase()
+    asyncio.run(warm_up_pool(database, 3))
+    asyncio.run(warm_up_pool(database, 0))
+
+    assert database.commands == ["ping", "ping", "ping"]
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+import httpx
+
+from app.core.config import settings
+from app.models.enums import RecognitionScope, RecognitionType
+from app.models.org import Organization
+from app.models.recognition import RecognitionCreate
+from app.services.notification_outbox import (
+    EMAIL_SEND,
+    FAILED,
+    PUBLIC_RECOGNITION,
+    WEBHOOK_DIGEST,
+    WEBHOOK_POST,
+    NotificationOutbox,
+    outbox_message,
+)
+from app.services.webhook_service import WebhookRejected
+
+from .fakes import FakeDatabase
+
+
+def test_recognition_writes_notifications_to_the_outbox(recognition_service_setup, monkeypatch) -> None:
+    service, db, users = recognition_service_setup
+    monkeypatch.setattr("app.services.email_service.email_notification_service._enabled", True)
+    asyncio.run(db.orgs.insert_one({
+        "id": users["manager"].org_id,
+        "slack_webhook_url": "https://hooks.slack.test/abc",
+        "teams_webhook_url": "https://hooks.teams.test/xyz",
+    }))
+    payload = RecognitionCreate(
+        to_user_id=users["employee"].id,
+        message="Great demo!",
+        recognition_type=RecognitionType.MANAGER_TO_EMPLOYEE,
+        scope=RecognitionScope.REPORT,
+    )
+
+    asyncio.run(service.create_recognition(users["manager"], payload))
+
+    assert sorted(message["kind"] for message in db.notification_outbox.values()) == [EMAIL_SEND, "recognition.public"]
+
+    posted, sent = [], []
+
+    async def fake_post(url, body):
+        posted.append((url, body["text"]))
+
+    async def fake_send(payload):
+        sent.append(payload["to"])
+
+    monkeypatch.setattr("app.services.notification_outbox.webhook_notifier.post", fake_post)
+    monkeypatch.setattr("app.services.notification_outbox.email_notification_service.send", fake_send)
+    outbox = NotificationOutbox()
+    # First pass sends the email and fans the public post out per URL
+    assert asyncio.run(outbox.dispatch_once(db)) == 2
+    assert [message["kind"] for message in db.notification_outbox.values()] == [WEBHOOK_POST, WEBHOOK_POST]
+    assert asyncio.run(outbox.dispatch_once(db)) == 2
+
+    assert db.notification_outbox.values() == []
+    assert sent == [[users["employee"].email]]
+    assert sorted(url for url, _ in posted) == ["https://hooks.slack.test/abc", "https://hooks.teams.test/xyz"]
+    assert all("Great demo!" in text for _, text in posted)
+
+
+def test_failed_deliveries_back_off_then_give_up(monkeypatch) -> None:
+    db = FakeDatabase()
+    monkeypatch.setattr(settings, "OUTBOX_MAX_ATTEMPTS", 2)
+    asyncio.run(db.notification_outbox.insert_one(outbox_message(EMAIL_SEND, {"to": ["a@example.com"]}, org_id="org-1")))
+
+    async def failing_send(payload):
+        raise RuntimeError("smtp down")
+
+    monkeypatch.setattr("app.services.notification_outbox.email_notification_service.send", failing_send)
+    outbox = NotificationOutbox()
+
+    assert asyncio.run(outbox.dispatch_once(db)) == 1
+    (message,) = db.notification_outbox.values()
+    assert (message["status"], message["attempts"]) == ("pending", 1)
+    assert message["available_at"] > datetime.utcnow()
+    # Not due yet
+    assert asyncio.run(outbox.dispatch_once(db)) == 0
+
+    asyncio.run(db.notification_outbox.update_one({"id": message["id"]}, {"$set": {"available_at": datetime.utcnow()}}))
+    assert asyncio.run(outbox.dispatch_once(db)) == 1
+    (message,) = db.notification_outbox.values()
+    assert (message["status"], message["attempts"]) == (FAILED, 2)
+    assert "smtp down" in message["last_error"]
+    assert outbox.stats()["retried"] == 1 and outbox.stats()["failed"] == 1
+
+
+def test_rejected_webhooks_fail_without_retrying(monkeypatch) -> None:
+    db = FakeDatabase()
+    url = "https://hooks.slack.test/deleted"
+    asyncio.run(db.notification_outbox.insert_one(
+        outbox_message(WEBHOOK_POST, {"url": url, "body": {"text": "hi"}}, org_id="org-1")
+    ))
+
+    async def gone(url, payload):
+        request = httpx.Request("POST", url)
+        raise WebhookRejected("gone", request=request, response=httpx.Response(410, request=request))
+
+    monkeypatch.setattr("app.services.notification_outbox.webhook_notifier.post", gone)
+
+    assert asyncio.run(NotificationOutbox().dispatch_once(db)) == 1
+    (message,) = db.notification_outbox.values()
+    assert (message["status"], message["attempts"]) == (FAILED, 1)
+
+
+def test_messages_reclaimed_while_waiting_are_not_sent_twice(monkeypatch) -> None:
+    db = FakeDatabase()
+    monkeypatch.setattr(settings, "OUTBOX_CONCURRENCY", 1)
+    messages = {
+        address: outbox_message(EMAIL_SEND, {"to": [address]}, org_id="org-1")
+        for address in ("a@example.com", "b@example.com")
+    }
+    asyncio.run(db.notification_outbox.insert_many(list(messages.values())))
+    sent = []
+
+    async def slow_send(payload):
+        sent.append(payload["to"][0])
+        # The batch lock ran out meanwhile and another worker took the rest
+        for address, message in messages.items():
+            if address not in sent:
+                await db.notification_outbox.update_one({"id": message["id"]}, {"$set": {"claim": "other-worker"}})
+
+    monkeypatch.setattr("app.services.notification_outbox.email_notification_service.send", slow_send)
+
+    assert asyncio.run(NotificationOutbox().dispatch_once(db)) == 2
+    assert len(sent) == 1
+    (left,) = db.notification_outbox.values()
+    assert left["claim"] == "other-worker"
+
+
+def test_dispatcher_runs_in_background_and_drains(monkeypatch) -> None:
+    db = FakeDatabase()
+    sent = []
+
+    async def fake_send(payload):
+        sent.append(payload["to"])
+
+    monkeypatch.setattr("app.services.notification_outbox.email_notification_service.send", fake_send)
+
+    async def scenario():
+        outbox = NotificationOutbox()
+        outbox.start(db)
+        await outbox.enqueue(db, [outbox_message(EMAIL_SEND, {"to": ["a@example.com"]}, org_id="org-1")])
+        outbox.wake()
+        for _ in range(50):
+            if sent:
+                break
+            await asyncio.sleep(0)
+        await outbox.drain()
+        return outbox
+
+    outbox = asyncio.run(scenario())
+
+    assert sent == [["a@example.com"]]
+    assert outbox.stats()["running"] is False
+
+
+def test_digest_orgs_coalesce_public_recognitions(monkeypatch) -> None:
+    org = Organization(
+        id="org-1", name="Acme", domain="acme.test",
+        slack_webhook_url="https://hooks.slack.test/abc", webhook_digest_enabled=True,
+    )
+    db = FakeDatabase(orgs=[org.dict()])
+    monkeypatch.setattr(settings, "WEBHOOK_DIGEST_MAX_ITEMS", 3)
+    posted = []
+
+    async def fake_post(url, body):
+        posted.append((url, body["text"]))
+
+    monkeypatch.setattr("app.services.notification_outbox.webhook_notifier.post", fake_post)
+    outbox = NotificationOutbox()
+
+    def recognize(*texts):
+        messages = [outbox_message(PUBLIC_RECOGNITION, {"text": f"🎉 {text}"}, org_id=org.id) for text in texts]
+        asyncio.run(outbox.enqueue(db, messages))
+        asyncio.run(outbox.dispatch_once(db))
+
+    def digests():
+        return sorted(
+            (message for message in db.notification_outbox.values() if message["kind"] == WEBHOOK_DIGEST),
+            key=lambda message: message["item_count"],
+        )
+
+    recognize("A thanked B", "C thanked D")
+    (digest,) = digests()
+    assert digest["payload"]["lines"] == ["🎉 A thanked B", "🎉 C thanked D"]
+    assert digest["available_at"] > datetime.utcnow()
+    assert asyncio.run(outbox.dispatch_once(db)) == 0
+
+    # Reaching WEBHOOK_DIGEST_MAX_ITEMS flushes without waiting for the window
+    recognize("E thanked F", "G thanked H")
+    open_digest, full_digest = digests()
+    assert open_digest["payload"]["lines"] == ["🎉 G thanked H"]
+    assert full_digest["available_at"] <= datetime.utcnow()
+
+    assert asyncio.run(outbox.dispatch_once(db)) == 1
+    assert asyncio.run(outbox.dispatch_once(db)) == 1
+    assert posted == [(
+        "https://hooks.slack.test/abc",
+        "🎉 3 new recognitions:\n• A thanked B\n• C thanked D\n• E thanked F",
+    )]
+    assert [message["id"] for message in db.notification_outbox.values()] == [open_digest["id"]]
@@ -37,6 +37,7 @@ def test_org_bootstrap_creates_org_and_admin_user(
         return db
 
     monkeypatch.setattr("app.services.org_service.get_database", fake_get_database)
+    monkeypatch.setattr("app.services.auth_service.get_database", fake_get_database)
 
     payload = {
         "org_name": "Acme Inc",
@@ -53,6 +54,7 @@ def test_org_bootstrap_creates_org_and_admin_user(
     assert body["domain"] == "acme.com"
     assert body["token"]["access_token"]
     assert body["token"]["token_type"] == "bearer"
+    assert body["token"]["refresh_token"]
 
     orgs = db.orgs.values()
     assert len(orgs) == 1
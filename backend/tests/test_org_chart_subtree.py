@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.cache import org_chart_cache
+from app.models.enums import UserRole
+from app.models.user import UserReportingUpdate
+from app.services import user_service as user_service_module
+from app.services.user_service import UserService
+
+from .conftest import _make_user
+from .fakes import FakeDatabase
+
+
+def _setup(monkeypatch, users):
+    db = FakeDatabase(users=[user.dict() for user in users])
+
+    async def fake_get_database():
+        return db
+
+    monkeypatch.setattr("app.services.user_service.get_database", fake_get_database)
+    return UserService(), db
+
+
+def _org(report_count=3):
+    ceo = _make_user(user_id="ceo", role=UserRole.EXECUTIVE)
+    reports = [
+        _make_user(user_id=f"report-{i}", role=UserRole.MANAGER, manager_id=ceo.id)
+        for i in range(report_count)
+    ]
+    grandchildren = [
+        _make_user(user_id=f"ic-{i}", role=UserRole.EMPLOYEE, manager_id=reports[0].id)
+        for i in range(2)
+    ]
+    return [ceo, *reports, *grandchildren]
+
+
+def test_subtree_pages_children_with_counts(monkeypatch):
+    service, _ = _setup(monkeypatch, _org(report_count=3))
+
+    page = asyncio.run(service.get_org_chart_subtree("org-1", root_id="ceo", depth=2, limit=2))
+
+    assert page.root.id == "ceo"
+    assert page.root.child_count == 3
+    assert page.total == 3
+    assert [node.id for node in page.items] == ["report-0", "report-1"]
+    assert page.items[0].child_count == 2
+    assert [child.id for child in page.items[0].children] == ["ic-0", "ic-1"]
+
+    next_page = asyncio.run(service.get_org_chart_subtree("org-1", root_id="ceo", limit=2, offset=2))
+    assert [node.id for node in next_page.items] == ["report-2"]
+
+
+def test_subtree_depth_limits_expansion(monkeypatch):
+    service, _ = _setup(monkeypatch, _org())
+
+    page = asyncio.run(service.get_org_chart_subtree("org-1", depth=1))
+
+    assert page.root is None
+    assert [node.id for node in page.items] == ["ceo"]
+    assert page.items[0].child_count == 3
+    assert page.items[0].children == []
+
+
+def test_subtree_stops_at_node_budget(monkeypatch):
+    monkeypatch.setattr(user_service_module, "MAX_SUBTREE_NODES", 4)
+    service, _ = _setup(monkeypatch, _org())
+
+    page = asyncio.run(service.get_org_chart_subtree("org-1", depth=3))
+
+    assert page.truncated is True
+    assert [child.id for child in page.items[0].children] == ["report-0", "report-1", "report-2"]
+    assert page.items[0].children[0].children == []
+
+
+def test_subtree_unknown_root_is_404(monkeypatch):
+    service, _ = _setup(monkeypatch, _org())
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(service.get_org_chart_subtree("org-1", root_id="missing"))
+
+    assert exc.value.status_code == 404
+
+
+def test_deep_hierarchy_does_not_recurse(monkeypatch):
+    depth = 3000
+    users = [_make_user(user_id="u-0", role=UserRole.EXECUTIVE)]
+    users += [
+        _make_user(user_id=f"u-{i}", role=UserRole.EMPLOYEE, manager_id=f"u-{i - 1}")
+        for i in range(1, depth)
+    ]
+    service, _ = _setup(monkeypatch, users)
+
+    chart = asyncio.run(service.get_org_chart("org-1"))
+
+    node, levels = chart[0], 1
+    while node.children:
+        node, levels = node.children[0], levels + 1
+    assert levels == depth
+
+
+def test_snapshot_is_cached_and_invalidated_on_reporting_change(monkeypatch):
+    service, db = _setup(monkeypatch, _org())
+    org_chart_cache.reset_stats()
+
+    asyncio.run(service.get_org_chart_subtree("org-1", root_id="ceo"))
+    asyncio.run(service.get_org_chart_subtree("org-1", root_id="ceo"))
+    assert org_chart_cache.stats()["hits"] == 1
+
+    asyncio.run(service.update_reporting("report-2", "org-1", UserReportingUpdate(manager_id="report-0")))
+
+    page = asyncio.run(service.get_org_chart_subtree("org-1", root_id="report-0"))
+    assert [node.id for node in page.items] == ["ic-0", "ic-1", "report-2"]
+
+
+def test_concurrent_cold_reads_build_one_snapshot(monkeypatch):
+    service, db = _setup(monkeypatch, _org())
+    original_find = db.users.find
+    scans = []
+
+    def counting_find(query=None, projection=None):
+        scans.append(query)
+        cursor = original_find(query, projection)
+        original_to_list = cursor.to_list
+
+        async def slow_to_list(length=None):
+            await asyncio.sleep(0)
+            return await original_to_list(length=length)
+
+        cursor.to_list = slow_to_list
+        return cursor
+
+    monkeypatch.setattr(db.users, "find", counting_find)
+
+    async def read_concurrently():
+        return await asyncio.gather(*(service.get_org_hierarchy("org-1") for _ in range(5)))
+
+    snapshots = asyncio.run(read_concurrently())
+
+    assert len(scans) == 1
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Dict
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.dependencies import get_org_id
+from app.core.cache import invalidate_org, org_cache, unknown_org_cache
+from app.core.config import settings
+from app.models.enums import RecognitionScope, RecognitionType
+from app.models.org import Organization, OrgSettingsUpdate
+from app.models.recognition import RecognitionCreate
+from app.models.user import User
+from app.services.org_service import org_service
+from app.services.recognition_service import RecognitionService
+
+from .fakes import FakeDatabase
+
+
+def _count_org_lookups(db: FakeDatabase) -> list:
+    lookups: list = []
+    original_find_one = db.orgs.find_one
+
+    async def counting_find_one(query=None, projection=None, **kwargs):
+        lookups.append(query.get("id"))
+        return await original_find_one(query, projection, **kwargs)
+
+    db.orgs.find_one = counting_find_one
+    return lookups
+
+
+def _use_database(monkeypatch: pytest.MonkeyPatch, db: FakeDatabase) -> None:
+    async def fake_get_database() -> FakeDatabase:
+        return db
+
+    monkeypatch.setattr("app.services.org_service.get_database", fake_get_database)
+
+
+def test_recognitions_use_cached_org_knobs_until_settings_change(
+    recognition_service_setup: tuple[RecognitionService, FakeDatabase, Dict[str, User]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service, db, users = recognition_service_setup
+    _use_database(monkeypatch, db)
+    hr = users["hr"]
+    asyncio.run(db.orgs.insert_one(
+        Organization(id=hr.org_id, name="Acme", domain="acme.test", default_points=25, approval_threshold=30).dict()
+    ))
+    lookups = _count_org_lookups(db)
+
+    def recognize(recipient: User):
+        payload = RecognitionCreate(
+            to_user_id=recipient.id,
+            message="Thanks for the help",
+            recognition_type=RecognitionType.PEER_TO_PEER,
+            scope=RecognitionScope.GLOBAL,
+        )
+        return asyncio.run(service.create_recognition(hr, payload))
+
+    first = recognize(users["employee"])
+    second = recognize(users["peer"])
+
+    assert (first.points_awarded, first.status) == (25, "approved")
+    assert (second.points_awarded, second.status) == (25, "approved")
+    assert lookups == [hr.org_id]
+
+    asyncio.run(org_service.update_org_settings(hr.org_id, OrgSettingsUpdate(default_points=40)))
+    third = recognize(users["employee"])
+
+    assert (third.points_awarded, third.status) == (40, "pending")
+    assert lookups == [hr.org_id, hr.org_id]
+
+
+def test_update_org_settings_normalizes_webhooks_and_rejects_unknown_orgs(monkeypatch: pytest.MonkeyPatch) -> None:
+    org = Organization(id="org-1", name="Acme", domain="acme.test", slack_webhook_url="https://hooks.slack.test/a")
+    db = FakeDatabase(orgs=[org.dict()])
+    _use_database(monkeypatch, db)
+
+    updated = asyncio.run(org_service.update_org_settings(
+        "org-1", OrgSettingsUpdate(slack_webhook_url="  ", teams_webhook_url=" https://hooks.teams.test/b ")
+    ))
+
+    assert updated.slack_webhook_url is None
+    assert updated.teams_webhook_url == "https://hooks.teams.test/b"
+    assert db.orgs.get(org.id)["teams_webhook_url"] == "https://hooks.teams.test/b"
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(org_service.update_org_settings("org-missing", OrgSettingsUpdate(default_points=5)))
+    assert exc.value.status_code == 404
+
+
+def test_get_org_id_rejects_inactive_orgs_from_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    inactive = Organization(id="org-off", name="Gone", domain="gone.test", is_active=False)
+    db = FakeDatabase(orgs=[inactive.dict()])
+    _use_database(monkeypatch, db)
+    lookups = _count_org_lookups(db)
+
+    assert asyncio.run(get_org_id(" org-unknown ")) == "org-unknown"
+    assert asyncio.run(get_org_id("org-unknown")) == "org-unknown"
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(get_org_id("org-off"))
+        assert exc.value.status_code == 403
+
+    assert lookups == ["org-unknown", "org-off"]
+
+
+def test_unknown_org_ids_do_not_evict_real_orgs(monkeypatch: pytest.MonkeyPatch) -> None:
+    org = Organization(id="org-1", name="Acme", domain="acme.test")
+    db = FakeDatabase(orgs=[org.dict()])
+    _use_database(monkeypatch, db)
+
+    async def resolve_many() -> None:
+        await get_org_id("org-1")
+        for index in range(settings.ORG_CACHE_MAX_ORGS + 1):
+            await get_org_id(f"made-up-{index}")
+
+    asyncio.run(resolve_many())
+
+    assert org_cache.peek("org-1") is not None
+    assert org_cache.peek("made-up-0") is None
+    latest = f"made-up-{settings.ORG_CACHE_MAX_ORGS}"
+    assert unknown_org_cache.peek(latest).exists is False
+
+    # Creating the org clears the negative entry
+    asyncio.run(db.orgs.insert_one(Organization(id=latest, name="Late", domain="late.test").dict()))
+    invalidate_org(latest)
+    assert asyncio.run(org_service.get_org_settings(latest)).exists is True
+    assert org_cache.peek(latest) is not None
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.points import get_my_points_ledger
+from app.core.config import settings
+from app.core.pagination import NEWEST_FIRST, apply_keyset, decode_cursor, encode_cursor
+from app.models.enums import RecognitionType
+
+
+def test_cursor_round_trips_and_is_bound_to_its_listing() -> None:
+    created_at = datetime(2024, 1, 1, 12, 30, 15, 123456)
+    cursor = encode_cursor("history", [created_at, "rec-1"])
+
+    assert "|" not in cursor
+    assert decode_cursor(cursor, "history", 2) == [created_at, "rec-1"]
+    for kind, size in (("feed", 2), ("history", 3)):
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor(cursor, kind, size)
+        assert exc.value.status_code == 400
+    with pytest.raises(HTTPException):
+        decode_cursor("not a cursor!", "history", 2)
+
+
+def test_apply_keyset_bounds_the_leading_field_and_breaks_ties() -> None:
+    created_at = datetime(2024, 1, 1)
+    query = {"org_id": "org-1", "$and": [{"status": "pending"}]}
+
+    apply_keyset(query, NEWEST_FIRST, [created_at, "rec-5"])
+
+    assert query["created_at"] == {"$lte": created_at}
+    assert query["$and"][1] == {
+        "$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "id": {"$lt": "rec-5"}},
+        ]
+    }
+
+
+def test_history_pages_with_server_cursor(recognition_service_setup) -> None:
+    service, db, users = recognition_service_setup
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    for index in range(5):
+        asyncio.run(db.recognitions.insert_one({
+            "id": f"rec-{index}",
+            "org_id": users["manager"].org_id,
+            "from_user_id": users["manager"].id,
+            "to_user_ids": [users["employee"].id],
+            "message": "Thanks!",
+            "points_awarded": 0,
+            "recognition_type": RecognitionType.PEER_TO_PEER,
+            # rec-1 and rec-2 share a timestamp, so the id breaks the tie
+            "created_at": now + timedelta(minutes=min(index, 4 - index if index > 2 else index)),
+        }))
+
+    seen = []
+    cursor = None
+    while True:
+        page = asyncio.run(service.get_history(users["employee"], direction="received", limit=2, cursor=cursor))
+        seen.extend(entry.id for entry in page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert sorted(seen) == [f"rec-{index}" for index in range(5)]
+    assert len(seen) == len(set(seen))
+
+
+def test_dropped_rows_do_not_end_paging_early(recognition_service_setup, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "FEED_CACHE_PAGE_SIZE", 3)
+    service, db, users = recognition_service_setup
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    for index in range(6):
+        asyncio.run(db.recognitions.insert_one({
+            "id": f"rec-{index}",
+            "org_id": users["manager"].org_id,
+            # The sender of the two newest rows no longer resolves, so they are skipped
+            "from_user_id": "ghost" if index >= 4 else users["manager"].id,
+            "to_user_ids": [users["employee"].id],
+            "message": "Thanks!",
+            "points_awarded": 0,
+            "recognition_type": RecognitionType.PEER_TO_PEER,
+            "is_public": True,
+            "created_at": now + timedelta(minutes=index),
+        }))
+
+    def collect(fetch):
+        pages, cursor = [], None
+        while True:
+            page = asyncio.run(fetch(cursor))
+            pages.append([entry.id for entry in page.items])
+            if page.next_cursor is None:
+                return pages
+            cursor = page.next_cursor
+
+    history = collect(lambda cursor: service.get_history(users["employee"], direction="received", limit=2, cursor=cursor))
+    feed = collect(lambda cursor: service.get_public_feed(users["employee"], limit=2, cursor=cursor))
+
+    assert history == [[], ["rec-3", "rec-2"], ["rec-1", "rec-0"]]
+    # The first feed page comes from the cached page of 3 raw rows
+    assert feed == [["rec-3"], ["rec-2", "rec-1"], ["rec-0"]]
+
+
+def test_ledger_returns_envelope_with_next_cursor(recognition_service_setup, monkeypatch) -> None:
+    _, db, users = recognition_service_setup
+    employee = users["employee"]
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    for index in range(3):
+        asyncio.run(db.points_ledger.insert_one({
+            "id": f"ledger-{index}",
+            "org_id": employee.org_id,
+            "user_id": employee.id,
+            "delta": 10,
+            "reason": "recognition_received",
+            "ref_type": "recognition",
+            "ref_id": f"rec-{index}",
+            "created_at": now + timedelta(minutes=index),
+        }))
+
+    async def fake_get_database():
+        return db
+
+    monkeypatch.setattr("app.api.v1.points.get_database", fake_get_database)
+
+    first = asyncio.run(get_my_points_ledger(limit=2, cursor=None, current_user=employee))
+    assert [entry.id for entry in first.items] == ["ledger-2", "ledger-1"]
+    assert first.next_cursor
+
+    second = asyncio.run(get_my_points_ledger(limit=2, cursor=first.next_cursor, current_user=employee))
+    assert [entry.id for entry in second.items] == ["ledger-0"]
+    assert second.next_cursor is None
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.security import (
+    PasswordHashPool,
+    get_hash_rounds,
+    hash_password,
+    hash_password_async,
+    password_needs_rehash,
+    verify_password,
+    verify_password_async,
+)
+from app.models.enums import UserRole
+from app.models.user import UserLogin
+from app.services.auth_service import AuthService
+
+from .conftest import _make_user
+from .fakes import FakeDatabase
+
+
+def test_async_hash_round_trip_runs_off_the_event_loop() -> None:
+    async def scenario() -> tuple[bool, bool]:
+        hashed = await hash_password_async("CorrectHorse1")
+        return (
+            await verify_password_async("CorrectHorse1", hashed),
+            await verify_password_async("wrong-password", hashed),
+        )
+
+    assert asyncio.run(scenario()) == (True, False)
+
+
+def test_pool_rejects_work_beyond_queue_depth() -> None:
+    pool = PasswordHashPool(max_workers=1, max_pending=1)
+    release = threading.Event()
+
+    async def scenario() -> None:
+        blocked = asyncio.ensure_future(pool.run(release.wait, 5))
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as exc:
+            await pool.run(lambda: True)
+        assert exc.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        release.set()
+        assert await blocked is True
+
+    asyncio.run(scenario())
+    pool.shutdown()
+
+    stats = pool.stats()
+    assert stats["completed"] == 1
+    assert stats["rejected"] == 1
+    assert stats["pending"] == 0
+
+
+def test_login_rehashes_when_configured_cost_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    user = _make_user(user_id="employee-1", role=UserRole.EMPLOYEE)
+    user.password_hash = hash_password("CorrectHorse1", rounds=4)
+    db = FakeDatabase(users=[user.dict()])
+
+    async def fake_get_database() -> FakeDatabase:
+        return db
+
+    monkeypatch.setattr("app.services.auth_service.get_database", fake_get_database)
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+    login = UserLogin(email=user.email, password="CorrectHorse1")
+
+    asyncio.run(AuthService().authenticate_user(login, org_id=user.org_id))
+
+    stored_hash = db.users.get(user.id)["password_hash"]
+    assert get_hash_rounds(stored_hash) == 5
+    assert not password_needs_rehash(stored_hash)
+    assert verify_password("CorrectHorse1", stored_hash)
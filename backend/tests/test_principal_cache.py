@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.api.dependencies import get_current_user
+from app.core.cache import TTLCache, principal_cache
+from app.core.security import create_access_token
+from app.models.enums import UserRole
+from app.models.user import UserUpdate
+from app.services.user_service import UserService
+
+from .conftest import _make_user
+from .fakes import FakeDatabase
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_and_evicts_least_recently_used() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str] = TTLCache(max_entries=2, ttl_seconds=10, clock=clock)
+
+    cache.set("a", "alpha")
+    cache.set("b", "beta")
+    assert cache.get("a") == "alpha"
+
+    cache.set("c", "gamma")
+    assert cache.get("b") is None
+    assert cache.get("a") == "alpha"
+
+    clock.now = 11
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+    assert stats["evictions"] == 1
+
+
+def test_get_current_user_uses_cache_until_invalidated(monkeypatch: pytest.MonkeyPatch) -> None:
+    user = _make_user(user_id="employee-1", role=UserRole.EMPLOYEE)
+    db = FakeDatabase(users=[user.dict()])
+    lookups: list[str] = []
+
+    async def fake_get_database() -> FakeDatabase:
+        return db
+
+    original_find_one = db.users.find_one
+
+    async def counting_find_one(query=None, projection=None):
+        lookups.append(query.get("id"))
+        return await original_find_one(query, projection)
+
+    monkeypatch.setattr(db.users, "find_one", counting_find_one)
+    monkeypatch.setattr("app.services.auth_service.get_database", fake_get_database)
+    monkeypatch.setattr("app.services.user_service.get_database", fake_get_database)
+    principal_cache.clear()
+    principal_cache.reset_stats()
+
+    token = create_access_token({"sub": user.id})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    first = asyncio.run(get_current_user(credentials, org_id=user.org_id))
+    first.first_name = "Mutated"
+    second = asyncio.run(get_current_user(credentials, org_id=user.org_id))
+
+    assert lookups == [user.id]
+    assert second.first_name == user.first_name
+    assert principal_cache.stats()["hits"] == 1
+
+    asyncio.run(UserService().update_user(user.id, user.org_id, UserUpdate(first_name="Renamed")))
+    lookups.clear()
+    refreshed = asyncio.run(get_current_user(credentials, org_id=user.org_id))
+
+    assert refreshed.first_name == "Renamed"
+    assert lookups == [user.id]
+    principal_cache.clear()
+
+
+def test_principal_loaded_across_an_invalidation_is_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    user = _make_user(user_id="employee-1", role=UserRole.EMPLOYEE)
+    db = FakeDatabase(users=[user.dict()])
+
+    async def fake_get_database() -> FakeDatabase:
+        return db
+
+    original_find_one = db.users.find_one
+    raced: list[bool] = []
+
+    async def find_one_racing_a_write(query=None, projection=None):
+        document = await original_find_one(query, projection)
+        if not raced:
+            raced.append(True)
+            # Another request updates the user while this load is in flight
+            await UserService().update_user(user.id, user.org_id, UserUpdate(first_name="Renamed"))
+        return document
+
+    monkeypatch.setattr(db.users, "find_one", find_one_racing_a_write)
+    monkeypatch.setattr("app.services.auth_service.get_database", fake_get_database)
+    monkeypatch.setattr("app.services.user_service.get_database", fake_get_database)
+    principal_cache.clear()
+
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token({"sub": user.id}))
+    loaded = asyncio.run(get_current_user(credentials, org_id=user.org_id))
+
+    assert loaded.first_name == user.first_name
+    assert principal_cache.peek((user.org_id, user.id)) is None
+    principal_cache.clear()
@@ -0,0 +1,397 @@
+"""Explain-plan regression suite.
+
+Each service query (`find`, `find_one` and `aggregate`) is captured by running
+the real service code against a recording fake, then replayed with `explain`
+against a seeded MongoDB. A winning plan with a COLLSCAN or a blocking
+in-memory SORT, or one that examines far more documents than it returns, fails
+the test.
+
+Needs a reachable server (e.g. `docker compose up mongo`); set
+QUERY_PLAN_MONGO_URL to point elsewhere. Skipped when none is available.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import random
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pytest
+from fastapi import HTTPException
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+from app.api.v1.admin_audit_logs import list_audit_logs
+from app.api.v1.admin_redemptions import get_redemptions
+from app.api.v1.points import get_my_points_ledger
+from app.core.pagination import encode_cursor
+from app.core.search import user_search_fields
+from app.database import connection
+from app.database.connection import ensure_indexes
+from app.models.auth import TokenClaims
+from app.models.enums import RedemptionStatus, UserRole
+from app.services.auth_service import AuthService
+from app.services.notification_outbox import NotificationOutbox
+from app.services.recognition_service import RecognitionService
+from app.services.recommendation_service import RecommendationService
+from app.services.redemption_service import RedemptionService
+from app.services.reward_service import RewardService
+
+from .conftest import _make_user
+from .fakes import FakeDatabase
+
+MONGO_URL = os.getenv("QUERY_PLAN_MONGO_URL", "mongodb://localhost:27017")
+DB_NAME = f"rewards_query_plans_{uuid.uuid4().hex[:8]}"
+ORG_IDS = ["org-1", "org-2", "org-3"]
+TARGET_ORG = "org-1"
+TARGET_USER = "user-1"
+REFRESH_TOKEN = f"{TARGET_ORG}-refresh-7"
+# A plan may examine up to this many documents per document returned
+MAX_EXAMINED_PER_RETURNED = 5
+BLOCKING_STAGES = {"COLLSCAN", "SORT"}
+# Ranking by text score can only sort the matches in memory; the text index
+# still bounds them to one org's public posts
+ALLOWED_STAGES = {"feed_search": {"SORT"}}
+
+SERVICE_MODULES = [
+    "app.database.connection",
+    "app.services.auth_service",
+    "app.services.recognition_service",
+    "app.services.reward_service",
+    "app.services.redemption_service",
+    "app.services.recommendation_service",
+    "app.api.v1.points",
+    "app.api.v1.admin_audit_logs",
+    "app.api.v1.admin_redemptions",
+]
+
+
+class RecordingCursor:
+    def __init__(self, cursor: Any, spec: Dict[str, Any]) -> None:
+        self._cursor = cursor
+        self._spec = spec
+
+    def sort(self, key: Any, direction: Optional[int] = None) -> "RecordingCursor":
+        self._spec["sort"] = list(key) if isinstance(key, (list, tuple)) else [(key, direction or 1)]
+        self._cursor.sort(key, direction)
+        return self
+
+    def skip(self, count: int) -> "RecordingCursor":
+        self._spec["skip"] = count
+        self._cursor.skip(count)
+        return self
+
+    def limit(self, limit: int) -> "RecordingCursor":
+        self._spec["limit"] = limit
+        self._cursor.limit(limit)
+        return self
+
+    async def to_list(self, length: Optional[int]) -> List[Dict[str, Any]]:
+        return await self._cursor.to_list(length)
+
+
+class RecordingCollection:
+    def __init__(self, name: str, collection: Any, queries: List[Dict[str, Any]]) -> None:
+        self._name = name
+        self._collection = collection
+        self._queries = queries
+
+    def find(self, query: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, int]] = None) -> RecordingCursor:
+        spec: Dict[str, Any] = {"collection": self._name, "filter": query or {}, "projection": projection}
+        self._queries.append(spec)
+        return RecordingCursor(self._collection.find(query, projection), spec)
+
+    async def find_one(
+        self, query: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, int]] = None
+    ) -> Optional[Dict[str, Any]]:
+        self._queries.append({"collection": self._name, "filter": query or {}, "projection": projection, "limit": 1})
+        return await self._collection.find_one(query, projection)
+
+    def aggregate(self, pipeline: List[Dict[str, Any]], **kwargs: Any) -> Any:
+        self._queries.append({"collection": self._name, "pipeline": list(pipeline)})
+        return self._collection.aggregate(pipeline, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._collection, name)
+
+
+class RecordingDatabase:
+    def __init__(self, users: List[Dict[str, Any]]) -> None:
+        self.queries: List[Dict[str, Any]] = []
+        self._fake = FakeDatabase(users=users)
+
+    def __getattr__(self, name: str) -> RecordingCollection:
+        return RecordingCollection(name, getattr(self._fake, name), self.queries)
+
+
+def _seed(database: Any) -> None:
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    categories = ["experiences", "gift_cards", "merchandise", "wellness", "learning"]
+    actions = ["user.update", "reward.update", "redemption.update", "recognition.approve"]
+    statuses = [status.value for status in RedemptionStatus]
+
+    users, rewards, recognitions, redemptions, ledger, audit_logs = [], [], [], [], [], []
+    refresh_tokens, user_tokens, outbox = [], [], []
+    for org_id in ORG_IDS:
+        names: Dict[str, Dict[str, str]] = {}
+        user_ids = [TARGET_USER if org_id == TARGET_ORG and i == 1 else f"{org_id}-user-{i}" for i in range(1, 301)]
+        for index, user_id in enumerate(user_ids):
+            email = f"{user_id}@{org_id}.example.com"
+            first_name, last_name = f"Name{index}", rng.choice(["Rao", "Smith", "Garcia", "Chen"])
+            names[user_id] = {"id": user_id, "first_name": first_name, "last_name": last_name}
+            users.append({
+                "id": user_id,
+                "org_id": org_id,
+                "email": email,
+                "first_name": first_name,
+                "last_name": last_name,
+                "manager_id": user_ids[index // 10] if index else None,
+                "is_active": True,
+                **user_search_fields(first_name, last_name, email),
+            })
+            refresh_tokens.append({
+                "id": f"{user_id}-refresh",
+                "org_id": org_id,
+                "user_id": user_id,
+                "family_id": f"{user_id}-family",
+                "token_hash": hashlib.sha256(f"{org_id}-refresh-{index}".encode()).hexdigest(),
+                "expires_at": now + timedelta(days=7),
+                "revoked_at": None,
+            })
+            user_tokens.append({
+                "id": f"{user_id}-reset",
+                "org_id": org_id,
+                "user_id": user_id,
+                "purpose": "password_reset",
+                "token_hash": hashlib.sha256(f"{org_id}-reset-{index}".encode()).hexdigest(),
+                "expires_at": now + timedelta(hours=1),
+            })
+        for i in range(600):
+            rewards.append({
+                "id": f"{org_id}-reward-{i}",
+                "org_id": org_id,
+                "is_active": i % 10 != 0,
+                "category": categories[i % len(categories)],
+                "reward_type": "gift_card",
+                "is_popular": i % 7 == 0,
+                "rating": rng.uniform(3, 5),
+                "points_required": rng.randint(100, 5000),
+                "available_regions": ["GLOBAL"] if i % 3 else ["IN"],
+                "prices": {"INR": rng.randint(100, 20000), "USD": rng.randint(5, 300)},
+                "created_at": now - timedelta(minutes=i),
+            })
+        for i in range(4000):
+            created_at = now - timedelta(minutes=i)
+            from_user_id, to_user_ids = rng.choice(user_ids), rng.sample(user_ids, 2)
+            recognitions.append({
+                "id": f"{org_id}-recognition-{i:05d}",
+                "org_id": org_id,
+                "from_user_id": from_user_id,
+                "to_user_ids": to_user_ids,
+                "from_user_snapshot": names[from_user_id],
+                "to_user_snapshots": [names[user_id] for user_id in to_user_ids],
+                "is_public": i % 5 != 0,
+                "status": "pending" if i % 20 == 0 else "approved",
+                "values_tags": [rng.choice(["teamwork", "ownership", "customer"])],
+                "message": "Great work",
+                "created_at": created_at,
+            })
+            ledger.append({
+                "id": f"{org_id}-ledger-{i}",
+                "org_id": org_id,
+                "user_id": rng.choice(user_ids),
+                "delta": 10,
+                "created_at": created_at,
+            })
+        for i in range(1500):
+            redemptions.append({
+                "id": f"{org_id}-redemption-{i}",
+                "org_id": org_id,
+                "user_id": rng.choice(user_ids),
+                "status": statuses[i % len(statuses)],
+                "redeemed_at": now - timedelta(hours=i),
+            })
+            audit_logs.append({
+                "id": f"{org_id}-audit-{i}",
+                "org_id": org_id,
+                "actor_id": rng.choice(user_ids[:20]),
+                "action": actions[i % len(actions)],
+                "entity_type": actions[i % len(actions)].split(".")[0],
+                "timestamp": now - timedelta(minutes=i),
+            })
+            # Mostly retries scheduled for later, plus a few permanently failed
+            outbox.append({
+                "id": f"{org_id}-outbox-{i}",
+                "org_id": org_id,
+                "kind": "webhook_post",
+                "status": "failed" if i % 50 == 0 else "pending",
+                "available_at": now + timedelta(minutes=i - 20),
+                "attempts": 1,
+            })
+
+    database.users.insert_many(users)
+    database.rewards.insert_many(rewards)
+    database.recognitions.insert_many(recognitions)
+    database.redemptions.insert_many(redemptions)
+    database.points_ledger.insert_many(ledger)
+    database.audit_logs.insert_many(audit_logs)
+    database.refresh_tokens.insert_many(refresh_tokens)
+    database.user_tokens.insert_many(user_tokens)
+    database.notification_outbox.insert_many(outbox)
+
+
+@pytest.fixture(scope="module")
+def seeded_database():
+    client: MongoClient = MongoClient(MONGO_URL, serverSelectionTimeoutMS=500)
+    try:
+        client.admin.command("ping")
+    except PyMongoError:
+        client.close()
+        pytest.skip(f"MongoDB not reachable at {MONGO_URL}")
+
+    database = client[DB_NAME]
+    _seed(database)
+
+    async def build_indexes() -> None:
+        motor_client = AsyncIOMotorClient(MONGO_URL)
+        try:
+            await ensure_indexes(motor_client[DB_NAME])
+        finally:
+            motor_client.close()
+
+    asyncio.run(build_indexes())
+    yield database
+    client.drop_database(DB_NAME)
+    client.close()
+
+
+def _record(monkeypatch: pytest.MonkeyPatch, call: Callable[[], Any]) -> List[Dict[str, Any]]:
+    recording = RecordingDatabase(users=[_target_user().dict()])
+
+    async def fake_get_database() -> RecordingDatabase:
+        return recording
+
+    for module in SERVICE_MODULES:
+        monkeypatch.setattr(f"{module}.get_database", fake_get_database)
+    asyncio.run(call())
+    assert recording.queries, "the service issued no query to explain"
+    return recording.queries
+
+
+def _stages(plan: Any) -> List[str]:
+    if isinstance(plan, list):
+        return [stage for item in plan for stage in _stages(item)]
+    if not isinstance(plan, dict):
+        return []
+    stages = [plan["stage"]] if "stage" in plan else []
+    for value in plan.values():
+        if isinstance(value, (dict, list)):
+            stages.extend(_stages(value))
+    return stages
+
+
+def _explain(database: Any, spec: Dict[str, Any]) -> Tuple[List[str], Dict[str, Any]]:
+    """Replay a recorded query; returns its plan's stages and execution stats."""
+    if "pipeline" in spec:
+        explain = database.command(
+            {
+                "explain": {"aggregate": spec["collection"], "pipeline": spec["pipeline"], "cursor": {}},
+                "verbosity": "executionStats",
+            }
+        )
+        # Stages that could not be pushed into the query run as pipeline
+        # stages after a $cursor stage; a $sort among them is blocking
+        pipeline_stages = explain.get("stages", [])
+        if pipeline_stages and "$cursor" in pipeline_stages[0]:
+            explain = pipeline_stages[0]["$cursor"]
+        stages = _stages(explain["queryPlanner"]["winningPlan"])
+        stages.extend("SORT" for stage in pipeline_stages if "$sort" in stage)
+        return stages, explain["executionStats"]
+
+    cursor = database[spec["collection"]].find(spec["filter"], spec["projection"])
+    if spec.get("sort"):
+        cursor = cursor.sort(spec["sort"])
+    if spec.get("skip"):
+        cursor = cursor.skip(spec["skip"])
+    if spec.get("limit"):
+        cursor = cursor.limit(spec["limit"])
+    explain = cursor.explain()
+    return _stages(explain["queryPlanner"]["winningPlan"]), explain["executionStats"]
+
+
+def _target_user():
+    return _make_user(user_id=TARGET_USER, role=UserRole.HR_ADMIN, org_id=TARGET_ORG)
+
+
+def _claims() -> TokenClaims:
+    return TokenClaims(id=TARGET_USER, org_id=TARGET_ORG, role=UserRole.HR_ADMIN)
+
+
+def _cursor(kind: str) -> str:
+    return encode_cursor(kind, [datetime.utcnow() - timedelta(days=1), f"{TARGET_ORG}-recognition-01440"])
+
+
+async def _reset_password() -> None:
+    # The recording fake holds no tokens, so only the lookup runs
+    with pytest.raises(HTTPException):
+        await AuthService().reset_password(f"{TARGET_ORG}-reset-7", "N3w-password!")
+
+
+async def _claim_outbox() -> None:
+    await NotificationOutbox().dispatch_once(await connection.get_database())
+
+
+QUERY_SHAPES: Dict[str, Callable[[], Any]] = {
+    "feed": lambda: RecognitionService().get_public_feed(_target_user(), limit=20),
+    "feed_search": lambda: RecognitionService().get_public_feed(_target_user(), search="Name42", limit=20),
+    "feed_next_page": lambda: RecognitionService().get_public_feed(_target_user(), limit=20, cursor=_cursor("feed")),
+    "history_received": lambda: RecognitionService().get_history(_target_user(), direction="received"),
+    "history_sent": lambda: RecognitionService().get_history(_target_user(), direction="sent"),
+    "history_all": lambda: RecognitionService().get_history(_target_user()),
+    "history_all_next_page": lambda: RecognitionService().get_history(_target_user(), cursor=_cursor("history")),
+    "recipient_search": lambda: RecognitionService().search_recipients(_target_user(), "name1"),
+    "pending_approvals": lambda: RecognitionService().get_pending_recognitions(_target_user()),
+    "catalog": lambda: RewardService().get_rewards(org_id=TARGET_ORG),
+    "catalog_category": lambda: RewardService().get_rewards(org_id=TARGET_ORG, category="wellness"),
+    "catalog_points_range": lambda: RewardService().get_rewards(org_id=TARGET_ORG, min_points=500, max_points=4500),
+    "recommendations": lambda: RecommendationService().get_personalized_recommendations(_target_user()),
+    "gift_recommendations": lambda: RecommendationService().get_gift_recommendations(
+        TARGET_USER, 0, 20000, org_id=TARGET_ORG
+    ),
+    "points_ledger": lambda: get_my_points_ledger(limit=100, cursor=None, current_user=_target_user()),
+    "audit_logs": lambda: list_audit_logs(
+        limit=50, skip=0, cursor=None, actor_id=None, action=None, entity_type=None, current_user=_claims()
+    ),
+    "audit_logs_by_action": lambda: list_audit_logs(
+        limit=50, skip=0, cursor=None, actor_id=None, action="reward.update", entity_type=None, current_user=_claims()
+    ),
+    "user_redemptions": lambda: RedemptionService().get_user_redemptions(_target_user()),
+    "admin_redemptions": lambda: get_redemptions(status=None, current_user=_target_user()),
+    "admin_redemptions_by_status": lambda: get_redemptions(
+        status=RedemptionStatus.REQUESTED, current_user=_target_user()
+    ),
+    "refresh_token_lookup": lambda: AuthService().revoke_refresh_token(REFRESH_TOKEN),
+    "reset_token_lookup": _reset_password,
+    "outbox_claim": _claim_outbox,
+}
+
+
+@pytest.mark.parametrize("shape", sorted(QUERY_SHAPES))
+def test_query_plan_uses_indexes(shape: str, seeded_database, monkeypatch: pytest.MonkeyPatch) -> None:
+    for spec in _record(monkeypatch, QUERY_SHAPES[shape]):
+        stages, stats = _explain(seeded_database, spec)
+        blocking = BLOCKING_STAGES.difference(ALLOWED_STAGES.get(shape, ())).intersection(stages)
+        query = spec.get("filter", spec.get("pipeline"))
+        assert not blocking, f"{shape} on {spec['collection']} uses {sorted(blocking)}: {query}"
+
+        examined = stats["totalDocsExamined"]
+        returned = stats["nReturned"]
+        assert examined <= MAX_EXAMINED_PER_RETURNED * max(returned, 1), (
+            f"{shape} on {spec['collection']} examined {examined} documents to return {returned}"
+        )
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.search import user_search_fields
+
+
+def test_search_pages_matches_with_eligibility(recognition_service_setup):
+    service, _, users = recognition_service_setup
+
+    first = asyncio.run(service.search_recipients(users["manager"], "emp", limit=2))
+    assert [item.id for item in first.items] == ["employee-1", "employee-2"]
+    assert first.next_cursor
+
+    second = asyncio.run(service.search_recipients(users["manager"], "emp", limit=2, cursor=first.next_cursor))
+    assert [item.id for item in second.items] == ["employee-3", "employee-4"]
+    assert second.next_cursor is None
+
+    flags = {item.id: (item.in_reporting_line, item.points_eligible, item.reason) for item in first.items + second.items}
+    assert flags["employee-4"] == (True, True, "reporting_line")
+    assert flags["employee-3"] == (False, False, "outside_reporting_line")
+
+
+def test_search_marks_peers_for_employees(recognition_service_setup):
+    service, _, users = recognition_service_setup
+
+    result = asyncio.run(service.search_recipients(users["employee"], "EMPLOYEE"))
+
+    flags = {item.id: (item.is_peer, item.points_eligible) for item in result.items}
+    assert "employee-1" not in flags
+    assert flags["employee-2"] == (True, True)
+    assert flags["employee-3"] == (False, False)
+
+
+def test_search_matches_long_queries_and_skips_inactive(recognition_service_setup):
+    service, db, users = recognition_service_setup
+    asyncio.run(db.users.update_one({"id": "employee-2"}, {"$set": {"is_active": False}}))
+
+    by_email = asyncio.run(service.search_recipients(users["hr"], "employee-4@exam"))
+    assert [item.id for item in by_email.items] == ["employee-4"]
+
+    by_name = asyncio.run(service.search_recipients(users["hr"], "  Tést  Emp"))
+    assert [item.id for item in by_name.items] == ["employee-1", "employee-3", "employee-4"]
+
+
+def test_search_rejects_malformed_cursor(recognition_service_setup):
+    service, _, users = recognition_service_setup
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(service.search_recipients(users["hr"], "emp", cursor="no-separator"))
+
+    assert exc.value.status_code == 400
+
+
+def test_search_fields_cover_each_word_and_full_name():
+    fields = user_search_fields("Mary Ann", "Núñez", "mary@example.com", "Customer Success")
+
+    assert fields["search_name"] == "nunez mary ann"
+    for prefix in ("ann", "nu", "mary ann n", "succ", "mary@ex", "nunez mary"):
+        assert prefix in fields["search_prefixes"]
@@ -9,6 +9,7 @@ from app.models.enums import RecognitionScope, RecognitionType, UserRole
 from app.models.recognition import RecognitionCreate
 from app.models.user import User
 from app.services.recognition_service import RecognitionService
+from app.services.user_service import UserService
 
 from .fakes import FakeDatabase
 
@@ -43,6 +44,8 @@ def _setup_service(monkeypatch: pytest.MonkeyPatch, db: FakeDatabase) -> Recogni
         return db
 
     monkeypatch.setattr("app.services.recognition_service.get_database", fake_get_database)
+    monkeypatch.setattr("app.services.user_service.get_database", fake_get_database)
+    asyncio.run(UserService().rebuild_manager_chains("org-1"))
     return RecognitionService()
 
 
@@ -101,3 +104,36 @@ def test_manager_cannot_exceed_monthly_allowance(monkeypatch: pytest.MonkeyPatch
 
     assert exc.value.status_code == status.HTTP_400_BAD_REQUEST
     assert "allowance" in exc.value.detail.lower()
+
+
+@pytest.mark.parametrize("decide", ["approve_recognition", "reject_recognition"])
+def test_decision_loses_to_a_concurrent_one(monkeypatch: pytest.MonkeyPatch, decide: str) -> None:
+    hr_admin = _make_user(user_id="hr-1", role=UserRole.HR_ADMIN)
+    recipient = _make_user(user_id="employee-1", role=UserRole.EMPLOYEE)
+    db = FakeDatabase(users=[hr_admin.dict(), recipient.dict()])
+    service = _setup_service(monkeypatch, db)
+    payload = RecognitionCreate(
+        to_user_id=recipient.id,
+        message="Exceptional leadership",
+        recognition_type=RecognitionType.COMPANY_WIDE,
+        scope=RecognitionScope.GLOBAL,
+        points_awarded=250,
+    )
+    recognition = asyncio.run(service.create_recognition(hr_admin, payload))
+    read_record = db.recognitions.find_one
+
+    async def find_then_bulk_approve(query, *args, **kwargs):
+        # A bulk approve lands between the read and the write
+        record = await read_record(query, *args, **kwargs)
+        await db.recognitions.update_one({"id": recognition.id}, {"$set": {"status": "approved"}})
+        return record
+
+    monkeypatch.setattr(db.recognitions, "find_one", find_then_bulk_approve)
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(getattr(service, decide)(recognition.id, hr_admin))
+
+    assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+    assert db.recognitions.get(recognition.id)["status"] == "approved"
+    assert db.users.get(recipient.id)["points_balance"] == 0
+    assert db.points_ledger.values() == []
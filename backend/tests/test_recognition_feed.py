@@ -57,7 +57,7 @@ def test_public_feed_only_returns_public_items(
     for record in recognitions:
         asyncio.run(db.recognitions.insert_one(record))
 
-    feed = asyncio.run(service.get_public_feed(users["employee"], limit=10))
+    feed = asyncio.run(service.get_public_feed(users["employee"], limit=10)).items
 
     assert [entry.id for entry in feed] == ["rec-public-1"]
 
@@ -113,11 +113,11 @@ def test_public_feed_pagination_is_deterministic(
     for record in recognitions:
         asyncio.run(db.recognitions.insert_one(record))
 
-    first_page = asyncio.run(service.get_public_feed(users["employee"], limit=2))
+    first_page = asyncio.run(service.get_public_feed(users["employee"], limit=2)).items
     assert [entry.id for entry in first_page] == ["rec-004", "rec-003"]
 
     cursor = f"{first_page[-1].created_at.isoformat()}|{first_page[-1].id}"
-    second_page = asyncio.run(service.get_public_feed(users["employee"], limit=2, cursor=cursor))
+    second_page = asyncio.run(service.get_public_feed(users["employee"], limit=2, cursor=cursor)).items
     assert [entry.id for entry in second_page] == ["rec-002"]
 
 
@@ -157,7 +157,7 @@ def test_public_feed_excludes_other_orgs(
     for record in recognitions:
         asyncio.run(db.recognitions.insert_one(record))
 
-    feed = asyncio.run(service.get_public_feed(users["employee"], limit=10))
+    feed = asyncio.run(service.get_public_feed(users["employee"], limit=10)).items
 
     assert [entry.id for entry in feed] == ["rec-org-1"]
 
@@ -202,8 +202,53 @@ def test_public_feed_filters_by_search_and_value_tag(
     for record in recognitions:
         asyncio.run(db.recognitions.insert_one(record))
 
-    feed = asyncio.run(service.get_public_feed(users["employee"], limit=10, search="teamwork"))
+    feed = asyncio.run(service.get_public_feed(users["employee"], limit=10, search="teamwork")).items
     assert [entry.id for entry in feed] == ["rec-search-1"]
 
-    tagged = asyncio.run(service.get_public_feed(users["employee"], limit=10, value_tag="leadership"))
+    tagged = asyncio.run(service.get_public_feed(users["employee"], limit=10, value_tag="leadership")).items
     assert [entry.id for entry in tagged] == ["rec-search-2"]
+
+
+def test_public_feed_search_ranks_by_relevance_and_pages(
+    recognition_service_setup: tuple[RecognitionService, object, dict],
+) -> None:
+    service, db, users = recognition_service_setup
+    now = datetime(2024, 1, 1, 12, 0, 0)
+
+    def record(rec_id: str, message: str, minutes: int, tags: list[str]) -> dict:
+        return {
+            "id": rec_id,
+            "org_id": users["manager"].org_id,
+            "from_user_id": users["manager"].id,
+            "to_user_ids": [users["employee"].id],
+            "message": message,
+            "points_awarded": 10,
+            "recognition_type": RecognitionType.PEER_TO_PEER,
+            "created_at": now + timedelta(minutes=minutes),
+            "is_public": True,
+            "values_tags": tags,
+            "from_user_snapshot": _summary(users["manager"]),
+            "to_user_snapshots": [_summary(users["employee"])],
+        }
+
+    for doc in [
+        record("rec-best", "Launch day: the launch checklist kept the launch calm", 0, ["ownership"]),
+        record("rec-newer", "Helped with the launch", 5, ["ownership"]),
+        record("rec-newest", "Helped with the launch too", 10, ["teamwork"]),
+        record("rec-unrelated", "Thanks for the review", 15, ["ownership"]),
+    ]:
+        asyncio.run(db.recognitions.insert_one(doc))
+
+    first_page = asyncio.run(service.get_public_feed(users["employee"], limit=2, search="launch")).items
+    assert [entry.id for entry in first_page] == ["rec-best", "rec-newest"]
+    assert first_page[0].search_score > first_page[1].search_score
+
+    last = first_page[-1]
+    cursor = f"{last.search_score}|{last.created_at.isoformat()}|{last.id}"
+    second_page = asyncio.run(service.get_public_feed(users["employee"], limit=2, search="launch", cursor=cursor)).items
+    assert [entry.id for entry in second_page] == ["rec-newer"]
+
+    tagged = asyncio.run(
+        service.get_public_feed(users["employee"], limit=10, search="launch", value_tag="teamwork")
+    ).items
+    assert [entry.id for entry in tagged] == ["rec-newest"]
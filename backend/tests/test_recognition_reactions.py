@@ -3,6 +3,9 @@ from __future__ import annotations
 import asyncio
 from typing import Dict
 
+import pytest
+from fastapi import HTTPException
+
 from app.models.enums import RecognitionScope, RecognitionType
 from app.models.recognition import RecognitionCreate
 from app.models.user import User
@@ -30,19 +33,85 @@ def test_toggle_reaction_adds_and_removes_user(
     recognition = asyncio.run(service.create_recognition(manager, payload))
 
     updated = asyncio.run(service.toggle_reaction(recognition.id, "👍", employee))
-    assert len(updated.reactions) == 1
-    assert updated.reactions[0].emoji == "👍"
-    assert updated.reactions[0].user_ids == [employee.id]
+    assert [reaction.dict() for reaction in updated.reactions] == [
+        {"emoji": "👍", "count": 1, "reacted_by_me": True}
+    ]
 
     removed = asyncio.run(service.toggle_reaction(recognition.id, "👍", employee))
     assert removed.reactions == []
 
     first_add = asyncio.run(service.toggle_reaction(recognition.id, "🎉", employee))
-    assert first_add.reactions[0].user_ids == [employee.id]
+    assert (first_add.reactions[0].count, first_add.reactions[0].reacted_by_me) == (1, True)
 
     second_add = asyncio.run(service.toggle_reaction(recognition.id, "🎉", peer))
-    assert second_add.reactions[0].user_ids == [employee.id, peer.id]
+    assert (second_add.reactions[0].count, second_add.reactions[0].reacted_by_me) == (2, True)
 
+    # Counters live on the recognition; who reacted is kept out of it
     record = db.recognitions.get(recognition.id)
-    assert record["reactions"][0]["emoji"] == "🎉"
-    assert record["reactions"][0]["user_ids"] == [employee.id, peer.id]
+    assert record["reaction_counts"] == {"👍": 0, "🎉": 2}
+    assert "reactions" not in record
+    assert sorted(doc["user_id"] for doc in db.recognition_reactions.values()) == sorted([employee.id, peer.id])
+
+
+def test_feed_reports_reacted_by_me_per_caller(
+    recognition_service_setup: tuple[RecognitionService, FakeDatabase, Dict[str, User]]
+) -> None:
+    service, _, users = recognition_service_setup
+    payload = RecognitionCreate(
+        to_user_id=users["employee"].id,
+        message="Great launch!",
+        recognition_type=RecognitionType.MANAGER_TO_EMPLOYEE,
+        scope=RecognitionScope.REPORT,
+    )
+    recognition = asyncio.run(service.create_recognition(users["manager"], payload))
+    asyncio.run(service.toggle_reaction(recognition.id, "🎉", users["peer"]))
+
+    peer_feed = asyncio.run(service.get_public_feed(users["peer"])).items
+    employee_feed = asyncio.run(service.get_public_feed(users["employee"])).items
+    assert [(r.emoji, r.count, r.reacted_by_me) for r in peer_feed[0].reactions] == [("🎉", 1, True)]
+    assert [(r.emoji, r.count, r.reacted_by_me) for r in employee_feed[0].reactions] == [("🎉", 1, False)]
+
+    history = asyncio.run(service.get_history(users["employee"], direction="received")).items
+    assert [(r.count, r.reacted_by_me) for r in history[0].reactions] == [(1, False)]
+
+
+def test_legacy_embedded_reactions_are_migrated_on_toggle(
+    recognition_service_setup: tuple[RecognitionService, FakeDatabase, Dict[str, User]]
+) -> None:
+    service, db, users = recognition_service_setup
+    employee, peer = users["employee"], users["peer"]
+    asyncio.run(db.recognitions.insert_one({
+        "id": "rec-legacy",
+        "org_id": employee.org_id,
+        "from_user_id": users["manager"].id,
+        "to_user_ids": [employee.id],
+        "message": "Thanks!",
+        "points_awarded": 0,
+        "recognition_type": RecognitionType.PEER_TO_PEER,
+        "is_public": True,
+        "reactions": [{"emoji": "👍", "user_ids": [employee.id, peer.id]}],
+    }))
+
+    feed = asyncio.run(service.get_public_feed(employee)).items
+    assert [(r.emoji, r.count) for r in feed[0].reactions] == [("👍", 2)]
+
+    result = asyncio.run(service.toggle_reaction("rec-legacy", "👍", employee))
+
+    assert [(r.count, r.reacted_by_me) for r in result.reactions] == [(1, False)]
+    record = db.recognitions.get("rec-legacy")
+    assert record["reaction_counts"] == {"👍": 1}
+    assert "reactions" not in record
+    assert [doc["user_id"] for doc in db.recognition_reactions.values()] == [peer.id]
+
+
+@pytest.mark.parametrize("emoji", ["", "a.b", "$set", "x" * 17])
+def test_toggle_reaction_rejects_unusable_emoji(
+    recognition_service_setup: tuple[RecognitionService, FakeDatabase, Dict[str, User]],
+    emoji: str,
+) -> None:
+    service, _, users = recognition_service_setup
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(service.toggle_reaction("missing", emoji, users["employee"]))
+
+    assert exc.value.status_code == 400
@@ -4,6 +4,9 @@ import asyncio
 from datetime import datetime
 from typing import Dict
 
+import pytest
+from fastapi import HTTPException
+
 from app.models.enums import RecognitionScope, RecognitionType
 from app.models.recognition import RecognitionCreate
 from app.models.user import User
@@ -96,3 +99,71 @@ def test_recognition_updates_multiple_recipients(
     assert len(ledger_entries) == 2
     ledger_user_ids = {entry["user_id"] for entry in ledger_entries}
     assert ledger_user_ids == {direct_report.id, peer_report.id}
+
+
+def test_team_payout_is_one_user_batch_and_one_ledger_insert(
+    recognition_service_setup: tuple[RecognitionService, FakeDatabase, Dict[str, User]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service, db, users = recognition_service_setup
+    manager = users["manager"]
+    reports = [users["employee"], users["peer"], users["grand_report"]]
+    calls: list[str] = []
+
+    watched = (
+        (db.users, "update_one"),
+        (db.users, "bulk_write"),
+        (db.points_ledger, "insert_one"),
+        (db.points_ledger, "insert_many"),
+    )
+    for collection, method in watched:
+        original = getattr(collection, method)
+
+        async def counting(*args, _original=original, _method=method, **kwargs):
+            calls.append(_method)
+            return await _original(*args, **kwargs)
+
+        monkeypatch.setattr(collection, method, counting)
+
+    payload = RecognitionCreate(
+        to_user_ids=[report.id for report in reports],
+        message="Thanks for the release weekend",
+        recognition_type=RecognitionType.MANAGER_TO_EMPLOYEE,
+        scope=RecognitionScope.REPORT,
+    )
+
+    asyncio.run(service.create_recognition(manager, payload))
+
+    # The conditional allowance debit, then one credit batch and one ledger insert
+    assert calls == ["update_one", "bulk_write", "insert_many"]
+    assert [db.users.get(report.id)["points_balance"] for report in reports] == [
+        report.points_balance + DEFAULT_POINTS for report in reports
+    ]
+    assert db.users.get(manager.id)["monthly_points_spent"] == manager.monthly_points_spent + DEFAULT_POINTS
+    assert len(db.points_ledger.values()) == 3
+
+
+def test_allowance_debit_rejects_stale_cached_sender(
+    recognition_service_setup: tuple[RecognitionService, FakeDatabase, Dict[str, User]],
+) -> None:
+    service, db, users = recognition_service_setup
+    manager = users["manager"]
+    report = users["employee"]
+    # Another worker spent the allowance; this request's (cached) copy has not seen it
+    asyncio.run(db.users.update_one({"id": manager.id}, {"$set": {"monthly_points_spent": 495}}))
+    payload = RecognitionCreate(
+        to_user_id=report.id,
+        message="Thanks for covering on-call",
+        recognition_type=RecognitionType.MANAGER_TO_EMPLOYEE,
+        scope=RecognitionScope.REPORT,
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(service.create_recognition(manager, payload))
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail == "Monthly points allowance exceeded."
+    assert db.users.get(manager.id)["monthly_points_spent"] == 495
+    assert db.users.get(report.id)["points_balance"] == report.points_balance
+    assert db.recognitions.values() == []
+    assert db.points_ledger.values() == []
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException, status
+
+from app.core.security import hash_password
+from app.models.enums import UserRole
+from app.models.user import UserLogin
+from app.services.auth_service import AuthService
+from app.services.user_service import UserService
+
+from .conftest import _make_user
+from .fakes import FakeDatabase
+
+
+@pytest.fixture
+def auth_setup(monkeypatch: pytest.MonkeyPatch) -> tuple[AuthService, FakeDatabase]:
+    user = _make_user(user_id="employee-1", role=UserRole.EMPLOYEE)
+    user.password_hash = hash_password("CorrectHorse1")
+    db = FakeDatabase(users=[user.dict()])
+
+    async def fake_get_database() -> FakeDatabase:
+        return db
+
+    monkeypatch.setattr("app.services.auth_service.get_database", fake_get_database)
+    monkeypatch.setattr("app.services.user_service.get_database", fake_get_database)
+    return AuthService(), db
+
+
+def _login(service: AuthService):
+    login = UserLogin(email="employee-1@example.com", password="CorrectHorse1")
+    return asyncio.run(service.authenticate_user(login, org_id="org-1"))
+
+
+def test_refresh_rotates_token_and_stores_only_hashes(auth_setup: tuple[AuthService, FakeDatabase]) -> None:
+    service, db = auth_setup
+    login_token = _login(service)
+    assert login_token.refresh_token
+
+    refreshed = asyncio.run(service.refresh_access_token(login_token.refresh_token))
+
+    assert refreshed.access_token
+    assert refreshed.refresh_token not in (None, login_token.refresh_token)
+    records = db.refresh_tokens.values()
+    assert len(records) == 2
+    assert len({record["family_id"] for record in records}) == 1
+    assert all(login_token.refresh_token != record["token_hash"] for record in records)
+    assert sum(1 for record in records if record["revoked_at"] is None) == 1
+
+
+def test_refresh_token_reuse_revokes_family(auth_setup: tuple[AuthService, FakeDatabase]) -> None:
+    service, db = auth_setup
+    login_token = _login(service)
+    rotated = asyncio.run(service.refresh_access_token(login_token.refresh_token))
+
+    with pytest.raises(HTTPException) as reused:
+        asyncio.run(service.refresh_access_token(login_token.refresh_token))
+    assert reused.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+    with pytest.raises(HTTPException):
+        asyncio.run(service.refresh_access_token(rotated.refresh_token))
+    assert all(record["revoked_at"] is not None for record in db.refresh_tokens.values())
+
+
+def test_refresh_rejected_after_deactivation(auth_setup: tuple[AuthService, FakeDatabase]) -> None:
+    service, _db = auth_setup
+    login_token = _login(service)
+
+    asyncio.run(UserService().set_active_status("employee-1", "org-1", False))
+
+    with pytest.raises(HTTPException) as rejected:
+        asyncio.run(service.refresh_access_token(login_token.refresh_token))
+    assert rejected.value.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.api.dependencies import get_current_claims, get_current_hr_admin_claims, get_current_user
+from app.core.cache import principal_cache, token_version_cache
+from app.core.config import settings
+from app.models.enums import UserRole
+from app.models.user import UserReportingUpdate
+from app.services.auth_service import AuthService
+from app.services.user_service import UserService
+
+from .conftest import _make_user
+from .fakes import FakeDatabase
+
+
+@pytest.fixture
+def claims_db(monkeypatch: pytest.MonkeyPatch) -> FakeDatabase:
+    hr_admin = _make_user(user_id="hr-1", role=UserRole.HR_ADMIN)
+    employee = _make_user(user_id="employee-1", role=UserRole.EMPLOYEE)
+    db = FakeDatabase(users=[hr_admin.dict(), employee.dict()])
+
+    async def fake_get_database() -> FakeDatabase:
+        return db
+
+    monkeypatch.setattr(settings, "ACCESS_TOKEN_CLAIMS_ENABLED", True)
+    monkeypatch.setattr("app.services.auth_service.get_database", fake_get_database)
+    monkeypatch.setattr("app.services.user_service.get_database", fake_get_database)
+    principal_cache.clear()
+    token_version_cache.clear()
+    yield db
+    principal_cache.clear()
+    token_version_cache.clear()
+
+
+def _credentials_for(db: FakeDatabase, user_id: str) -> HTTPAuthorizationCredentials:
+    user = _make_user(user_id=user_id, role=db.users.get(user_id)["role"])
+    token = AuthService().issue_access_token(user)
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token.access_token)
+
+
+def test_claims_authorize_role_without_loading_user(claims_db: FakeDatabase, monkeypatch: pytest.MonkeyPatch) -> None:
+    credentials = _credentials_for(claims_db, "hr-1")
+    projections: list[object] = []
+    original_find_one = claims_db.users.find_one
+
+    async def recording_find_one(query=None, projection=None):
+        projections.append(projection)
+        return await original_find_one(query, projection)
+
+    monkeypatch.setattr(claims_db.users, "find_one", recording_find_one)
+
+    for _ in range(3):
+        claims = asyncio.run(get_current_claims(credentials, org_id="org-1"))
+        assert asyncio.run(get_current_hr_admin_claims(claims)).id == "hr-1"
+
+    assert projections == [{"_id": 0, "token_version": 1, "is_active": 1}]
+
+
+def test_claims_reject_wrong_role_and_org(claims_db: FakeDatabase) -> None:
+    credentials = _credentials_for(claims_db, "employee-1")
+
+    claims = asyncio.run(get_current_claims(credentials, org_id="org-1"))
+    with pytest.raises(HTTPException) as forbidden:
+        asyncio.run(get_current_hr_admin_claims(claims))
+    assert forbidden.value.status_code == status.HTTP_403_FORBIDDEN
+
+    with pytest.raises(HTTPException) as wrong_org:
+        asyncio.run(get_current_claims(credentials, org_id="org-2"))
+    assert wrong_org.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_role_change_and_deactivation_revoke_issued_tokens(claims_db: FakeDatabase) -> None:
+    service = UserService()
+    employee_credentials = _credentials_for(claims_db, "employee-1")
+    admin_credentials = _credentials_for(claims_db, "hr-1")
+    asyncio.run(get_current_claims(employee_credentials, org_id="org-1"))
+    asyncio.run(get_current_user(admin_credentials, org_id="org-1"))
+
+    asyncio.run(service.update_reporting("employee-1", "org-1", UserReportingUpdate(role=UserRole.MANAGER)))
+    asyncio.run(service.set_active_status("hr-1", "org-1", False))
+
+    with pytest.raises(HTTPException) as revoked_claims:
+        asyncio.run(get_current_claims(employee_credentials, org_id="org-1"))
+    assert revoked_claims.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+    with pytest.raises(HTTPException) as revoked_user:
+        asyncio.run(get_current_user(admin_credentials, org_id="org-1"))
+    assert revoked_user.value.status_code == status.HTTP_401_UNAUTHORIZED
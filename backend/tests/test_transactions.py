@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List, Optional
+
+import pytest
+from fastapi import HTTPException
+from pymongo.errors import OperationFailure
+
+from app.database.transactions import run_in_transaction, transaction_support
+
+from .fakes import FakeDatabase
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.in_transaction = False
+        self.events: List[str] = []
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.events.append("end")
+
+    def start_transaction(self) -> None:
+        self.in_transaction = True
+        self.events.append("start")
+
+    async def commit_transaction(self) -> None:
+        self.in_transaction = False
+        self.events.append("commit")
+
+    async def abort_transaction(self) -> None:
+        self.in_transaction = False
+        self.events.append("abort")
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.session = FakeSession()
+
+    async def start_session(self) -> FakeSession:
+        return self.session
+
+
+class ReplicaSetDatabase(FakeDatabase):
+    def __init__(self) -> None:
+        super().__init__()
+        self.client = FakeClient()
+
+    async def command(self, name: str) -> dict:
+        return {"setName": "rs0", "logicalSessionTimeoutMinutes": 30}
+
+
+@pytest.fixture(autouse=True)
+def reset_transaction_support(monkeypatch: pytest.MonkeyPatch):
+    async def no_sleep(_: float) -> None:
+        return None
+
+    monkeypatch.setattr("app.database.transactions.asyncio.sleep", no_sleep)
+    transaction_support.reset()
+    yield
+    transaction_support.reset()
+
+
+def test_write_conflict_is_retried_until_commit() -> None:
+    db = ReplicaSetDatabase()
+    sessions: List[Optional[FakeSession]] = []
+
+    async def work(session: Optional[FakeSession]) -> str:
+        sessions.append(session)
+        if len(sessions) < 3:
+            raise OperationFailure("WriteConflict", code=112)
+        return "done"
+
+    assert asyncio.run(run_in_transaction(db, work)) == "done"
+    assert all(session is db.client.session for session in sessions)
+    assert db.client.session.events == ["start", "abort", "start", "abort", "start", "commit", "end"]
+    assert transaction_support.stats() == {"supported": True, "committed": 1, "retries": 2, "fallbacks": 0}
+
+
+def test_application_errors_abort_without_retry() -> None:
+    db = ReplicaSetDatabase()
+    calls: List[int] = []
+
+    async def work(session: Optional[FakeSession]) -> None:
+        calls.append(1)
+        raise HTTPException(status_code=400, detail="Reward is out of stock")
+
+    with pytest.raises(HTTPException):
+        asyncio.run(run_in_transaction(db, work))
+
+    assert calls == [1]
+    assert db.client.session.events == ["start", "abort", "end"]
+
+
+def test_standalone_uses_fallback_without_opening_sessions() -> None:
+    db = FakeDatabase()
+    seen: List[str] = []
+
+    async def work(session) -> str:
+        seen.append("work")
+        return "transactional"
+
+    async def fallback() -> str:
+        seen.append("fallback")
+        return "compensated"
+
+    assert asyncio.run(run_in_transaction(db, work, fallback=fallback)) == "compensated"
+    assert asyncio.run(run_in_transaction(db, work)) == "transactional"
+    assert seen == ["fallback", "work"]
+    assert transaction_support.supported is False
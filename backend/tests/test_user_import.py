@@ -1,10 +1,17 @@
 import asyncio
 import io
 
+import pytest
+from fastapi import HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
 from starlette.datastructures import UploadFile
 
+from app.api.dependencies import get_current_claims
 from app.api.v1.users import import_users
+from app.core.cache import principal_cache, token_version_cache
+from app.core.config import settings
 from app.models.enums import UserRole
+from app.services.auth_service import AuthService
 
 from .conftest import _make_user
 from .fakes import FakeDatabase
@@ -26,6 +33,7 @@ def test_import_users_creates_updates_and_reports_failures(monkeypatch):
 
     monkeypatch.setattr("app.api.v1.users.get_database", fake_get_database)
     monkeypatch.setattr("app.services.auth_service.get_database", fake_get_database)
+    monkeypatch.setattr("app.services.user_service.get_database", fake_get_database)
 
     csv_payload = """email,first_name,last_name,role,manager_email,department
 existing@example.com,Updated,User,manager,manager@example.com,Sales
@@ -45,3 +53,38 @@ broken@example.com,Bad,User,employee,missing@example.com,Support
     updated_record = db.users.get(existing.id)
     assert updated_record["first_name"] == "Updated"
     assert updated_record["role"] == UserRole.MANAGER
+    assert updated_record["manager_chain"] == [manager.id]
+    created_record = next(user for user in db.users.values() if user["email"] == "newuser@example.com")
+    assert created_record["manager_chain"] == [manager.id]
+
+
+def test_import_demotion_revokes_issued_claims_tokens(monkeypatch):
+    hr_admin = _make_user(user_id="hr-1", role=UserRole.HR_ADMIN)
+    demoted = _make_user(user_id="manager-1", role=UserRole.MANAGER)
+    demoted.email = "manager@example.com"
+    db = FakeDatabase(users=[hr_admin.dict(), demoted.dict()])
+
+    async def fake_get_database():
+        return db
+
+    monkeypatch.setattr(settings, "ACCESS_TOKEN_CLAIMS_ENABLED", True)
+    monkeypatch.setattr("app.api.v1.users.get_database", fake_get_database)
+    monkeypatch.setattr("app.services.auth_service.get_database", fake_get_database)
+    monkeypatch.setattr("app.services.user_service.get_database", fake_get_database)
+    principal_cache.clear()
+    token_version_cache.clear()
+
+    token = AuthService().issue_access_token(demoted)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token.access_token)
+    assert asyncio.run(get_current_claims(credentials, org_id="org-1")).role == UserRole.MANAGER
+
+    csv_payload = """email,first_name,last_name,role,manager_email,department
+manager@example.com,Manager,Test,employee,,Engineering
+"""
+    upload = UploadFile(filename="users.csv", file=io.BytesIO(csv_payload.encode("utf-8")))
+    assert asyncio.run(import_users(upload, current_user=hr_admin))["updated"] == 1
+
+    with pytest.raises(HTTPException) as revoked:
+        asyncio.run(get_current_claims(credentials, org_id="org-1"))
+    assert revoked.value.status_code == status.HTTP_401_UNAUTHORIZED
+    assert db.users.get(demoted.id)["token_version"] == demoted.token_version + 1
@@ -1,32 +1,130 @@
 import asyncio
 import hashlib
+from datetime import datetime, timedelta
 
-from app.api.v1.users import invite_user
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.users import invite_user, invite_users
+from app.models.auth import BulkInviteRequest
 from app.models.enums import UserRole
+from app.services.auth_service import AuthService
 
 from .conftest import _make_user
 from .fakes import FakeDatabase
 
 
-def test_invite_user_creates_reset_token(monkeypatch):
-    admin = _make_user(user_id="admin-1", role=UserRole.HR_ADMIN)
-    invitee = _make_user(user_id="user-1", role=UserRole.EMPLOYEE)
-    invitee.email = "invitee@example.com"
-
-    db = FakeDatabase(users=[admin.dict(), invitee.dict()])
+def _setup_db(monkeypatch, *users):
+    db = FakeDatabase(users=[user.dict() for user in users])
 
     async def fake_get_database():
         return db
 
     monkeypatch.setattr("app.api.v1.users.get_database", fake_get_database)
     monkeypatch.setattr("app.services.auth_service.get_database", fake_get_database)
+    return db
+
+
+def test_invite_user_creates_reset_token(monkeypatch):
+    admin = _make_user(user_id="admin-1", role=UserRole.HR_ADMIN)
+    invitee = _make_user(user_id="user-1", role=UserRole.EMPLOYEE)
+    invitee.email = "invitee@example.com"
+
+    db = _setup_db(monkeypatch, admin, invitee)
     monkeypatch.setattr("app.services.auth_service.secrets.token_urlsafe", lambda _: "invite-token")
 
     response = asyncio.run(invite_user(invitee.id, current_user=admin))
 
     assert response.invite_url == "/accept-invite?token=invite-token&email=invitee%40example.com"
 
-    stored_user = db.users.get(invitee.id)
+    tokens = db.user_tokens.values()
     expected_hash = hashlib.sha256("invite-token".encode()).hexdigest()
-    assert stored_user["reset_token_hash"] == expected_hash
-    assert stored_user["reset_token_expires_at"] is not None
+    assert len(tokens) == 1
+    assert tokens[0]["token_hash"] == expected_hash
+    assert tokens[0]["user_id"] == invitee.id
+    assert tokens[0]["purpose"] == "invite"
+    assert tokens[0]["expires_at"] is not None
+    assert "reset_token_hash" not in db.users.get(invitee.id)
+
+
+def test_reinvite_replaces_previous_token_and_token_is_single_use(monkeypatch):
+    admin = _make_user(user_id="admin-1", role=UserRole.HR_ADMIN)
+    invitee = _make_user(user_id="user-1", role=UserRole.EMPLOYEE)
+    db = _setup_db(monkeypatch, admin, invitee)
+    service = AuthService()
+
+    first_token, _ = asyncio.run(service.create_invite_token(invitee.id, org_id=invitee.org_id))
+    second_token, _ = asyncio.run(service.create_invite_token(invitee.id, org_id=invitee.org_id))
+    assert len(db.user_tokens.values()) == 1
+
+    with pytest.raises(HTTPException):
+        asyncio.run(service.reset_password(first_token, "NewPassword1"))
+
+    asyncio.run(service.reset_password(second_token, "NewPassword1"))
+    assert db.user_tokens.values() == []
+    assert db.users.get(invitee.id)["password_hash"] != "hashed"
+
+    with pytest.raises(HTTPException):
+        asyncio.run(service.reset_password(second_token, "AnotherPassword1"))
+
+
+def test_reset_password_looks_tokens_up_by_hash(monkeypatch):
+    invitee = _make_user(user_id="user-1", role=UserRole.EMPLOYEE)
+    db = _setup_db(monkeypatch, invitee)
+    service = AuthService()
+    token, _ = asyncio.run(service.create_invite_token(invitee.id, org_id=invitee.org_id))
+    filters = []
+    for method in ("find_one", "delete_one"):
+        original = getattr(db.user_tokens, method)
+
+        async def recording(query, *args, _original=original, **kwargs):
+            filters.append(sorted(query))
+            return await _original(query, *args, **kwargs)
+
+        monkeypatch.setattr(db.user_tokens, method, recording)
+
+    asyncio.run(service.reset_password(token, "NewPassword1"))
+
+    assert filters == [["token_hash"], ["purpose", "token_hash"]]
+    assert db.user_tokens.values() == []
+
+
+def test_expired_token_is_rejected(monkeypatch):
+    invitee = _make_user(user_id="user-1", role=UserRole.EMPLOYEE)
+    db = _setup_db(monkeypatch, invitee)
+    service = AuthService()
+
+    token, _ = asyncio.run(service.create_invite_token(invitee.id, org_id=invitee.org_id))
+    record = db.user_tokens.values()[0]
+    asyncio.run(
+        db.user_tokens.update_one({"id": record["id"]}, {"$set": {"expires_at": datetime.utcnow() - timedelta(minutes=1)}})
+    )
+
+    with pytest.raises(HTTPException):
+        asyncio.run(service.reset_password(token, "NewPassword1"))
+
+
+def test_bulk_invite_issues_tokens_in_one_write(monkeypatch):
+    admin = _make_user(user_id="admin-1", role=UserRole.HR_ADMIN)
+    invitees = [_make_user(user_id=f"user-{index}", role=UserRole.EMPLOYEE) for index in range(3)]
+    db = _setup_db(monkeypatch, admin, *invitees)
+    bulk_calls = []
+    original_bulk_write = db.user_tokens.bulk_write
+
+    async def counting_bulk_write(requests, **kwargs):
+        bulk_calls.append(len(requests))
+        return await original_bulk_write(requests, **kwargs)
+
+    monkeypatch.setattr(db.user_tokens, "bulk_write", counting_bulk_write)
+
+    response = asyncio.run(
+        invite_users(
+            BulkInviteRequest(user_ids=[user.id for user in invitees] + ["missing-1"]),
+            current_user=admin,
+        )
+    )
+
+    assert bulk_calls == [3]
+    assert sorted(entry.user_id for entry in response.invites) == ["user-0", "user-1", "user-2"]
+    assert response.not_found == ["missing-1"]
+    assert len(db.user_tokens.values()) == 3
@@ -1,6 +1,10 @@
 import asyncio
 
+import pytest
+from fastapi import HTTPException
+
 from app.models.enums import UserRole
+from app.models.user import UserReportingUpdate
 from app.services.user_service import UserService
 
 from .conftest import _make_user
@@ -21,6 +25,8 @@ def test_get_descendants_multi_level(monkeypatch):
     monkeypatch.setattr("app.services.user_service.get_database", fake_get_database)
 
     service = UserService()
+    assert asyncio.run(service.rebuild_manager_chains(svp.org_id)) == 3
+    assert db.users.get(eng.id)["manager_chain"] == [mgr.id, vp.id, svp.id]
 
     svp_descendants = asyncio.run(service.get_descendants(svp.id, svp.org_id))
     vp_descendants = asyncio.run(service.get_descendants(vp.id, vp.org_id))
@@ -31,3 +37,31 @@ def test_get_descendants_multi_level(monkeypatch):
     assert vp_descendants == [mgr.id, eng.id]
     assert mgr_descendants == [eng.id]
     assert eng_descendants == []
+
+
+def test_update_reporting_moves_subtree_and_rejects_cycles(monkeypatch):
+    svp = _make_user(user_id="svp-1", role=UserRole.EXECUTIVE)
+    vp_a = _make_user(user_id="vp-a", role=UserRole.MANAGER, manager_id=svp.id)
+    vp_b = _make_user(user_id="vp-b", role=UserRole.MANAGER, manager_id=svp.id)
+    mgr = _make_user(user_id="mgr-1", role=UserRole.MANAGER, manager_id=vp_a.id)
+    eng = _make_user(user_id="eng-1", role=UserRole.EMPLOYEE, manager_id=mgr.id)
+
+    db = FakeDatabase(users=[user.dict() for user in [svp, vp_a, vp_b, mgr, eng]])
+
+    async def fake_get_database():
+        return db
+
+    monkeypatch.setattr("app.services.user_service.get_database", fake_get_database)
+    service = UserService()
+    asyncio.run(service.rebuild_manager_chains(svp.org_id))
+
+    asyncio.run(service.update_reporting(mgr.id, mgr.org_id, UserReportingUpdate(manager_id=vp_b.id)))
+
+    assert db.users.get(mgr.id)["manager_chain"] == [vp_b.id, svp.id]
+    assert db.users.get(eng.id)["manager_chain"] == [mgr.id, vp_b.id, svp.id]
+    assert asyncio.run(service.get_descendants(vp_a.id, vp_a.org_id)) == []
+    assert asyncio.run(service.get_descendants(vp_b.id, vp_b.org_id)) == [mgr.id, eng.id]
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(service.update_reporting(vp_b.id, vp_b.org_id, UserReportingUpdate(manager_id=eng.id)))
+    assert exc.value.status_code == 400
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, List, Tuple
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.services.webhook_service import WebhookNotifier, WebhookRejected
+
+
+class StubWebhookServer(ThreadingHTTPServer):
+    """Local HTTP server replaying scripted (status, headers) responses."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.script: List[Tuple[int, dict]] = []
+        self.delay_seconds = 0.0
+        self.requests: List[Tuple[str, int]] = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/hook"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StubWebhookServer
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        with self.server.lock:
+            self.server.requests.append((self.path, self.client_address[1]))
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+            status, headers = self.server.script.pop(0) if self.server.script else (200, {})
+        time.sleep(self.server.delay_seconds)
+        with self.server.lock:
+            self.server.active -= 1
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server() -> Iterator[StubWebhookServer]:
+    server = StubWebhookServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _fast_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "WEBHOOK_RETRY_BASE_SECONDS", 0.01)
+    monkeypatch.setattr(settings, "WEBHOOK_RETRY_MAX_SECONDS", 1.0)
+    monkeypatch.setattr(settings, "WEBHOOK_MAX_RETRIES", 2)
+
+
+def _run_with_pool(notifier: WebhookNotifier, work):
+    async def scenario():
+        notifier.start()
+        try:
+            return await work()
+        finally:
+            await notifier.close()
+
+    return asyncio.run(scenario())
+
+
+def test_pooled_client_reuses_one_connection(stub_server: StubWebhookServer) -> None:
+    notifier = WebhookNotifier()
+
+    async def work():
+        for _ in range(3):
+            await notifier.post(stub_server.url, {"text": "hi"})
+
+    _run_with_pool(notifier, work)
+
+    assert len(stub_server.requests) == 3
+    assert len({port for _, port in stub_server.requests}) == 1
+    stats = notifier.stats()
+    assert (stats["requests"], stats["delivered"], stats["failed"]) == (3, 3, 0)
+    assert stats["latency_ms_max"] > 0
+
+
+def test_throttled_and_failing_requests_are_retried(stub_server: StubWebhookServer) -> None:
+    stub_server.script = [(429, {"Retry-After": "0"}), (503, {}), (200, {})]
+    notifier = WebhookNotifier()
+
+    _run_with_pool(notifier, lambda: notifier.post(stub_server.url, {"text": "hi"}))
+
+    assert len(stub_server.requests) == 3
+    assert (notifier.retries, notifier.delivered) == (2, 1)
+
+
+def test_gives_up_after_max_retries_or_long_retry_after(stub_server: StubWebhookServer) -> None:
+    stub_server.script = [(500, {})] * 3 + [(429, {"Retry-After": "120"}), (404, {})]
+    notifier = WebhookNotifier()
+
+    async def work():
+        errors = []
+        for _ in range(3):
+            with pytest.raises(httpx.HTTPStatusError) as exc:
+                await notifier.post(stub_server.url, {"text": "hi"})
+            errors.append((exc.value.response.status_code, isinstance(exc.value, WebhookRejected)))
+        return errors
+
+    # 3 x 500, then a Retry-After beyond the cap, then a non-retryable 404
+    assert _run_with_pool(notifier, work) == [(500, False), (429, False), (404, True)]
+    assert len(stub_server.requests) == 5
+    assert (notifier.retries, notifier.failed) == (2, 3)
+
+
+def test_concurrent_requests_per_host_are_capped(
+    stub_server: StubWebhookServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "WEBHOOK_MAX_CONNECTIONS_PER_HOST", 2)
+    stub_server.delay_seconds = 0.05
+    notifier = WebhookNotifier()
+
+    async def work():
+        await asyncio.gather(*(notifier.post(stub_server.url, {"text": str(n)}) for n in range(6)))
+
+    _run_with_pool(notifier, work)
+
+    assert len(stub_server.requests) == 6
+    assert stub_server.max_active == 2
@@ -0,0 +1,44 @@
+import type { Page } from '@playwright/test';
+
+interface RecipientMatch {
+  id: string;
+  first_name: string;
+  last_name: string;
+}
+
+interface NamedUser {
+  firstName: string;
+  lastName: string;
+}
+
+// Types into a recipient search box and returns the matches the page received.
+export async function searchRecipients(
+  page: Page,
+  query: string,
+  searchTestId = 'recognition-recipient-search'
+): Promise<RecipientMatch[]> {
+  const responsePromise = page.waitForResponse(
+    (response) =>
+      response.url().includes('/api/v1/recognitions/recipients/search') &&
+      new URL(response.url()).searchParams.get('q') === query &&
+      response.request().method() === 'GET'
+  );
+  await page.getByTestId(searchTestId).fill(query);
+  const data = await (await responsePromise).json();
+  return data?.items ?? [];
+}
+
+export async function findRecipientId(
+  page: Page,
+  { firstName, lastName }: NamedUser,
+  searchTestId?: string
+): Promise<string> {
+  const matches = await searchRecipients(page, `${firstName} ${lastName}`, searchTestId);
+  const match = matches.find(
+    (recipient) => recipient.first_name === firstName && recipient.last_name === lastName
+  );
+  if (!match) {
+    throw new Error(`Expected to find ${firstName} ${lastName} in recipient search.`);
+  }
+  return match.id;
+}
@@ -1,5 +1,7 @@
 import { expect, test, type Page } from '@playwright/test';
 import path from 'node:path';
+import { TEST_USERS } from '../constants/users';
+import { findRecipientId } from '../helpers/recipients';
 
 const authDir = path.join(__dirname, '..', '.auth');
 const employeeStorageState = path.join(authDir, 'employee.json');
@@ -21,15 +23,11 @@ test.describe('Gift recommendations', () => {
     const settingsData = await settingsResponse.json();
     test.skip(!settingsData?.ai_enabled, 'AI recommendations are disabled for this environment.');
 
-    const recipientsResponse = await page.request.get('/api/v1/recognitions/recipients');
-    const recipientsData = await recipientsResponse.json();
-    const recipients = recipientsData?.recipients ?? [];
-    test.skip(!recipients.length, 'No available recipients for gift recommendations.');
-
     await page.goto('/dashboard');
     const recipientSelect = page.getByTestId('gift-recipient');
     await expect(recipientSelect).toBeVisible();
-    await recipientSelect.selectOption(recipients[0].id);
+    const recipientId = await findRecipientId(page, TEST_USERS.employee2, 'gift-recipient-search');
+    await recipientSelect.selectOption(recipientId);
 
     const requestPromise = waitForGiftRecommendationRequest(page);
     await page.getByTestId('gift-recommendations-submit').click();
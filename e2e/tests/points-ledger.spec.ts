@@ -1,6 +1,7 @@
 import { expect, test } from '@playwright/test';
 import { TEST_USERS } from '../constants/users';
 import { loginAs } from '../helpers/auth';
+import { findRecipientId } from '../helpers/recipients';
 
 test.describe('points ledger', () => {
   test('shows recognition awards in the ledger', async ({ page }, testInfo) => {
@@ -11,33 +12,10 @@ test.describe('points ledger', () => {
       password: TEST_USERS.executive.password
     });
 
-    const recipientsResponsePromise = page.waitForResponse(
-      (response) =>
-        response.url().includes('/api/v1/recognitions/recipients') &&
-        response.request().method() === 'GET'
-    );
-
     await page.getByTestId('send-recognition-cta').click();
     await expect(page.getByRole('dialog')).toBeVisible();
 
-    const recipientsResponse = await recipientsResponsePromise;
-    const recipientsData = await recipientsResponse.json();
-
-    const targetFirstName = TEST_USERS.employee1.firstName;
-    const targetLastName = TEST_USERS.employee1.lastName;
-    let selectedRecipientId: string | null = null;
-
-    const match = recipientsData?.recipients?.find(
-      (recipient: { first_name: string; last_name: string; id: string }) =>
-        recipient.first_name === targetFirstName && recipient.last_name === targetLastName
-    );
-    if (match) {
-      selectedRecipientId = match.id;
-    }
-
-    if (!selectedRecipientId) {
-      throw new Error('Expected to find emp1 in recognition recipients.');
-    }
+    const selectedRecipientId = await findRecipientId(page, TEST_USERS.employee1);
 
     await page.getByTestId('recognition-recipient').selectOption(selectedRecipientId);
     await page.getByLabel('Recognition type').selectOption('spot_award');
@@ -1,6 +1,7 @@
 import { expect, test } from '@playwright/test';
 import { TEST_USERS } from '../constants/users';
 import { loginAs } from '../helpers/auth';
+import { findRecipientId } from '../helpers/recipients';
 
 test.describe('employee recognition flow', () => {
   test('employee sends recognition to a peer', async ({ page }, testInfo) => {
@@ -21,12 +22,6 @@ test.describe('employee recognition flow', () => {
       await expect(page.getByRole('heading', { name: /recommended for you/i })).toHaveCount(0);
     }
 
-    const recipientsResponsePromise = page.waitForResponse(
-      (response) =>
-        response.url().includes('/api/v1/recognitions/recipients') &&
-        response.request().method() === 'GET'
-    );
-
     await page.getByTestId('send-recognition-cta').click();
 
     await expect(page.getByRole('dialog')).toBeVisible();
@@ -35,25 +30,8 @@ test.describe('employee recognition flow', () => {
       await expect(page.getByRole('button', { name: /improve with ai/i })).toHaveCount(0);
     }
 
-    const recipientsResponse = await recipientsResponsePromise;
-    const recipientsData = await recipientsResponse.json();
     const recipientSelect = page.getByTestId('recognition-recipient');
-
-    const targetFirstName = TEST_USERS.employee2.firstName;
-    const targetLastName = TEST_USERS.employee2.lastName;
-    let selectedRecipientId: string | null = null;
-
-    const match = recipientsData?.recipients?.find(
-      (recipient: { first_name: string; last_name: string; id: string }) =>
-        recipient.first_name === targetFirstName && recipient.last_name === targetLastName
-    );
-    if (match) {
-      selectedRecipientId = match.id;
-    }
-
-    if (!selectedRecipientId) {
-      throw new Error('Expected to find emp2 in recognition recipients.');
-    }
+    const selectedRecipientId = await findRecipientId(page, TEST_USERS.employee2);
 
     await recipientSelect.selectOption(selectedRecipientId);
     await page.getByLabel('Recognition type').selectOption('spot_award');
@@ -109,35 +87,12 @@ test.describe('employee recognition flow', () => {
       password: TEST_USERS.employee1.password
     });
 
-    const recipientsResponsePromise = page.waitForResponse(
-      (response) =>
-        response.url().includes('/api/v1/recognitions/recipients') &&
-        response.request().method() === 'GET'
-    );
-
     await page.getByTestId('send-recognition-cta').click();
 
     await expect(page.getByRole('dialog')).toBeVisible();
 
-    const recipientsResponse = await recipientsResponsePromise;
-    const recipientsData = await recipientsResponse.json();
     const recipientSelect = page.getByTestId('recognition-recipient');
-
-    const targetFirstName = TEST_USERS.hrAdmin.firstName;
-    const targetLastName = TEST_USERS.hrAdmin.lastName;
-    let selectedRecipientId: string | null = null;
-
-    const match = recipientsData?.recipients?.find(
-      (recipient: { first_name: string; last_name: string; id: string }) =>
-        recipient.first_name === targetFirstName && recipient.last_name === targetLastName
-    );
-    if (match) {
-      selectedRecipientId = match.id;
-    }
-
-    if (!selectedRecipientId) {
-      throw new Error('Expected to find the HR admin in recognition recipients.');
-    }
+    const selectedRecipientId = await findRecipientId(page, TEST_USERS.hrAdmin);
 
     const eligibilityResponsePromise = page.waitForResponse(
       (response) =>
@@ -1,6 +1,7 @@
 import { expect, test } from '@playwright/test';
 import { TEST_USERS } from '../constants/users';
 import { loginAs } from '../helpers/auth';
+import { findRecipientId } from '../helpers/recipients';
 
 test.describe('manager recognition flow', () => {
   test('manager sends recognition to a direct report', async ({ page }, testInfo) => {
@@ -11,38 +12,13 @@ test.describe('manager recognition flow', () => {
       password: TEST_USERS.manager.password
     });
 
-    const recipientsResponsePromise = page.waitForResponse(
-      (response) =>
-        response.url().includes('/api/v1/recognitions/recipients') &&
-        response.request().method() === 'GET'
-    );
-
     await page.getByTestId('send-recognition-cta').click();
 
     await expect(page.getByRole('dialog')).toBeVisible();
 
-    const recipientsResponse = await recipientsResponsePromise;
-    const recipientsData = await recipientsResponse.json();
-
-    const recipients = recipientsData?.recipients ?? [];
-    const emp1Match = recipients.find(
-      (recipient: { first_name: string; last_name: string; id: string }) =>
-        recipient.first_name === TEST_USERS.employee1.firstName &&
-        recipient.last_name === TEST_USERS.employee1.lastName
-    );
-    const emp2Match = recipients.find(
-      (recipient: { first_name: string; last_name: string; id: string }) =>
-        recipient.first_name === TEST_USERS.employee2.firstName &&
-        recipient.last_name === TEST_USERS.employee2.lastName
-    );
-
-    if (!emp1Match || !emp2Match) {
-      throw new Error('Expected emp1 and emp2 to appear in recognition recipients.');
-    }
+    const emp1Id = await findRecipientId(page, TEST_USERS.employee1);
 
-    const recipientSelect = page.getByTestId('recognition-recipient');
-
-    await recipientSelect.selectOption(emp1Match.id);
+    await page.getByTestId('recognition-recipient').selectOption(emp1Id);
 
     const message = `Manager recognition ${Date.now()}`;
     await page.getByTestId('recognition-message').fill(message);
@@ -81,26 +57,16 @@ test.describe('manager recognition flow', () => {
       password: TEST_USERS.manager.password
     });
 
-    const recipientsResponsePromise = page.waitForResponse(
-      (response) =>
-        response.url().includes('/api/v1/recognitions/recipients') &&
-        response.request().method() === 'GET'
-    );
-
     await page.getByTestId('send-recognition-cta').click();
 
     await expect(page.getByRole('dialog')).toBeVisible();
 
-    const recipientsResponse = await recipientsResponsePromise;
-    const recipientsData = await recipientsResponse.json();
-
-    const recipients = recipientsData?.recipients ?? [];
-    if (recipients.length < 2) {
-      throw new Error('Expected at least two recipients to run multi-select test.');
-    }
-
     const recipientSelect = page.getByTestId('recognition-recipient');
-    const selectedIds = recipients.slice(0, 2).map((recipient: { id: string }) => recipient.id);
+    const emp1Id = await findRecipientId(page, TEST_USERS.employee1);
+    await recipientSelect.selectOption(emp1Id);
+    // Selected teammates stay listed while searching for the next one
+    const emp2Id = await findRecipientId(page, TEST_USERS.employee2);
+    const selectedIds = [emp1Id, emp2Id];
 
     await recipientSelect.selectOption(selectedIds);
 
@@ -1,5 +1,6 @@
 import { test, expect } from '@playwright/test';
 import { loginAs } from '../helpers/auth';
+import { findRecipientId } from '../helpers/recipients';
 import { TEST_USERS } from '../constants/users';
 
 test('homepage loads and shows primary call to action', async ({ page }) => {
@@ -19,29 +20,13 @@ test('employee can send recognition from the modal', async ({ page }, testInfo)
     password: TEST_USERS.employee1.password
   });
 
-  const recipientsResponsePromise = page.waitForResponse(
-    (response) =>
-      response.url().includes('/api/v1/recognitions/recipients') &&
-      response.request().method() === 'GET'
-  );
-
   await page.getByTestId('send-recognition-cta').click();
 
   await expect(page.getByRole('dialog')).toBeVisible();
 
-  const recipientsResponse = await recipientsResponsePromise;
-  const recipientsData = await recipientsResponse.json();
-  const match = recipientsData?.recipients?.find(
-    (recipient: { first_name: string; last_name: string; id: string }) =>
-      recipient.first_name === TEST_USERS.employee2.firstName &&
-      recipient.last_name === TEST_USERS.employee2.lastName
-  );
-
-  if (!match?.id) {
-    throw new Error('Expected to find employee2 in recognition recipients.');
-  }
+  const selectedRecipientId = await findRecipientId(page, TEST_USERS.employee2);
 
-  await page.getByTestId('recognition-recipient').selectOption(match.id);
+  await page.getByTestId('recognition-recipient').selectOption(selectedRecipientId);
   await page.getByLabel('Recognition type').selectOption('spot_award');
 
   const message = `Smoke recognition ${Date.now()}`;
@@ -1,6 +1,6 @@
 import React, { useState, useEffect, useMemo } from 'react';
 import { Link } from 'react-router-dom';
-import api from '../../lib/api';
+import api, { Page } from '../../lib/api';
 import toast from 'react-hot-toast';
 import { REGION_CONFIG, useAuth } from '../../contexts/AuthContext';
 import { useSettings } from '../../contexts/SettingsContext';
@@ -59,15 +59,14 @@ interface RecipientSummary {
   role?: string;
 }
 
-interface RecipientResponse {
-  recipients: RecipientSummary[];
-}
-
 interface PointsLedgerEntry {
   delta: number;
 }
 
 const GETTING_STARTED_DISMISS_KEY = 'getting-started-dismissed';
+// Wait for a pause in typing before searching for gift recipients
+const RECIPIENT_SEARCH_DEBOUNCE_MS = 300;
+const RECIPIENT_SEARCH_LIMIT = 20;
 
 const Dashboard: React.FC = () => {
   const { user, currency, region } = useAuth();
@@ -75,7 +74,9 @@ const Dashboard: React.FC = () => {
   const [recommendations, setRecommendations] = useState<Recommendations | null>(null);
   const [giftRecommendations, setGiftRecommendations] = useState<Reward[]>([]);
   const [giftRecipients, setGiftRecipients] = useState<RecipientSummary[]>([]);
+  const [giftRecipientQuery, setGiftRecipientQuery] = useState('');
   const [selectedRecipientId, setSelectedRecipientId] = useState('');
+  const [selectedGiftRecipient, setSelectedGiftRecipient] = useState<RecipientSummary | null>(null);
   const [giftBudgetMin, setGiftBudgetMin] = useState('25');
   const [giftBudgetMax, setGiftBudgetMax] = useState('100');
   const [giftLoading, setGiftLoading] = useState(false);
@@ -121,14 +122,50 @@ const Dashboard: React.FC = () => {
   }, [user]);
 
   useEffect(() => {
-    if (aiEnabled) {
-      void fetchGiftRecipients();
-    } else {
-      setGiftRecipients([]);
+    if (!aiEnabled) {
+      setGiftRecipientQuery('');
       setSelectedRecipientId('');
+      setSelectedGiftRecipient(null);
     }
   }, [aiEnabled]);
 
+  useEffect(() => {
+    const query = giftRecipientQuery.trim();
+    if (!aiEnabled || !query) {
+      setGiftRecipients([]);
+      return undefined;
+    }
+    let isActive = true;
+    const timer = window.setTimeout(() => {
+      api
+        .get<Page<RecipientSummary>>('/recognitions/recipients/search', {
+          params: { q: query, limit: RECIPIENT_SEARCH_LIMIT },
+        })
+        .then((response) => {
+          if (isActive) {
+            setGiftRecipients(response.data.items);
+          }
+        })
+        .catch((error) => {
+          if (isActive) {
+            console.error('Error searching gift recipients:', error);
+          }
+        });
+    }, RECIPIENT_SEARCH_DEBOUNCE_MS);
+    return () => {
+      isActive = false;
+      window.clearTimeout(timer);
+    };
+  }, [aiEnabled, giftRecipientQuery]);
+
+  // The chosen teammate stays listed while the search moves on
+  const giftRecipientOptions = useMemo(() => {
+    if (!selectedGiftRecipient || giftRecipients.some((recipient) => recipient.id === selectedGiftRecipient.id)) {
+      return giftRecipients;
+    }
+    return [selectedGiftRecipient, ...giftRecipients];
+  }, [giftRecipients, selectedGiftRecipient]);
+
   useEffect(() => {
     if (!loading) {
       void fetchRewards();
@@ -220,30 +257,15 @@ const Dashboard: React.FC = () => {
     }
   };
 
-  const fetchGiftRecipients = async () => {
-    try {
-      const response = await api.get<RecipientResponse>('/recognitions/recipients', {
-        params: user?.role === 'employee' ? { scope: 'global' } : undefined,
-      });
-      const recipients = response.data?.recipients ?? [];
-      setGiftRecipients(recipients);
-      if (recipients.length > 0) {
-        setSelectedRecipientId(recipients[0].id);
-      }
-    } catch (error) {
-      console.error('Error fetching gift recipients:', error);
-    }
-  };
-
   const fetchPointsStats = async () => {
     try {
       const [userRes, ledgerRes] = await Promise.all([
         api.get('/users/me'),
-        api.get<PointsLedgerEntry[]>('/points/ledger/me')
+        api.get<Page<PointsLedgerEntry>>('/points/ledger/me')
       ]);
       const pointsBalance = userRes.data?.points_balance ?? 0;
       const recognitions = userRes.data?.recognition_count ?? 0;
-      const ledgerEntries = ledgerRes.data ?? [];
+      const ledgerEntries = ledgerRes.data?.items ?? [];
       const earnedTotal = ledgerEntries.reduce(
         (sum, entry) => (entry.delta > 0 ? sum + entry.delta : sum),
         0
@@ -512,6 +534,21 @@ const Dashboard: React.FC = () => {
                   </p>
                 </div>
                 <div className="mt-4 grid gap-4">
+                  <div>
+                    <label className="text-sm font-medium text-slate-700" htmlFor="gift-recipient-search">
+                      Find a teammate
+                    </label>
+                    <input
+                      id="gift-recipient-search"
+                      type="search"
+                      data-testid="gift-recipient-search"
+                      value={giftRecipientQuery}
+                      onChange={(event) => setGiftRecipientQuery(event.target.value)}
+                      placeholder="Name, email or department"
+                      autoComplete="off"
+                      className="mt-1 w-full rounded-lg border border-slate-200 bg-white px-3 py-2 text-sm focus:border-blue-500 focus:outline-none focus:ring-1 focus:ring-blue-500"
+                    />
+                  </div>
                   <div>
                     <label className="text-sm font-medium text-slate-700" htmlFor="gift-recipient">
                       Recipient
@@ -520,11 +557,16 @@ const Dashboard: React.FC = () => {
                       id="gift-recipient"
                       data-testid="gift-recipient"
                       value={selectedRecipientId}
-                      onChange={(event) => setSelectedRecipientId(event.target.value)}
+                      onChange={(event) => {
+                        setSelectedRecipientId(event.target.value);
+                        setSelectedGiftRecipient(
+                          giftRecipientOptions.find((recipient) => recipient.id === event.target.value) ?? null
+                        );
+                      }}
                       className="mt-1 w-full rounded-lg border border-slate-200 bg-white px-3 py-2 text-sm focus:border-blue-500 focus:outline-none focus:ring-1 focus:ring-blue-500"
                     >
                       <option value="">Select a teammate</option>
-                      {giftRecipients.map((recipient) => (
+                      {giftRecipientOptions.map((recipient) => (
                         <option key={recipient.id} value={recipient.id}>
                           {recipient.first_name} {recipient.last_name}
                           {recipient.department ? ` · ${recipient.department}` : ''}
@@ -1,6 +1,5 @@
-import React, { useCallback, useEffect, useMemo, useState } from 'react';
-import { useAuth } from '../../contexts/AuthContext';
-import api from '../../lib/api';
+import React, { useCallback, useEffect, useRef, useState } from 'react';
+import api, { Page } from '../../lib/api';
 
 type RecognitionUserSummary = {
   id: string;
@@ -24,29 +23,38 @@ type RecognitionFeedEntry = {
 
 type RecognitionReaction = {
   emoji: string;
-  user_ids: string[];
+  count: number;
+  reacted_by_me: boolean;
 };
 
 type ReactionResponse = {
   reactions: RecognitionReaction[];
 };
 
+type StreamToken = {
+  token: string;
+  expires_in: number;
+};
+
+type ReactionUpdatedEvent = {
+  id: string;
+  emoji: string;
+  count: number;
+};
+
 const PAGE_SIZE = 10;
 const REACTION_EMOJIS = ['👍', '🎉', '🙌'];
+// Wait before asking for a new stream token once the stream was refused
+const STREAM_RETRY_MS = 5000;
 
 const RecognitionFeed: React.FC = () => {
-  const { user } = useAuth();
   const [feed, setFeed] = useState<RecognitionFeedEntry[]>([]);
   const [loading, setLoading] = useState(true);
   const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const [hasMore, setHasMore] = useState(true);
 
-  const lastCursor = useMemo(() => {
-    if (feed.length === 0) return undefined;
-    const lastEntry = feed[feed.length - 1];
-    return `${lastEntry.created_at}|${lastEntry.id}`;
-  }, [feed]);
+  const nextCursor = useRef<string | null>(null);
 
   const fetchFeed = useCallback(
     async (append: boolean) => {
@@ -59,13 +67,14 @@ const RecognitionFeed: React.FC = () => {
       setError(null);
       try {
         const params: Record<string, string | number> = { limit: PAGE_SIZE };
-        if (append && lastCursor) {
-          params.cursor = lastCursor;
+        if (append && nextCursor.current) {
+          params.cursor = nextCursor.current;
         }
-        const response = await api.get<RecognitionFeedEntry[]>('/recognitions/feed', { params });
-        const nextItems = response.data;
+        const response = await api.get<Page<RecognitionFeedEntry>>('/recognitions/feed', { params });
+        const nextItems = response.data.items;
+        nextCursor.current = response.data.next_cursor;
         setFeed((prev) => (append ? [...prev, ...nextItems] : nextItems));
-        setHasMore(nextItems.length === PAGE_SIZE);
+        setHasMore(Boolean(response.data.next_cursor));
       } catch (err: any) {
         setError(err.response?.data?.detail || 'Unable to load the company feed right now.');
       } finally {
@@ -73,13 +82,94 @@ const RecognitionFeed: React.FC = () => {
         setLoadingMore(false);
       }
     },
-    [lastCursor]
+    []
   );
 
   useEffect(() => {
     void fetchFeed(false);
   }, [fetchFeed]);
 
+  // Live updates. EventSource cannot send the auth headers, so each connection
+  // uses a short-lived token from /recognitions/stream-token in the URL.
+  useEffect(() => {
+    if (typeof EventSource === 'undefined') {
+      return undefined;
+    }
+    let source: EventSource | null = null;
+    let retryTimer: number | undefined;
+    let opened = false;
+    let stopped = false;
+
+    const applyReaction = (update: ReactionUpdatedEvent) => {
+      setFeed((prev) =>
+        prev.map((entry) => {
+          if (entry.id !== update.id) {
+            return entry;
+          }
+          const existing = entry.reactions.find((reaction) => reaction.emoji === update.emoji);
+          const reactions = existing
+            ? entry.reactions.map((reaction) =>
+                reaction.emoji === update.emoji ? { ...reaction, count: update.count } : reaction
+              )
+            : [...entry.reactions, { emoji: update.emoji, count: update.count, reacted_by_me: false }];
+          return { ...entry, reactions };
+        })
+      );
+    };
+
+    const connect = async () => {
+      let stream: EventSource;
+      try {
+        const response = await api.post<StreamToken>('/recognitions/stream-token');
+        if (stopped) {
+          return;
+        }
+        stream = new EventSource(
+          `${api.defaults.baseURL}/recognitions/stream?token=${encodeURIComponent(response.data.token)}`
+        );
+        source = stream;
+      } catch {
+        if (!stopped) {
+          retryTimer = window.setTimeout(() => void connect(), STREAM_RETRY_MS);
+        }
+        return;
+      }
+
+      stream.onopen = () => {
+        // Events published while we were disconnected are lost; refetch
+        if (opened) {
+          void fetchFeed(false);
+        }
+        opened = true;
+      };
+      stream.onerror = () => {
+        // The browser retries dropped connections itself; a refused one (such
+        // as an expired token) is closed and needs a new token
+        if (stream.readyState === EventSource.CLOSED && !stopped) {
+          stream.close();
+          retryTimer = window.setTimeout(() => void connect(), STREAM_RETRY_MS);
+        }
+      };
+      stream.addEventListener('recognition.created', (event) => {
+        const entry = JSON.parse((event as MessageEvent).data) as RecognitionFeedEntry;
+        setFeed((prev) => (prev.some((item) => item.id === entry.id) ? prev : [entry, ...prev]));
+      });
+      stream.addEventListener('reaction.updated', (event) => {
+        applyReaction(JSON.parse((event as MessageEvent).data) as ReactionUpdatedEvent);
+      });
+      stream.addEventListener('resync', () => {
+        void fetchFeed(false);
+      });
+    };
+
+    void connect();
+    return () => {
+      stopped = true;
+      window.clearTimeout(retryTimer);
+      source?.close();
+    };
+  }, [fetchFeed]);
+
   const handleToggleReaction = async (recognitionId: string, emoji: string) => {
     try {
       const response = await api.post<ReactionResponse>(`/recognitions/${recognitionId}/react`, { emoji });
@@ -124,8 +214,8 @@ const RecognitionFeed: React.FC = () => {
             const recipients = entry.to_users
               .map((recipient) => `${recipient.first_name} ${recipient.last_name}`)
               .join(', ');
-            const reactionsByEmoji = entry.reactions.reduce<Record<string, string[]>>((acc, reaction) => {
-              acc[reaction.emoji] = reaction.user_ids;
+            const reactionsByEmoji = entry.reactions.reduce<Record<string, RecognitionReaction>>((acc, reaction) => {
+              acc[reaction.emoji] = reaction;
               return acc;
             }, {});
             return (
@@ -160,8 +250,8 @@ const RecognitionFeed: React.FC = () => {
                     </p>
                     <div className="mt-4 flex flex-wrap gap-2">
                       {REACTION_EMOJIS.map((emoji) => {
-                        const userIds = reactionsByEmoji[emoji] || [];
-                        const hasReacted = user ? userIds.includes(user.id) : false;
+                        const reaction = reactionsByEmoji[emoji];
+                        const hasReacted = reaction?.reacted_by_me ?? false;
                         return (
                           <button
                             key={emoji}
@@ -174,7 +264,7 @@ const RecognitionFeed: React.FC = () => {
                             }`}
                           >
                             <span>{emoji}</span>
-                            <span>{userIds.length}</span>
+                            <span>{reaction?.count ?? 0}</span>
                           </button>
                         );
                       })}
@@ -1,5 +1,5 @@
 import React, { useCallback, useEffect, useState } from 'react';
-import api from '../../lib/api';
+import api, { Page } from '../../lib/api';
 import { useAuth } from '../../contexts/AuthContext';
 
 type RecognitionScope = 'peer' | 'report' | 'global';
@@ -64,8 +64,8 @@ const RecognitionHistory: React.FC<RecognitionHistoryProps> = ({ refreshToken, s
       if (typeFilter !== 'all') {
         params.recognition_type = typeFilter;
       }
-      const response = await api.get<RecognitionEntry[]>('/recognitions', { params });
-      setHistory(response.data);
+      const response = await api.get<Page<RecognitionEntry>>('/recognitions', { params });
+      setHistory(response.data.items);
     } catch (err: any) {
       setError(err.response?.data?.detail || 'Unable to load recognition history right now.');
     } finally {
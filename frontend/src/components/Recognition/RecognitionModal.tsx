@@ -1,5 +1,5 @@
 import React, { useEffect, useMemo, useRef, useState } from 'react';
-import api from '../../lib/api';
+import api, { Page } from '../../lib/api';
 import * as Dialog from '@radix-ui/react-dialog';
 import { useAuth, UserRole } from '../../contexts/AuthContext';
 import { useSettings } from '../../contexts/SettingsContext';
@@ -26,11 +26,6 @@ type RecipientSummary = {
   is_active?: boolean;
 };
 
-type RecipientResponse = {
-  recipients: RecipientSummary[];
-  emptyMessage?: string | null;
-};
-
 type RecipientEligibilityEntry = {
   user_id: string;
   points_eligible: boolean;
@@ -68,13 +63,28 @@ const VALUES_TAGS = [
 const PRIVILEGED_ROLES: UserRole[] = ['hr_admin', 'executive', 'c_level'];
 const MAX_RECIPIENTS = 5;
 const MAX_RECIPIENTS_ERROR = `Select up to ${MAX_RECIPIENTS} recipients.`;
+// Wait for a pause in typing before searching, so each keystroke is not a request
+const SEARCH_DEBOUNCE_MS = 300;
+const SEARCH_PAGE_SIZE = 20;
+
+const searchRecipients = async (query: string, cursor: string | null) => {
+  const response = await api.get<Page<RecipientSummary>>('/recognitions/recipients/search', {
+    params: { q: query, limit: SEARCH_PAGE_SIZE, ...(cursor ? { cursor } : {}) },
+  });
+  return response.data;
+};
 
 const RecognitionModal: React.FC<RecognitionModalProps> = ({ isOpen, onClose, onSuccess }) => {
   const { user, refreshUser } = useAuth();
   const { aiEnabled } = useSettings();
   const lastFocusedElement = useRef<HTMLElement | null>(null);
-  const [recipients, setRecipients] = useState<RecipientSummary[]>([]);
-  const [recipientsLoading, setRecipientsLoading] = useState(false);
+  const [recipientQuery, setRecipientQuery] = useState('');
+  const [matches, setMatches] = useState<RecipientSummary[]>([]);
+  const [matchesCursor, setMatchesCursor] = useState<string | null>(null);
+  const [searching, setSearching] = useState(false);
+  const [loadingMoreMatches, setLoadingMoreMatches] = useState(false);
+  // Selected teammates stay listed while the search moves on to other names
+  const [selectedDetails, setSelectedDetails] = useState<Record<string, RecipientSummary>>({});
   const [eligibilityMap, setEligibilityMap] = useState<Record<string, RecipientEligibilityEntry>>({});
   const [eligibilityLoading, setEligibilityLoading] = useState(false);
   const [submitting, setSubmitting] = useState(false);
@@ -99,7 +109,6 @@ const RecognitionModal: React.FC<RecognitionModalProps> = ({ isOpen, onClose, on
   useEffect(() => {
     if (isOpen) {
       lastFocusedElement.current = document.activeElement as HTMLElement | null;
-      void loadRecipients();
     } else {
       resetForm();
       if (lastFocusedElement.current && document.contains(lastFocusedElement.current)) {
@@ -110,7 +119,11 @@ const RecognitionModal: React.FC<RecognitionModalProps> = ({ isOpen, onClose, on
 
   const resetForm = () => {
     setMessage('');
+    setRecipientQuery('');
+    setMatches([]);
+    setMatchesCursor(null);
     setSelectedRecipients([]);
+    setSelectedDetails({});
     setRecognitionType(RECOGNITION_TYPES[0].value);
     setMessageTone('warm');
     setPoints(10);
@@ -119,27 +132,69 @@ const RecognitionModal: React.FC<RecognitionModalProps> = ({ isOpen, onClose, on
     setError(null);
   };
 
-  const loadRecipients = async () => {
-    setRecipientsLoading(true);
-    setError(null);
+  useEffect(() => {
+    const query = recipientQuery.trim();
+    if (!isOpen || !query) {
+      setMatches([]);
+      setMatchesCursor(null);
+      setSearching(false);
+      return undefined;
+    }
+    let isActive = true;
+    setSearching(true);
+    const timer = window.setTimeout(() => {
+      searchRecipients(query, null)
+        .then((page) => {
+          if (!isActive) {
+            return;
+          }
+          setMatches(page.items);
+          setMatchesCursor(page.next_cursor);
+        })
+        .catch((err: any) => {
+          if (!isActive) {
+            return;
+          }
+          setError(err.response?.data?.detail || 'Unable to search teammates. Please try again later.');
+        })
+        .finally(() => {
+          if (isActive) {
+            setSearching(false);
+          }
+        });
+    }, SEARCH_DEBOUNCE_MS);
+    return () => {
+      isActive = false;
+      window.clearTimeout(timer);
+    };
+  }, [isOpen, recipientQuery]);
+
+  const handleLoadMoreMatches = async () => {
+    if (!matchesCursor) {
+      return;
+    }
+    setLoadingMoreMatches(true);
     try {
-      const response = await api.get<RecipientResponse>('/recognitions/recipients', {
-        params: isEmployee ? { scope: 'global' } : undefined,
-      });
-      const loadedRecipients = response.data?.recipients ?? [];
-      const activeRecipients = loadedRecipients.filter((recipient) => recipient.is_active !== false);
-      setRecipients(activeRecipients);
-      setEligibilityMap({});
-      const defaultRecipient =
-        activeRecipients.find((recipient) => recipient.id !== user?.id) ?? activeRecipients[0];
-      setSelectedRecipients(defaultRecipient && defaultRecipient.id !== user?.id ? [defaultRecipient.id] : []);
+      const page = await searchRecipients(recipientQuery.trim(), matchesCursor);
+      setMatches((prev) => [...prev, ...page.items]);
+      setMatchesCursor(page.next_cursor);
     } catch (err: any) {
-      setError(err.response?.data?.detail || 'Unable to load recipients. Please try again later.');
+      setError(err.response?.data?.detail || 'Unable to search teammates. Please try again later.');
     } finally {
-      setRecipientsLoading(false);
+      setLoadingMoreMatches(false);
     }
   };
 
+  const recipientOptions = useMemo(() => {
+    const selected = selectedRecipients
+      .map((recipientId) => selectedDetails[recipientId])
+      .filter((recipient): recipient is RecipientSummary => Boolean(recipient));
+    const others = matches.filter(
+      (recipient) => recipient.is_active !== false && !selectedRecipients.includes(recipient.id)
+    );
+    return [...selected, ...others];
+  }, [matches, selectedDetails, selectedRecipients]);
+
   useEffect(() => {
     if (!selectedRecipients.length) {
       setEligibilityMap({});
@@ -181,15 +236,28 @@ const RecognitionModal: React.FC<RecognitionModalProps> = ({ isOpen, onClose, on
   const handleRecipientsChange = (event: React.ChangeEvent<HTMLSelectElement>) => {
     const selections = Array.from(event.target.selectedOptions).map((option) => option.value);
     const filteredSelections = selections.filter((value) => value && value !== user?.id);
+    const applySelection = (ids: string[]) => {
+      const optionsById = recipientOptions.reduce<Record<string, RecipientSummary>>((acc, recipient) => {
+        acc[recipient.id] = recipient;
+        return acc;
+      }, {});
+      setSelectedRecipients(ids);
+      setSelectedDetails(
+        ids.reduce<Record<string, RecipientSummary>>((acc, recipientId) => {
+          acc[recipientId] = optionsById[recipientId];
+          return acc;
+        }, {})
+      );
+    };
     if (filteredSelections.length > MAX_RECIPIENTS) {
       setError(MAX_RECIPIENTS_ERROR);
-      setSelectedRecipients(filteredSelections.slice(0, MAX_RECIPIENTS));
+      applySelection(filteredSelections.slice(0, MAX_RECIPIENTS));
       return;
     }
     if (error === MAX_RECIPIENTS_ERROR) {
       setError(null);
     }
-    setSelectedRecipients(filteredSelections);
+    applySelection(filteredSelections);
   };
 
   const handleSubmit = async (event: React.FormEvent) => {
@@ -335,14 +403,22 @@ const RecognitionModal: React.FC<RecognitionModalProps> = ({ isOpen, onClose, on
               </div>
             )}
 
-            {recipientsLoading ? (
-              <div className="flex items-center justify-center py-12">
-                <div className="h-10 w-10 animate-spin rounded-full border-4 border-blue-200 border-t-blue-600"></div>
-              </div>
-            ) : (
-              <form onSubmit={handleSubmit} className="space-y-6">
+            <form onSubmit={handleSubmit} className="space-y-6">
                 <section>
-                  <div className="flex items-center justify-between">
+                  <label className="block text-sm font-medium text-gray-700" htmlFor="recognition-recipient-search">
+                    Find teammates
+                  </label>
+                  <input
+                    id="recognition-recipient-search"
+                    type="search"
+                    value={recipientQuery}
+                    onChange={(event) => setRecipientQuery(event.target.value)}
+                    data-testid="recognition-recipient-search"
+                    placeholder="Name, email or department"
+                    autoComplete="off"
+                    className="mt-1 block w-full rounded-lg border border-gray-300 px-3 py-2 shadow-sm focus:border-blue-500 focus:outline-none focus:ring-1 focus:ring-blue-500"
+                  />
+                  <div className="mt-3 flex items-center justify-between">
                     <label className="block text-sm font-medium text-gray-700" htmlFor="recognition-recipient">
                       Choose recipients
                     </label>
@@ -354,14 +430,20 @@ const RecognitionModal: React.FC<RecognitionModalProps> = ({ isOpen, onClose, on
                     onChange={handleRecipientsChange}
                     data-testid="recognition-recipient"
                     className="mt-1 block w-full rounded-lg border border-gray-300 bg-white px-3 py-2 shadow-sm focus:border-blue-500 focus:outline-none focus:ring-1 focus:ring-blue-500"
-                    disabled={!recipients.length}
+                    disabled={!recipientOptions.length}
                     multiple
-                    size={Math.min(6, Math.max(3, recipients.length))}
+                    size={Math.min(6, Math.max(3, recipientOptions.length))}
                   >
                     <option value="" disabled>
-                      {recipients.length ? 'Select teammates' : 'No eligible teammates yet'}
+                      {searching
+                        ? 'Searching...'
+                        : recipientOptions.length
+                        ? 'Select teammates'
+                        : recipientQuery.trim()
+                        ? 'No matching teammates'
+                        : 'Search to find teammates'}
                     </option>
-                    {recipients.map((recipient) => {
+                    {recipientOptions.map((recipient) => {
                       const isSelf = recipient.id === user?.id;
                       return (
                         <option key={recipient.id} value={recipient.id} disabled={isSelf}>
@@ -372,6 +454,16 @@ const RecognitionModal: React.FC<RecognitionModalProps> = ({ isOpen, onClose, on
                       );
                     })}
                   </select>
+                  {matchesCursor && (
+                    <button
+                      type="button"
+                      onClick={() => void handleLoadMoreMatches()}
+                      disabled={loadingMoreMatches}
+                      className="mt-2 text-xs font-medium text-blue-600 hover:underline disabled:cursor-not-allowed disabled:text-gray-400"
+                    >
+                      {loadingMoreMatches ? 'Loading...' : 'Show more matches'}
+                    </button>
+                  )}
                   {eligibilityHint && (
                     <p className="mt-2 text-xs text-gray-500">{eligibilityHint}</p>
                   )}
@@ -380,7 +472,7 @@ const RecognitionModal: React.FC<RecognitionModalProps> = ({ isOpen, onClose, on
                       Employees can recognize anyone. Points may be limited by policy.
                     </p>
                   )}
-                  {!recipients.length && (
+                  {recipientQuery.trim() && !searching && !recipientOptions.length && (
                     <p className="mt-2 text-sm text-gray-500">
                       Need to recognise someone outside this list? Reach out to your manager or HR partner.
                     </p>
@@ -575,8 +667,7 @@ const RecognitionModal: React.FC<RecognitionModalProps> = ({ isOpen, onClose, on
                     Send recognition
                   </button>
                 </div>
-              </form>
-            )}
+            </form>
           </div>
         </Dialog.Content>
       </Dialog.Portal>
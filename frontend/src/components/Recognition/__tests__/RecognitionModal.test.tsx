@@ -39,6 +39,12 @@ afterEach(() => {
   jest.clearAllMocks();
 });
 
+const searchFor = async (user: ReturnType<typeof userEvent.setup>, query: string) => {
+  await user.type(screen.getByLabelText('Find teammates'), query);
+  await waitFor(() => expect(mockedAxios.get).toHaveBeenCalled());
+  await waitFor(() => expect(screen.getByLabelText('Choose recipients')).not.toBeDisabled());
+};
+
 const createAuthContextValue = (role: AuthContext.UserRole) => {
   const refreshUser = jest.fn().mockResolvedValue(undefined);
   return {
@@ -65,14 +71,15 @@ const createAuthContextValue = (role: AuthContext.UserRole) => {
   };
 };
 
-test('loads recipients and defaults to the first option', async () => {
+test('searches recipients once typing pauses', async () => {
   const authValue = createAuthContextValue('employee');
   mockedUseAuth.mockReturnValue(authValue);
   mockedUseSettings.mockReturnValue({ aiEnabled: false, loading: false });
 
   mockedAxios.get.mockResolvedValue({
     data: {
-      recipients: [
+      next_cursor: null,
+      items: [
         {
           id: 'peer-1',
           first_name: 'Pat',
@@ -93,6 +100,8 @@ test('loads recipients and defaults to the first option', async () => {
     return Promise.resolve({ data: {} });
   });
 
+  const user = userEvent.setup();
+
   render(
     <RecognitionModal
       isOpen
@@ -101,15 +110,19 @@ test('loads recipients and defaults to the first option', async () => {
     />
   );
 
-  await waitFor(() => expect(mockedAxios.get).toHaveBeenCalled());
+  expect(mockedAxios.get).not.toHaveBeenCalled();
+  await searchFor(user, 'pat');
 
+  expect(mockedAxios.get).toHaveBeenCalledTimes(1);
+  expect(mockedAxios.get).toHaveBeenCalledWith('/recognitions/recipients/search', {
+    params: { q: 'pat', limit: 20 },
+  });
   expect(screen.queryByRole('button', { name: /Peers/i })).not.toBeInTheDocument();
   expect(screen.queryByRole('button', { name: /Direct reports/i })).not.toBeInTheDocument();
   expect(screen.queryByRole('button', { name: /Company-wide/i })).not.toBeInTheDocument();
 
   const recipientSelect = screen.getByLabelText('Choose recipients') as HTMLSelectElement;
-  expect(recipientSelect.selectedOptions).toHaveLength(1);
-  expect(recipientSelect.selectedOptions[0].value).toBe('peer-1');
+  expect(recipientSelect.selectedOptions).toHaveLength(0);
   expect(screen.getByRole('option', { name: /Pat Peer/ })).toBeInTheDocument();
 });
 
@@ -120,7 +133,8 @@ test('filters inactive recipients and disables self selection', async () => {
 
   mockedAxios.get.mockResolvedValue({
     data: {
-      recipients: [
+      next_cursor: null,
+      items: [
         {
           id: 'current-user',
           first_name: 'Casey',
@@ -155,6 +169,8 @@ test('filters inactive recipients and disables self selection', async () => {
     return Promise.resolve({ data: {} });
   });
 
+  const user = userEvent.setup();
+
   render(
     <RecognitionModal
       isOpen
@@ -163,12 +179,13 @@ test('filters inactive recipients and disables self selection', async () => {
     />
   );
 
-  await waitFor(() => expect(mockedAxios.get).toHaveBeenCalled());
+  await searchFor(user, 'a');
 
   expect(screen.queryByRole('option', { name: /Ingrid Inactive/ })).not.toBeInTheDocument();
   const selfOption = screen.getByRole('option', { name: /Casey Current/ });
   expect(selfOption).toBeDisabled();
 
+  await user.selectOptions(screen.getByTestId('recognition-recipient'), ['active-1']);
   const recipientSelect = screen.getByLabelText('Choose recipients') as HTMLSelectElement;
   expect(recipientSelect.selectedOptions).toHaveLength(1);
   expect(recipientSelect.selectedOptions[0].value).toBe('active-1');
@@ -181,7 +198,8 @@ test('surfaces backend validation errors during submission', async () => {
 
   mockedAxios.get.mockResolvedValue({
     data: {
-      recipients: [
+      next_cursor: null,
+      items: [
         {
           id: 'global-1',
           first_name: 'Riley',
@@ -215,7 +233,8 @@ test('surfaces backend validation errors during submission', async () => {
     />
   );
 
-  await waitFor(() => expect(mockedAxios.get).toHaveBeenCalled());
+  await searchFor(user, 'riley');
+  await user.selectOptions(screen.getByTestId('recognition-recipient'), ['global-1']);
 
   const recipientSelect = screen.getByLabelText('Choose recipients') as HTMLSelectElement;
   expect(recipientSelect.selectedOptions).toHaveLength(1);
@@ -247,7 +266,8 @@ test('shows recognition-only helper text and keeps group labels non-selectable',
 
   mockedAxios.get.mockResolvedValue({
     data: {
-      recipients: [
+      next_cursor: null,
+      items: [
         {
           id: 'peer-1',
           first_name: 'Pat',
@@ -288,7 +308,7 @@ test('shows recognition-only helper text and keeps group labels non-selectable',
     />
   );
 
-  await waitFor(() => expect(mockedAxios.get).toHaveBeenCalled());
+  await searchFor(user, 'r');
 
   await user.selectOptions(screen.getByTestId('recognition-recipient'), ['peer-2']);
 
@@ -302,7 +322,8 @@ test('submits multiple recipients using to_user_ids', async () => {
 
   mockedAxios.get.mockResolvedValue({
     data: {
-      recipients: [
+      next_cursor: null,
+      items: [
         {
           id: 'global-1',
           first_name: 'Riley',
@@ -344,7 +365,7 @@ test('submits multiple recipients using to_user_ids', async () => {
     />
   );
 
-  await waitFor(() => expect(mockedAxios.get).toHaveBeenCalled());
+  await searchFor(user, 'r');
 
   await user.selectOptions(screen.getByTestId('recognition-recipient'), ['global-1', 'global-2']);
   await user.type(screen.getByLabelText('Appreciation message'), 'Great collaboration across the launch.');
@@ -369,7 +390,8 @@ test('submits recognition as private when show on feed is unchecked', async () =
 
   mockedAxios.get.mockResolvedValue({
     data: {
-      recipients: [
+      next_cursor: null,
+      items: [
         {
           id: 'peer-1',
           first_name: 'Pat',
@@ -399,7 +421,8 @@ test('submits recognition as private when show on feed is unchecked', async () =
     />
   );
 
-  await waitFor(() => expect(mockedAxios.get).toHaveBeenCalled());
+  await searchFor(user, 'pat');
+  await user.selectOptions(screen.getByTestId('recognition-recipient'), ['peer-1']);
 
   await user.type(screen.getByLabelText('Appreciation message'), 'Thanks for helping with the deployment.');
   await user.click(screen.getByRole('button', { name: 'Customer focus' }));
@@ -415,3 +438,41 @@ test('submits recognition as private when show on feed is unchecked', async () =
     })
   );
 });
+
+test('keeps selected recipients while searching for others', async () => {
+  const authValue = createAuthContextValue('employee');
+  mockedUseAuth.mockReturnValue(authValue);
+  mockedUseSettings.mockReturnValue({ aiEnabled: false, loading: false });
+
+  const people: Record<string, { id: string; first_name: string; last_name: string; role: string }> = {
+    pat: { id: 'peer-1', first_name: 'Pat', last_name: 'Peer', role: 'employee' },
+    rory: { id: 'peer-2', first_name: 'Rory', last_name: 'Recognition', role: 'employee' },
+  };
+  mockedAxios.get.mockImplementation((url, config) => {
+    const query = (config as { params: { q: string } }).params.q;
+    return Promise.resolve({ data: { items: people[query] ? [people[query]] : [], next_cursor: null } });
+  });
+  mockedAxios.post.mockResolvedValue({ data: [] });
+
+  const user = userEvent.setup();
+
+  render(
+    <RecognitionModal
+      isOpen
+      onClose={jest.fn()}
+      onSuccess={jest.fn()}
+    />
+  );
+
+  await searchFor(user, 'pat');
+  await user.selectOptions(screen.getByTestId('recognition-recipient'), ['peer-1']);
+
+  const search = screen.getByLabelText('Find teammates');
+  await user.clear(search);
+  await user.type(search, 'rory');
+  await waitFor(() => expect(screen.getByRole('option', { name: /Rory Recognition/ })).toBeInTheDocument());
+
+  const recipientSelect = screen.getByLabelText('Choose recipients') as HTMLSelectElement;
+  expect(screen.getByRole('option', { name: /Pat Peer/ })).toBeInTheDocument();
+  expect(Array.from(recipientSelect.selectedOptions).map((option) => option.value)).toEqual(['peer-1']);
+});
@@ -41,6 +41,13 @@ const normalizeError = (error: AxiosError) => {
   return Promise.reject(error);
 };
 
+// Envelope returned by cursor-paginated list endpoints; pass `next_cursor`
+// back as `cursor` to fetch the following page (null when there is none).
+export interface Page<T> {
+  items: T[];
+  next_cursor: string | null;
+}
+
 api.interceptors.request.use(attachAuthToken);
 api.interceptors.response.use((response) => response, normalizeError);
 
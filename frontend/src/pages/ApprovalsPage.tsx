@@ -1,5 +1,5 @@
 import React, { useEffect, useState } from 'react';
-import api from '../lib/api';
+import api, { Page } from '../lib/api';
 import { useAuth } from '../contexts/AuthContext';
 
 type UserSummary = {
@@ -19,19 +19,29 @@ type PendingRecognition = {
   to_user_snapshots?: UserSummary[];
 };
 
+type BulkDecisionResponse = {
+  results: { recognition_id: string; ok: boolean; detail?: string | null }[];
+  succeeded: number;
+  failed: number;
+};
+
+// Matches the server's BULK_DECISION_MAX_IDS default
+const BULK_DECISION_MAX_IDS = 100;
+
 const ApprovalsPage: React.FC = () => {
   const { user } = useAuth();
   const [items, setItems] = useState<PendingRecognition[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [actionId, setActionId] = useState<string | null>(null);
+  const [bulkAction, setBulkAction] = useState<'approve' | 'reject' | null>(null);
 
   const loadPending = async () => {
     setLoading(true);
     setError(null);
     try {
-      const response = await api.get<PendingRecognition[]>('/recognitions/pending');
-      setItems(response.data);
+      const response = await api.get<Page<PendingRecognition>>('/recognitions/pending');
+      setItems(response.data.items);
     } catch (err: any) {
       setError(err.response?.data?.detail || 'Unable to load approvals right now.');
     } finally {
@@ -55,6 +65,27 @@ const ApprovalsPage: React.FC = () => {
     }
   };
 
+  const handleBulkDecision = async (action: 'approve' | 'reject') => {
+    setBulkAction(action);
+    setError(null);
+    try {
+      const response = await api.post<BulkDecisionResponse>(`/recognitions/bulk-${action}`, {
+        recognition_ids: items.slice(0, BULK_DECISION_MAX_IDS).map((item) => item.id)
+      });
+      if (response.data.failed > 0) {
+        const reasons = Array.from(
+          new Set(response.data.results.filter((result) => !result.ok).map((result) => result.detail))
+        ).join(' ');
+        setError(`${response.data.failed} of ${response.data.results.length} could not be ${action}d. ${reasons}`);
+      }
+      await loadPending();
+    } catch (err: any) {
+      setError(err.response?.data?.detail || `Unable to ${action} recognitions.`);
+    } finally {
+      setBulkAction(null);
+    }
+  };
+
   if (user?.role !== 'hr_admin') {
     return (
       <div className="mx-auto max-w-5xl px-4 py-10 sm:px-6">
@@ -71,12 +102,28 @@ const ApprovalsPage: React.FC = () => {
           <h1 className="text-2xl font-semibold text-slate-900">Approvals</h1>
           <p className="text-sm text-slate-600">Review pending recognition awards before they are applied.</p>
         </div>
-        <button
-          onClick={() => loadPending()}
-          className="rounded-full border border-slate-200 bg-white px-4 py-2 text-sm font-medium text-slate-700 shadow-sm transition hover:border-blue-200 hover:bg-blue-50"
-        >
-          Refresh
-        </button>
+        <div className="flex gap-3">
+          <button
+            onClick={() => loadPending()}
+            className="rounded-full border border-slate-200 bg-white px-4 py-2 text-sm font-medium text-slate-700 shadow-sm transition hover:border-blue-200 hover:bg-blue-50"
+          >
+            Refresh
+          </button>
+          <button
+            onClick={() => handleBulkDecision('reject')}
+            disabled={items.length === 0 || bulkAction !== null}
+            className="rounded-full border border-rose-200 bg-white px-4 py-2 text-sm font-medium text-rose-700 shadow-sm transition hover:bg-rose-50 disabled:cursor-not-allowed disabled:opacity-60"
+          >
+            {bulkAction === 'reject' ? 'Rejecting...' : 'Reject all'}
+          </button>
+          <button
+            onClick={() => handleBulkDecision('approve')}
+            disabled={items.length === 0 || bulkAction !== null}
+            className="rounded-full border border-emerald-200 bg-emerald-600 px-4 py-2 text-sm font-medium text-white shadow-sm transition hover:bg-emerald-500 disabled:cursor-not-allowed disabled:opacity-60"
+          >
+            {bulkAction === 'approve' ? 'Approving...' : 'Approve all'}
+          </button>
+        </div>
       </div>
 
       {error && (
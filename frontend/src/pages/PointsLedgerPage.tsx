@@ -1,5 +1,5 @@
 import React, { useEffect, useState } from 'react';
-import api from '../lib/api';
+import api, { Page } from '../lib/api';
 
 interface PointsLedgerEntry {
   id: string;
@@ -21,8 +21,8 @@ const PointsLedgerPage: React.FC = () => {
       setError(null);
 
       try {
-        const response = await api.get<PointsLedgerEntry[]>('/points/ledger/me');
-        setEntries(response.data);
+        const response = await api.get<Page<PointsLedgerEntry>>('/points/ledger/me');
+        setEntries(response.data.items);
       } catch (err: any) {
         setError(err.response?.data?.detail || 'Unable to load points ledger right now.');
       } finally {